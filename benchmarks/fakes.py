@@ -0,0 +1,256 @@
+"""
+벤치마크용 가짜 객체 (네트워크, 임베딩 모델, LLM 대체)
+
+- FakeSession: http_client 공유 세션 자리에 들어가 URL별로 기록된 fixture를 돌려준다.
+- HashingEmbeddings: 단어 해시 기반의 작은 결정적 임베딩 (모델 로드 없음)
+- StubChatModel: 고정된 HTML/마크다운 응답을 돌려주는 LLM 대체
+- synthetic_listing / synthetic_news: 크기를 조절할 수 있는 합성 입력
+"""
+import os
+import re
+import random
+import hashlib
+import urllib.parse
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from langchain_core.embeddings import Embeddings
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+_WORDS = (
+    "반도체 메모리 실적 영업이익 매출 주가 외국인 순매수 목표주가 하향 상향 파운드리 공정 수율 고객사 "
+    "자사주 배당 주주환원 노사 임금 협상 스마트폰 출시 인공지능 데이터센터 서버 수요 공급 가격 환율 "
+    "증권가 분석 전망 투자 리스크 경쟁사 점유율 인수 합병 계약 협약 성장 감소 급등 급락 상승 하락"
+).split()
+
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def _random_word(rnd):
+    # 단어의 30%는 공통 어휘, 나머지는 임의의 한글 음절 조합 (기사 간 어휘가 적당히 겹치도록)
+    if rnd.random() < 0.3:
+        return rnd.choice(_WORDS)
+    return "".join(chr(0xAC00 + rnd.randrange(11172)) for _ in range(rnd.randint(2, 4)))
+
+
+def random_sentence(rnd, words=12):
+    return " ".join(_random_word(rnd) for _ in range(words)) + "."
+
+
+class FakeResponse:
+    def __init__(self, url, text, status_code=200):
+        self.url = url
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = status_code
+        self.encoding = "utf-8"
+        self.headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """
+    기록된 fixture로 응답하는 requests.Session 대체
+
+    - 네이버 뉴스 검색: 검색 기간과 start 값(페이지)마다 기사 절반은 제목/본문을 바꿔 새 기사로, 나머지는 그대로 두어
+      중복 제거가 실제와 비슷한 비율로 동작하도록 한다.
+    - 네이버 금융 종목 페이지: item_scale배만큼 보조 표를 덧붙여 페이지 크기를 조절한다.
+    - Fchart: 요청한 count만큼 최근 거래일들의 분봉을 fixture 값으로 채워 돌려준다.
+    """
+
+    def __init__(self, item_scale=1, sessions=None):
+        self.search_template = read_fixture("naver_search.html")
+        self.item_page = read_fixture("naver_item.html")
+        self.fchart_rows = re.findall(r'<item\s+data="([^"]*)"', read_fixture("fchart_minute.xml"))
+        self.item_scale = item_scale
+        self.sessions = sessions or []
+        self.requests = 0
+
+    def set_item_scale(self, item_scale):
+        self.item_scale = item_scale
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        self.requests += 1
+        parsed = urllib.parse.urlparse(url)
+        query = urllib.parse.parse_qs(parsed.query)
+
+        if parsed.hostname == "search.naver.com":
+            return FakeResponse(url, self._search_page(int(query.get("start", ["1"])[0]), query.get("nso", [""])[0]))
+        if parsed.hostname == "finance.naver.com":
+            return FakeResponse(url, self._item_page())
+        if parsed.hostname == "fchart.stock.naver.com":
+            return FakeResponse(url, self._fchart(int(query.get("count", ["78"])[0])))
+        return FakeResponse(url, "", status_code=404)
+
+    def _search_page(self, start, nso=""):
+        page = (start - 1) // 10
+        period = re.search(r"p:from(\d+)to(\d+)", nso)
+        rnd = random.Random(f"{period.group(0) if period else ''}|{page}")
+        html = self.search_template
+
+        def rewrite(match):
+            # 기사 절반은 페이지마다 다른 기사로 바꾸고, 절반은 앞 페이지와 같은 기사로 남김
+            if rnd.random() < 0.5:
+                return match.group(0)
+            title = random_sentence(rnd, 8)
+            content = " ".join(random_sentence(rnd) for _ in range(3))
+            link = f"https://news.example.com/{page}/{rnd.randrange(10 ** 9)}"
+            return (f'<a href="{link}" class="news_tit" target="_blank" title="{title}">{title}</a>\n'
+                    f'                <div class="news_dsc">\n'
+                    f'                  <div class="dsc_wrap"><a href="{link}" class="api_txt_lines dsc_txt_wrap">{content}</a></div>')
+
+        return re.sub(r'<a href="[^"]*" class="news_tit".*?<div class="dsc_wrap">.*?</a>', rewrite, html, flags=re.S)
+
+    def _item_page(self):
+        filler_row = "<tr><th scope=\"row\">거래량</th>" + "<td>12,345,678</td>" * 10 + "</tr>"
+        filler = (
+            '<div class="section invest_trend"><table class="tb_type1" summary="투자자별 매매동향">'
+            + filler_row * 20 + "</table></div>\n"
+        ) * max(0, self.item_scale - 1)
+        return self.item_page.replace("<!-- FILLER -->", filler)
+
+    def _fchart(self, count):
+        rows = []
+        for session in reversed(self.sessions):
+            stamp = session.strftime("%Y%m%d")
+            rows = [stamp + row[8:] for row in self.fchart_rows] + rows
+            if len(rows) >= count:
+                break
+        rows = rows[-count:]
+        items = "\n".join(f'\t\t<item data="{row}" />' for row in rows)
+        return f'<?xml version="1.0" encoding="EUC-KR" ?>\n<protocol>\n\t<chartdata count="{len(rows)}">\n{items}\n\t</chartdata>\n</protocol>\n'
+
+
+class HashingEmbeddings(Embeddings):
+    """단어 해시 bag-of-words 임베딩 (차원 dim, L2 정규화) - 벤치마크용 결정적 모델 대체"""
+
+    def __init__(self, dim=384):
+        self.dim = dim
+
+    def _embed(self, text):
+        vector = np.zeros(self.dim, dtype="float32")
+        for token in text.split():
+            digest = hashlib.md5(token.encode("utf-8")).digest()
+            vector[int.from_bytes(digest[:4], "little") % self.dim] += 1.0
+        norm = np.linalg.norm(vector)
+        return (vector / norm if norm else vector).tolist()
+
+    def embed_documents(self, texts):
+        return [self._embed(text) for text in texts]
+
+    def embed_query(self, text):
+        return self._embed(text)
+
+
+_STUB_ANALYSIS = """<div>
+    <h4 style="font-size: 21px; margin-bottom: 0;">최신 동향</h4>
+    <ol style="font-size: 14px; margin-top: 5px;">
+        <li>3분기 영업이익이 시장 기대치를 상회 (출처: <a href="https://www.yna.co.kr/" target="_blank">연합뉴스</a>)</li>
+        <li>HBM 품질 테스트 통과 기대감 (출처: <a href="https://www.mk.co.kr/" target="_blank">매일경제</a>)</li>
+    </ol>
+</div>"""
+
+_STUB_ANSWER = """## 최신 뉴스
+1. 3분기 실적이 개선되며 영업이익 성장률이 높아졌습니다.
+2. 외국인 매수 전환으로 주가가 상승했습니다.
+3. 파운드리 계약 협약 소식이 이어지고 있습니다.
+
+## 투자 전망
+현재 구간에서는 중립 의견이 우세하나 일부 증권사는 매수 추천을 유지합니다.
+
+## 리스크
+환율과 범용 메모리 가격 하락이 매출액과 순이익에 부담이 될 수 있어 매도 의견도 존재합니다.
+"""
+
+
+def stub_answer(repeat=1):
+    """enhance_llm_response 입력용 LLM 응답 (repeat배 길이)"""
+    return "\n".join(_STUB_ANSWER for _ in range(repeat))
+
+
+class StubChatModel:
+    """ChatOpenAI 대체 - predict/invoke 호출 시 고정 응답을 돌려주고 프롬프트 길이만 기록"""
+
+    def __init__(self, *args, **kwargs):
+        self.kwargs = kwargs
+        self.last_prompt_chars = 0
+
+    def predict(self, prompt, callbacks=None, **kwargs):
+        self.last_prompt_chars = len(prompt)
+        return _STUB_ANALYSIS
+
+    def invoke(self, prompt, **kwargs):
+        return self.predict(str(prompt))
+
+
+def synthetic_listing(size, seed=0):
+    """KRX 상장 목록 형식(Code, Name, Market 등)의 합성 DataFrame"""
+    rnd = random.Random(seed)
+    syllables = "가나다라마바사아자차카타파하삼성현대기아엘지에스케이한화롯데신세계포스코셀트리온카카오네이버"
+    suffixes = ["", "전자", "화학", "바이오", "홀딩스", "건설", "증권", "중공업", "에너지", "우"]
+    names = set()
+    while len(names) < size:
+        base = "".join(rnd.choice(syllables) for _ in range(rnd.randint(2, 4)))
+        names.add(base + rnd.choice(suffixes))
+    return pd.DataFrame({
+        "Code": [f"{i:06d}" for i in range(1, size + 1)],
+        "Name": sorted(names),
+        "Market": [rnd.choice(["KOSPI", "KOSDAQ"]) for _ in range(size)],
+        "Close": [rnd.randint(1000, 500000) for _ in range(size)],
+        "Marcap": [rnd.randint(10 ** 10, 10 ** 14) for _ in range(size)],
+    })
+
+
+def synthetic_news(size, seed=0, sentences=6):
+    """crawl_news 결과 형식({"title", "link", "content"})의 합성 기사 목록"""
+    rnd = random.Random(seed)
+    return [
+        {
+            "title": random_sentence(rnd, 8),
+            "link": f"https://news.example.com/{seed}/{i}",
+            "content": " ".join(random_sentence(rnd) for _ in range(sentences)),
+        }
+        for i in range(size)
+    ]
+
+
+def synthetic_stock_info():
+    """get_enhanced_stock_info 결과 형식의 재무 정보"""
+    return {
+        "current_price": "60,300원", "per": "14.55", "pbr": "1.09",
+        "year_high": "88,800원", "year_low": "49,900원", "market_cap_str": "359.97조원",
+        "dividend_yield": "2.41%", "debt_ratio": "26.36", "net_income": "344,513",
+    }
+
+
+def synthetic_daily_bars(days, seed=0):
+    """FinanceDataReader 일봉 형식(Date 열, Open/High/Low/Close/Volume)의 합성 데이터"""
+    rnd = random.Random(seed)
+    dates = pd.bdate_range(end=datetime(2024, 10, 17), periods=days)
+    close = 60000 + np.cumsum([rnd.choice([-500, 0, 500]) for _ in range(days)])
+    return pd.DataFrame({
+        "Date": dates,
+        "Open": close - 200, "High": close + 400, "Low": close - 400, "Close": close,
+        "Volume": [rnd.randint(10 ** 6, 3 * 10 ** 7) for _ in range(days)],
+    })
+
+
+def synthetic_minute_bars(days, seed=0):
+    """get_naver_fchart_minute_data 결과 형식(시간, 종가 등)의 합성 분봉"""
+    rnd = random.Random(seed)
+    times = []
+    start = datetime(2024, 10, 17) - timedelta(days=days - 1)
+    for day in range(days):
+        session = start + timedelta(days=day)
+        times += [session.replace(hour=9) + timedelta(minutes=m) for m in range(391)]
+    close = 60000 + np.cumsum([rnd.choice([-100, 0, 100]) for _ in range(len(times))])
+    return pd.DataFrame({"시간": pd.to_datetime(times), "종가": close,
+                         "거래량": [rnd.randint(10 ** 4, 10 ** 6) for _ in times]})
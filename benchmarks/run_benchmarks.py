@@ -0,0 +1,337 @@
+"""
+오프라인 벤치마크 (네트워크, 임베딩 모델, OpenAI 호출 없음)
+
+기록된 fixture(네이버 뉴스 검색, 네이버 금융 종목 페이지, Fchart 분봉)와 합성 KRX 상장 목록,
+해시 임베딩, 고정 응답 LLM으로 분석 흐름의 각 단계를 여러 입력 크기에서 측정하고 JSON으로 저장한다.
+
+측정값은 실행한 장비에 따라 달라지므로 기준 결과(baseline.json)는 저장소에 포함하지 않는다.
+이 스크립트는 현재 트리의 모듈(analysis_pipeline, dedup, article_store 등)을 직접 불러오므로
+이 벤치마크가 추가되기 전 커밋에서는 실행되지 않는다. 기준 결과는 벤치마크가 포함된 커밋끼리 비교할 때만 만든다.
+
+비교 절차 (같은 장비에서):
+    1. 측정하려는 변경을 적용하기 전 커밋에서 기준 결과 생성
+       python benchmarks/run_benchmarks.py --output benchmarks/baseline.json
+    2. 변경을 적용한 뒤 비교 (tolerance 배율보다 느려진 항목이 있으면 종료 코드 1)
+       python benchmarks/run_benchmarks.py --output /tmp/after.json --compare benchmarks/baseline.json
+
+사용 예:
+    python benchmarks/run_benchmarks.py --only crawl_news,get_text_chunks --repeat 10
+
+tiktoken cl100k_base 인코딩 파일은 미리 캐시되어 있어야 한다 (TIKTOKEN_CACHE_DIR).
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import tempfile
+import statistics
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCH_DIR)
+sys.path.insert(0, os.path.join(REPO_DIR, "stock_chatbot"))
+sys.path.insert(0, BENCH_DIR)
+
+# 📌 설정 모듈이 읽기 전에 모든 캐시/저장소를 임시 디렉터리로 돌리고 디스크 캐시는 끔
+_WORK_DIR = tempfile.mkdtemp(prefix="stock_chatbot_bench_")
+os.environ["STOCK_CHATBOT_CACHE_DIR"] = _WORK_DIR
+os.environ.setdefault("LOG_LEVEL", "WARNING")
+for _name in ("EMBEDDING_CACHE_ENABLED", "FUNDAMENTALS_CACHE_PERSIST", "ANALYSIS_CACHE_PERSIST", "EMBEDDING_WARMUP",
+              "NEWS_STORE_ENABLED", "LLM_CACHE_ENABLED"):
+    os.environ[_name] = "0"
+
+import fakes  # noqa: E402
+
+SIZES = {
+    "krx_listing.build": [1000, 3000, 10000],
+    "krx_listing.lookup": [1000, 3000, 10000],
+    "crawl_news": [1, 5, 20],
+    "crawl_news.incremental": [5, 20],
+    "crawl_news.sharded": [14, 30],
+    "get_stock_info_naver": [1, 4, 16],
+    "parse_fchart_xml": [78, 390, 1560, 7800],
+    "get_naver_fchart_minute_data": [1, 5, 20],
+    "get_text_chunks": [10, 50, 200],
+    "get_vectorstore": [10, 50, 200],
+    "get_vectorstore.ticker": [10, 50, 200],
+    "plot_stock_plotly": ["1day", "week", "1month", "1year"],
+    "enhance_llm_response": [1, 10, 100],
+    "generate_news_analysis": [10, 100],
+}
+
+
+# 📌 fixture 추출값 검증 (속도만 보다가 값이 바뀌는 회귀를 막기 위해 측정 전에 확인)
+# PER/PBR/BPS는 투자정보(per_table) 값이어야 한다 (기업실적분석 표의 과거 연도 값이 아님).
+EXPECTED_NAVER_ITEM = {
+    "현재가": "60,300원",
+    "PER": "14.55",
+    "PBR": "1.09",
+    "BPS": "55,951",
+    "배당수익률": "2.41%",
+    "52주 최고": "88,800원",
+    "52주 최저": "49,900원",
+    "시가총액": "3,599,748억원",
+}
+
+
+def check_fixtures():
+    """
+    기록된 fixture에서 추출한 값이 기대값과 같은지 확인하는 함수
+
+    Returns:
+        list: 기대값과 다른 항목 설명 목록 (모두 같으면 빈 목록)
+    """
+    from naver_finance import parse_naver_item_page
+
+    with open(os.path.join(fakes.FIXTURE_DIR, "naver_item.html"), "rb") as f:
+        parsed = parse_naver_item_page(f.read(), encoding="utf-8")
+    return [
+        f"naver_item.html {field}: 기대값 {expected!r}, 추출값 {parsed.get(field)!r}"
+        for field, expected in EXPECTED_NAVER_ITEM.items()
+        if parsed.get(field) != expected
+    ]
+
+
+def measure(func, setup=None, repeat=5, warmup=1):
+    """
+    func(setup())의 실행 시간을 repeat번 측정하는 함수 (setup 시간은 제외)
+
+    Returns:
+        dict: median_ms, min_ms, max_ms, repeat
+    """
+    samples = []
+    for i in range(warmup + repeat):
+        arg = setup() if setup else None
+        started = time.perf_counter()
+        func(arg)
+        elapsed = time.perf_counter() - started
+        if i >= warmup:
+            samples.append(elapsed * 1000)
+    return {
+        "median_ms": round(statistics.median(samples), 3),
+        "min_ms": round(min(samples), 3),
+        "max_ms": round(max(samples), 3),
+        "repeat": repeat,
+    }
+
+
+def build_cases():
+    """벤치마크 이름 → (크기 → (func, setup)) 생성 함수 목록"""
+    import http_client
+    import article_store
+    import price_store
+    import rag_process
+    import visualization
+    import main as app
+    import analysis_pipeline
+    import llm_cache
+    from krx_listing import KRXListingIndex
+    from news_crawler import crawl_news
+    from stock_data import parse_fchart_xml, get_naver_fchart_minute_data
+    from trading_calendar import recent_sessions
+
+    session = fakes.FakeSession(sessions=recent_sessions(25))
+    http_client._session = session
+
+    embeddings = fakes.HashingEmbeddings()
+    rag_process.get_cached_embeddings = lambda: embeddings
+    rag_process.get_embeddings = lambda: embeddings
+    llm_cache.ChatOpenAI = fakes.StubChatModel
+    visualization.st.plotly_chart = lambda *args, **kwargs: None
+
+    def krx_build(size):
+        listing = fakes.synthetic_listing(size)
+        return lambda _: KRXListingIndex(listing), None
+
+    def krx_lookup(size):
+        listing = fakes.synthetic_listing(size)
+        index = KRXListingIndex(listing)
+        names = listing["Name"].tolist()
+        queries = names[::max(1, size // 100)] + [name[1:3] for name in names[::max(1, size // 100)]] + ["없는회사"] * 10
+
+        def run(_):
+            index._partial_memo.clear()
+            for query in queries:
+                index.lookup(query)
+        return run, None
+
+    def crawl(pages):
+        return lambda _: crawl_news("삼성전자", 7, max_pages=pages), None
+
+    def crawl_sharded(days):
+        return lambda _: crawl_news("삼성전자", days, use_store=False), None
+
+    def crawl_incremental(pages):
+        def setup():
+            # 같은 기간을 한 번 수집해 둔 저장소에서 다시 수집 (마지막 수집 시각 이전 기사가 나오면 멈춤)
+            article_store._store = article_store.ArticleStore(os.path.join(tempfile.mkdtemp(dir=_WORK_DIR), "articles.sqlite3"))
+            crawl_news("삼성전자", 7, max_pages=pages, use_store=True)
+        return lambda _: crawl_news("삼성전자", 7, max_pages=pages, use_store=True), setup
+
+    def naver_item(scale):
+        def setup():
+            session.set_item_scale(scale)
+        return lambda _: analysis_pipeline.get_stock_info_naver("005930"), setup
+
+    def fchart_parse(count):
+        text = session._fchart(count)
+        return lambda _: parse_fchart_xml(text), None
+
+    def fchart_minute(days):
+        def setup():
+            # 매번 빈 분봉 저장소에서 시작 (요청 + 파싱 + 저장 전체 측정)
+            store_dir = tempfile.mkdtemp(dir=_WORK_DIR)
+            price_store.PRICE_STORE_DIR = store_dir
+        return lambda _: get_naver_fchart_minute_data("005930", days=days), setup
+
+    def text_chunks(size):
+        news = fakes.synthetic_news(size)
+        stock_info = fakes.synthetic_stock_info()
+        return lambda _: rag_process.get_text_chunks(news, [stock_info]), None
+
+    def vectorstore(size):
+        chunks = rag_process.get_text_chunks(fakes.synthetic_news(size), [fakes.synthetic_stock_info()])
+        return lambda _: rag_process.get_vectorstore(chunks), None
+
+    def vectorstore_ticker(size):
+        counter = iter(range(10 ** 6))
+
+        def setup():
+            # 기존 저장소(size개 기사)에 절반은 새 기사, 절반은 이미 저장된 기사를 증분 반영
+            import ticker_vectorstore
+            ticker_vectorstore.VECTORSTORE_DIR = tempfile.mkdtemp(dir=_WORK_DIR)
+            run = next(counter)
+            old_news = fakes.synthetic_news(size, seed=run * 2)
+            new_news = old_news[size // 2:] + fakes.synthetic_news(size // 2, seed=run * 2 + 1)
+            rag_process.get_vectorstore(rag_process.get_text_chunks(old_news, []), ticker_krx="005930", days=7)
+            return rag_process.get_text_chunks(new_news, [fakes.synthetic_stock_info()])
+        return lambda chunks: rag_process.get_vectorstore(chunks, ticker_krx="005930", days=7), setup
+
+    def plot(period):
+        if period in ("1day", "week"):
+            frame = fakes.synthetic_minute_bars(1 if period == "1day" else 5)
+        else:
+            frame = fakes.synthetic_daily_bars(22 if period == "1month" else 250)
+        return (lambda df: visualization.plot_stock_plotly(df, "삼성전자", period)), (lambda: frame.copy())
+
+    def enhance(repeat):
+        text = fakes.stub_answer(repeat)
+        return lambda _: app.enhance_llm_response(text), None
+
+    def news_analysis(size):
+        news = fakes.synthetic_news(size)
+        return lambda _: analysis_pipeline.generate_news_analysis("삼성전자", news, "sk-benchmark"), None
+
+    return {
+        "krx_listing.build": krx_build,
+        "krx_listing.lookup": krx_lookup,
+        "crawl_news": crawl,
+        "crawl_news.incremental": crawl_incremental,
+        "crawl_news.sharded": crawl_sharded,
+        "get_stock_info_naver": naver_item,
+        "parse_fchart_xml": fchart_parse,
+        "get_naver_fchart_minute_data": fchart_minute,
+        "get_text_chunks": text_chunks,
+        "get_vectorstore": vectorstore,
+        "get_vectorstore.ticker": vectorstore_ticker,
+        "plot_stock_plotly": plot,
+        "enhance_llm_response": enhance,
+        "generate_news_analysis": news_analysis,
+    }
+
+
+def compare(results, baseline, tolerance):
+    """
+    기준 결과와 비교해 느려진 항목을 출력하는 함수
+
+    Returns:
+        int: tolerance배 넘게 느려진 항목 수
+    """
+    regressions = 0
+    for name, by_size in results.items():
+        for size, stat in by_size.items():
+            base = baseline.get("results", {}).get(name, {}).get(size)
+            if not base or not base["median_ms"]:
+                continue
+            ratio = stat["median_ms"] / base["median_ms"]
+            flag = ""
+            if ratio > tolerance:
+                flag = "  ⚠️ 느려짐"
+                regressions += 1
+            elif ratio < 1 / tolerance:
+                flag = "  ✅ 빨라짐"
+            print(f"{name:32s} {size:>8s} {base['median_ms']:10.3f} → {stat['median_ms']:10.3f} ms  x{ratio:.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오프라인 분석 흐름 벤치마크")
+    parser.add_argument("--output", default=os.path.join(BENCH_DIR, "baseline.json"), help="결과 JSON 경로")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON 경로")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="느려짐으로 판단할 배율 (기본 1.25)")
+    parser.add_argument("--repeat", type=int, default=5, help="크기별 반복 측정 횟수")
+    parser.add_argument("--only", help="쉼표로 구분한 벤치마크 이름 (부분 일치)")
+    args = parser.parse_args(argv)
+
+    if args.compare and not os.path.exists(args.compare):
+        print(f"❌ 기준 결과가 없습니다: {args.compare}\n"
+              f"   비교 기준이 될 커밋에서 'python benchmarks/run_benchmarks.py --output {args.compare}'로 먼저 생성하세요.")
+        shutil.rmtree(_WORK_DIR, ignore_errors=True)
+        return 2
+
+    mismatches = check_fixtures()
+    if mismatches:
+        for mismatch in mismatches:
+            print(f"❌ {mismatch}")
+        shutil.rmtree(_WORK_DIR, ignore_errors=True)
+        return 2
+
+    selected = [name.strip() for name in args.only.split(",")] if args.only else None
+    cases = build_cases()
+    results = {}
+
+    try:
+        for name, factory in cases.items():
+            if selected and not any(pattern in name for pattern in selected):
+                continue
+            results[name] = {}
+            for size in SIZES[name]:
+                func, setup = factory(size)
+                stat = measure(func, setup, repeat=args.repeat)
+                results[name][str(size)] = stat
+                print(f"{name:32s} {str(size):>8s} median {stat['median_ms']:10.3f} ms  "
+                      f"(min {stat['min_ms']:.3f}, max {stat['max_ms']:.3f})")
+    finally:
+        shutil.rmtree(_WORK_DIR, ignore_errors=True)
+
+    report = {
+        "meta": {
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+            "cpu_count": os.cpu_count(),
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print()
+        regressions = compare(results, baseline, args.tolerance)
+    else:
+        regressions = 0
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {args.output}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+import time
+
+from cache import TTLCache
+from config import ANALYSIS_CACHE_BUCKET_SECONDS, ANALYSIS_CACHE_MAX_ENTRIES, ANALYSIS_CACHE_PERSIST
+
+
+class SharedAnalysis:
+    """
+    여러 사용자 세션이 함께 쓰는 분석 결과 (뉴스, 재무 정보, 벡터 저장소)
+
+    LLM 요약과 대화 메모리는 포함하지 않는다 - 요청한 사용자의 API 키로 세션마다 따로 생성하며,
+    요약 실패 시의 오류 HTML이 다른 세션에 공유되지 않는다.
+
+    디스크에 저장할 때는 벡터 저장소를 빼고 저장하고,
+    다시 읽을 때 종목별 벡터 저장소(ticker_vectorstore)에서 불러온다.
+    """
+
+    def __init__(self, ticker_krx, days, news_data, stock_info, vectorstore, timings=None):
+        self.ticker_krx = ticker_krx
+        self.days = days
+        self.news_data = news_data
+        self.stock_info = stock_info
+        self.vectorstore = vectorstore
+        self.timings = timings or {}
+        self.created_at = time.time()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["vectorstore"] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.vectorstore is None:
+            from rag_process import get_cached_embeddings
+            from ticker_vectorstore import load_ticker_vectorstore
+            self.vectorstore = load_ticker_vectorstore(self.ticker_krx, get_cached_embeddings())
+
+
+_analysis_cache = TTLCache("analysis", ANALYSIS_CACHE_MAX_ENTRIES, persist=ANALYSIS_CACHE_PERSIST)
+
+
+def analysis_key(ticker_krx, days, now=None):
+    """
+    공유 분석 캐시 키 (정규화된 종목코드, 기간, 시간 구간)
+
+    Args:
+        ticker_krx (str): 한국 주식 코드
+        days (int): 뉴스 검색 기간 (일)
+        now (float): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        tuple: 캐시 키
+    """
+    now = time.time() if now is None else now
+    return str(ticker_krx).strip().zfill(6), int(days), int(now // ANALYSIS_CACHE_BUCKET_SECONDS)
+
+
+def _bucket_remaining(now=None):
+    """현재 시간 구간이 끝날 때까지 남은 시간 (초)"""
+    now = time.time() if now is None else now
+    return ANALYSIS_CACHE_BUCKET_SECONDS - now % ANALYSIS_CACHE_BUCKET_SECONDS
+
+
+def get_shared_analysis(ticker_krx, days, compute):
+    """
+    같은 종목/기간/시간 구간의 분석 결과를 세션 간에 공유하는 함수
+    캐시에 없으면 compute()로 계산하며, 동시에 들어온 같은 요청은 한 번의 계산 결과를 기다린다.
+
+    Args:
+        ticker_krx (str): 한국 주식 코드
+        days (int): 뉴스 검색 기간 (일)
+        compute (callable): SharedAnalysis를 반환하는 함수 (인자 없음, 예외는 그대로 전달되고 캐시되지 않음)
+
+    Returns:
+        tuple: (SharedAnalysis 또는 None (compute()가 None을 반환한 경우), 캐시 적중 여부)
+    """
+    computed = []
+
+    def loader():
+        computed.append(True)
+        return compute()
+
+    analysis = _analysis_cache.get_or_set(
+        analysis_key(ticker_krx, days),
+        loader,
+        ttl=lambda result: _bucket_remaining(),
+        should_cache=lambda result: result is not None and result.vectorstore is not None
+    )
+    if not computed and analysis.vectorstore is None:
+        # 디스크에서 읽었지만 종목별 벡터 저장소가 사라진 경우 다시 계산
+        # (방금 계산한 결과가 캐시되지 않은 경우에는 다시 계산하지 않음)
+        computed.append(True)
+        analysis = compute()
+        if analysis is not None and analysis.vectorstore is not None:
+            _analysis_cache.set(analysis_key(ticker_krx, days), analysis, _bucket_remaining())
+    return analysis, not computed
+
+
+def clear_shared_analyses():
+    """공유 분석 캐시 비우기"""
+    _analysis_cache.clear()
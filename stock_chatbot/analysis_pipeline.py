@@ -0,0 +1,656 @@
+"""
+분석 파이프라인 (뉴스 수집 → 재무 정보 → 청크 → 벡터 저장소 → 요약)
+
+Streamlit 앱(main.py)과 일괄 분석 CLI(batch_analyze.py)가 함께 사용하며,
+작업 프로세스에서도 import할 수 있도록 Streamlit에 의존하지 않는다.
+"""
+import time
+import logging
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+
+import yfinance as yf
+
+from news_crawler import crawl_news
+from article_body import fetch_article_bodies
+from rag_process import get_text_chunks, get_vectorstore, StreamingTokenHandler
+from stock_data import get_ticker, get_daily_ohlcv
+from trading_calendar import is_market_open, seconds_until_market_open
+from krx_listing import get_listing_index
+from pipeline import Stage, PipelineAbort
+from http_client import get_session
+from naver_finance import parse_naver_item_page
+from cache import TTLCache
+from llm_cache import create_chat_llm
+from instrumentation import timed, timed_function
+from config import (HTTP_TIMEOUT, FUNDAMENTALS_SOURCE_TIMEOUT, FUNDAMENTALS_MAX_WORKERS,
+                    FUNDAMENTALS_TTL_MARKET_OPEN, FUNDAMENTALS_TTL_MARKET_CLOSED_MAX, FUNDAMENTALS_CACHE_PERSIST)
+
+logger = logging.getLogger(__name__)
+
+
+def build_analysis_stages(company_name, standardized_name, ticker_krx, days, openai_api_key, on_summary_token=None):
+    """
+    "분석 시작" 흐름을 의존 관계가 있는 단계 목록으로 구성하는 함수
+    뉴스 수집과 재무 정보 조회, 벡터 저장소 구축과 요약 LLM 호출은 서로 독립적이므로 동시에 실행된다.
+    대화 체인은 세션마다 따로 만들어야 하므로 단계에 포함하지 않는다.
+
+    Args:
+        company_name (str): 사용자가 입력한 기업명
+        standardized_name (str): 표준화된 기업명 (요약 표시용)
+        ticker_krx (str): 한국 주식 코드
+        days (int): 뉴스 검색 기간 (일)
+        openai_api_key (str): OpenAI API 키
+        on_summary_token (callable): 요약 토큰 스트리밍 콜백 (선택)
+
+    Returns:
+        list: Stage 목록
+    """
+
+    def crawl_stage():
+        news_data = crawl_news(company_name, days, ticker=ticker_krx)
+        if not news_data:
+            raise PipelineAbort("해당 기업의 최근 뉴스를 찾을 수 없습니다.")
+        return news_data
+
+    def news_analysis_stage(news):
+        # 요약 LLM 호출 실패는 요약 영역에만 오류로 표시 (분석 전체는 계속 진행)
+        try:
+            return generate_news_analysis(standardized_name, news, openai_api_key, on_token=on_summary_token)
+        except Exception as e:
+            return e
+
+    return [
+        Stage("news", crawl_stage, label="뉴스 수집"),
+        Stage("fundamentals", lambda: get_cached_stock_info(ticker_krx), label="재무 정보 수집"),
+        Stage("bodies", fetch_article_bodies, deps=("news",), label="기사 본문 수집"),
+        Stage("chunks", lambda bodies, fundamentals: get_text_chunks(bodies, [fundamentals]),
+              deps=("bodies", "fundamentals"), label="텍스트 청크 생성"),
+        Stage("vectorstore", lambda chunks: get_vectorstore(chunks, ticker_krx=ticker_krx, days=days),
+              deps=("chunks",), label="벡터 저장소 구축"),
+        Stage("news_analysis", news_analysis_stage, deps=("news",), label="뉴스 분석 (GPT-4)"),
+        Stage("summary",
+              lambda news, fundamentals, news_analysis: generate_company_summary(
+                  standardized_name, news, openai_api_key,
+                  ticker_krx=ticker_krx, stock_info=fundamentals, news_analysis=news_analysis),
+              deps=("news", "fundamentals", "news_analysis"), label="기업 정보 요약"),
+    ]
+
+
+def generate_news_analysis(company_name, news_data, openai_api_key, on_token=None):
+    """
+    최근 뉴스(최대 10개)를 GPT-4로 통합 분석하여 HTML 조각을 생성하는 함수
+
+    Args:
+        company_name (str): 기업명
+        news_data (list): 뉴스 데이터 목록
+        openai_api_key (str): OpenAI API 키
+        on_token (callable): 토큰 스트리밍 콜백 (선택)
+
+    Returns:
+        str: 뉴스 분석 HTML
+    """
+    # 뉴스 요약 생성
+    # temperature 0 호출이므로 같은 뉴스 목록이면 디스크 응답 캐시에서 바로 반환 (API 호출 없음)
+    llm = create_chat_llm(openai_api_key, model_name='gpt-4', temperature=0, streaming=on_token is not None)
+
+    # 모든 뉴스 통합 후 전체 요약 요청
+    all_news_text = "\n\n".join(
+        [f"제목: {news['title']}\n내용: {news['content']}\n출처: {news['link']}" for news in news_data[:10]])
+
+    prompt = f"""
+    {company_name}에 관한 다음 뉴스들을 통합 분석하여 투자자에게 유용한 정보를 제공해주세요:
+
+    {all_news_text}
+
+    HTML 형식으로 응답해주세요:
+    <div>
+        <h4 style="font-size: 21px; margin-bottom: 0;">최신 동향</h4>
+        <ol style="font-size: 14px; margin-top: 5px;">
+            <li>[동향 내용 1] (출처: <a href="뉴스링크" target="_blank">출처명</a>)</li>
+            <li>[동향 내용 2] (출처: <a href="뉴스링크" target="_blank">출처명</a>)</li>
+            <!-- 4-7개 항목 -->
+        </ol>
+
+        <h4 style="font-size: 21px; margin-top: 1.5em; margin-bottom: 0;">투자 영향 요인</h4>
+        <div style="font-size: 14px; margin-top: 5px;">
+            <h5 style="color: green; font-size: 17px; margin-bottom: 0;">✅ 긍정적 요인</h5>
+            <ul style="margin-top: 5px;">
+                <li>[긍정적 요인 1]</li>
+                <!-- 2-3개 항목 -->
+            </ul>
+
+            <h5 style="color: red; font-size: 17px; margin-bottom: 0;">⚠️ 부정적 요인</h5>
+            <ul style="margin-top: 5px;">
+                <li>[부정적 요인 1]</li>
+                <!-- 2-3개 항목 -->
+            </ul>
+        </div>
+
+        <h4 style="font-size: 21px; margin-top: 1.5em; margin-bottom: 0;">💹 투자 전망 및 조언</h4>
+        <p style="font-size: 14px; margin-top: 5px;">[투자 전망 및 조언 내용]</p>
+    </div>
+    """
+    # on_token이 주어지면 토큰 단위로 진행 상황 전달
+    callbacks = [StreamingTokenHandler(on_token)] if on_token else None
+    with timed("llm.news_analysis"):
+        return llm.predict(prompt, callbacks=callbacks)
+
+
+def generate_company_summary(company_name, news_data, openai_api_key, on_token=None,
+                             ticker_krx=None, stock_info=None, news_analysis=None):
+    """
+    기업 정보 요약 HTML을 생성하는 함수
+    분석 파이프라인에서 이미 구한 티커, 재무 정보, 뉴스 분석 결과를 넘기면 다시 조회하지 않는다.
+
+    Args:
+        company_name (str): 기업명
+        news_data (list): 뉴스 데이터 목록
+        openai_api_key (str): OpenAI API 키
+        on_token (callable): 뉴스 분석 토큰 스트리밍 콜백 (선택)
+        ticker_krx (str): 한국 주식 코드 (선택)
+        stock_info (dict): 통합 주식 정보 (선택)
+        news_analysis (str): 뉴스 분석 HTML (선택, 실패한 경우 예외 객체)
+
+    Returns:
+        str: 요약 HTML
+    """
+    try:
+        # 기업 정보 수집
+        ticker_krx = ticker_krx or get_ticker(company_name, source="fdr")
+        if not ticker_krx:
+            return f"## {company_name}에 대한 정보를 찾을 수 없습니다."
+
+        # 재무 정보 캐시 사용 (분석 단계에서 이미 수집한 값 재사용)
+        if stock_info is None:
+            stock_info = get_cached_stock_info(ticker_krx)
+
+        # 단위를 추가하기 위한 헬퍼 함수들
+        def add_percent_if_needed(value):
+            """비율 값에 퍼센트 단위가 없으면 추가"""
+            if value == '정보 없음' or value == 'N/A':
+                return value
+
+            # 이미 % 기호가 포함되어 있는지 확인
+            if '%' not in value:
+                # 숫자만 추출
+                import re
+                num_match = re.search(r'[\d,.]+', value)
+                if num_match:
+                    num_str = num_match.group()
+                    try:
+                        # 콤마 제거 후 숫자로 변환
+                        num = float(num_str.replace(',', ''))
+                        return f"{num:.2f}%"
+                    except:
+                        return f"{value}%"
+                else:
+                    return f"{value}%"
+            return value
+
+        def add_won_if_needed(value):
+            """BPS와 같은 값에 원 단위가 없으면 추가"""
+            if value == '정보 없음' or value == 'N/A':
+                return value
+
+            # 이미 '원' 문자가 포함되어 있는지 확인
+            if '원' not in value:
+                # 숫자 형식인지 확인
+                import re
+                num_match = re.search(r'[\d,.]+', value)
+                if num_match:
+                    num_str = num_match.group()
+                    try:
+                        # 콤마 제거 후 숫자로 변환
+                        num = float(num_str.replace(',', ''))
+                        # 천 단위 콤마를 추가한 형식으로 반환
+                        return f"{int(num):,}원"
+                    except:
+                        return f"{value}원"
+                else:
+                    return f"{value}원"
+            return value
+
+        def format_currency_value(value):
+            """당기순이익과 같은 큰 금액에 적절한 단위(억원, 조원) 추가"""
+            if value == '정보 없음' or value == 'N/A':
+                return value
+
+            # 이미 단위가 포함되어 있는지 확인
+            if '억원' in value or '조원' in value or '만원' in value:
+                return value
+
+            # 숫자만 추출
+            import re
+            num_match = re.search(r'[\d,.]+', value)
+            if not num_match:
+                return value
+
+            num_str = num_match.group()
+            try:
+                # 콤마 제거 후 숫자로 변환
+                num = float(num_str.replace(',', ''))
+
+                # 크기에 따라 적절한 단위 적용
+                if abs(num) >= 1_0000_0000_0000:  # 1조 이상
+                    return f"{num / 1_0000_0000_0000:.2f}조원"
+                elif abs(num) >= 1_0000_0000:  # 1억 이상
+                    return f"{num / 1_0000_0000:.2f}억원"
+                else:
+                    return f"{int(num):,}원"
+            except:
+                return f"{value}원"
+
+        # 뉴스 요약 생성 (파이프라인에서 먼저 생성한 결과가 있으면 재사용)
+        if isinstance(news_analysis, Exception):
+            raise news_analysis
+        if news_analysis is None:
+            news_analysis = generate_news_analysis(company_name, news_data, openai_api_key, on_token=on_token)
+
+        # 새로운 HTML 템플릿으로 업데이트 (추가 정보 포함)
+        summary_html = f"""
+        <div style="font-family: Arial, sans-serif; padding: 20px;">
+            <h2 style="color: #1f77b4; margin-bottom: 30px;">📊 {company_name} ({ticker_krx}) 투자 분석</h2>
+
+            <h3 style="color: #2c3e50; margin-top: 25px; margin-bottom: 15px;">🏢 기업 정보 요약</h3>
+
+            <table style="width: 100%; border-collapse: collapse; margin-bottom: 50px;">
+                <tr style="background-color: #f8f9fa;">
+                    <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">항목</th>
+                    <th style="padding: 10px; border: 1px solid #ddd; text-align: left;">정보</th>
+                </tr>
+                <tr>
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>현재 주가</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{stock_info['current_price']} {stock_info['price_change_str']}</td>
+                </tr>
+                <tr style="background-color: #f8f9fa;">
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>52주 최고/최저</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{stock_info['year_high']} / {stock_info['year_low']}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>시가총액</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{stock_info['market_cap_str']}</td>
+                </tr>
+                <tr style="background-color: #f8f9fa;">
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>PER (주가수익비율)</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{add_percent_if_needed(stock_info['per'])}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>PBR (주가순자산비율)</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{add_percent_if_needed(stock_info['pbr'])}</td>
+                </tr>
+                <tr style="background-color: #f8f9fa;">
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>배당수익률</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{stock_info['dividend_yield']}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>BPS (주당순자산)</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{add_won_if_needed(stock_info['bps'])}</td>
+                </tr>
+                <tr style="background-color: #f8f9fa;">
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>부채비율</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{add_percent_if_needed(stock_info['debt_ratio'])}</td>
+                </tr>
+                <tr>
+                    <td style="padding: 10px; border: 1px solid #ddd;"><strong>당기순이익</strong></td>
+                    <td style="padding: 10px; border: 1px solid #ddd;">{format_currency_value(stock_info['net_income'])}</td>
+                </tr>
+            </table>
+
+            <h3 style="color: #2c3e50; margin-top: 25px; margin-bottom: 15px;">📰 최신 뉴스 및 분석</h3>
+
+            <div style="line-height: 1.6;">
+                {news_analysis.replace('\n', '').replace('<h4>', '<h4 style="font-size: 21px; margin-bottom: 0;">').replace('<h5', '<h5 style="font-size: 14px; margin-bottom: 0;"').replace('<p>', '<p style="font-size: 14px; margin-top: 5px;">').replace('<li>', '<li style="font-size: 14px;">').replace('</ol>', '</ol><br><br>').replace('</ul>', '</ul><br><br>').replace('</p>', '</p><br><br>')}
+            </div>
+        </div>
+        """
+
+        return summary_html
+    except Exception as e:
+        return f"<div style='color: red;'><h2>⚠️ {company_name} 정보 분석 중 오류가 발생했습니다:</h2> <p>{str(e)}</p></div>"
+
+
+# 종목코드별 재무 정보 캐시 (세션 간 공유)
+_fundamentals_cache = TTLCache("fundamentals", maxsize=512, persist=FUNDAMENTALS_CACHE_PERSIST)
+
+
+def _fundamentals_ttl(_stock_info):
+    """재무 정보 유효 시간 - 장중에는 짧게, 장 마감 후에는 다음 개장 시각까지"""
+    if is_market_open():
+        return FUNDAMENTALS_TTL_MARKET_OPEN
+    return max(FUNDAMENTALS_TTL_MARKET_OPEN, min(seconds_until_market_open(), FUNDAMENTALS_TTL_MARKET_CLOSED_MAX))
+
+
+def _has_fundamentals(stock_info):
+    """모든 항목이 비어 있는 결과(전체 조회 실패)는 캐시하지 않음"""
+    return any(value not in ('정보 없음', '') for value in stock_info.values())
+
+
+def get_cached_stock_info(ticker_krx):
+    """
+    종목코드로 통합 주식 정보를 조회하는 함수 (TTL 캐시 사용)
+    분석 단계와 요약 단계가 같은 결과를 공유하므로 외부 소스를 한 번만 조회한다.
+
+    Args:
+        ticker_krx (str): 한국 주식 코드 (예: '005930')
+
+    Returns:
+        dict: 통합된 주식 정보 딕셔너리
+    """
+    stock_info = _fundamentals_cache.get_or_set(
+        ticker_krx,
+        lambda: get_enhanced_stock_info(ticker_krx + ".KS", ticker_krx),
+        ttl=_fundamentals_ttl,
+        should_cache=_has_fundamentals
+    )
+    return dict(stock_info)
+
+
+# 재무 정보 소스 동시 조회용 스레드 풀 (느린 소스가 있어도 호출자는 기다리지 않도록 전역으로 유지)
+_fundamentals_executor = ThreadPoolExecutor(max_workers=FUNDAMENTALS_MAX_WORKERS, thread_name_prefix="fundamentals")
+
+
+def fetch_fundamental_sources(ticker_yahoo, ticker_krx, timeout=FUNDAMENTALS_SOURCE_TIMEOUT):
+    """
+    yfinance, FinanceDataReader, 네이버 금융을 동시에 조회하는 함수
+    제한 시간 안에 끝나지 않거나 실패한 소스는 None으로 반환하여 해당 항목만 비워둔다.
+
+    Args:
+        ticker_yahoo (str): Yahoo Finance 티커 코드
+        ticker_krx (str): 한국 주식 코드
+        timeout (float): 소스별 제한 시간 (초, 모든 소스가 동시에 시작하므로 전체 대기 시간도 동일)
+
+    Returns:
+        dict: {"yfinance": dict 또는 None, "fdr": dict 또는 None, "naver": dict 또는 None}
+    """
+    futures = {
+        "yfinance": _fundamentals_executor.submit(timed_function("fundamentals.yfinance")(lambda: yf.Ticker(ticker_yahoo).info)),
+        "fdr": _fundamentals_executor.submit(timed_function("fundamentals.fdr")(get_fdr_stock_info), ticker_krx),
+        "naver": _fundamentals_executor.submit(timed_function("fundamentals.naver")(get_stock_info_naver), ticker_krx),
+    }
+
+    deadline = time.monotonic() + timeout
+    results = {}
+    for source, future in futures.items():
+        try:
+            results[source] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeoutError:
+            logger.warning("%s 조회 시간 초과 (%s초)", source, timeout)
+            results[source] = None
+        except Exception as e:
+            logger.warning("%s 조회 오류: %s", source, e)
+            results[source] = None
+
+    return results
+
+
+# 향상된 주식 정보 수집 함수 (여러 소스에서 정보 통합)
+def get_enhanced_stock_info(ticker_yahoo, ticker_krx):
+    """
+    여러 소스(yfinance, FinanceDataReader, 네이버 금융)에서 주식 정보를 수집하여 통합하는 함수
+
+    Args:
+        ticker_yahoo (str): Yahoo Finance 티커 코드 (예: '005930.KS')
+        ticker_krx (str): 한국 주식 코드 (예: '005930')
+
+    Returns:
+        dict: 통합된 주식 정보 딕셔너리
+    """
+    stock_info = {}
+
+    try:
+        # 1. yfinance, 2. FinanceDataReader, 3. 네이버 금융을 동시에 조회 (실패한 소스는 빈 값)
+        sources = fetch_fundamental_sources(ticker_yahoo, ticker_krx)
+        yf_info = sources["yfinance"] or {}
+        fdr_info = sources["fdr"] or {}
+        naver_info = sources["naver"]
+
+        # 통합하여 저장 (세 소스의 결과 병합, 우선순위: 네이버 > yfinance > FinanceDataReader)
+
+        # 현재 주가 설정
+        if naver_info and naver_info.get('현재가') and naver_info.get('현재가') != 'N/A':
+            current_price = naver_info.get('현재가')
+        else:
+            current_price_val = yf_info.get('currentPrice') or fdr_info.get('current_price')
+            if current_price_val and current_price_val != '정보 없음':
+                current_price = f"{int(current_price_val):,}원"
+            else:
+                current_price = '정보 없음'
+
+        # 가격 변동 계산
+        previous_close = yf_info.get('previousClose') or fdr_info.get('previous_close')
+
+        if current_price != '정보 없음' and previous_close and previous_close != '정보 없음':
+            try:
+                # 문자열에서 숫자 추출
+                if isinstance(current_price, str):
+                    current_price_val = int(current_price.replace(',', '').replace('원', ''))
+                else:
+                    current_price_val = current_price
+
+                price_change = ((current_price_val - previous_close) / previous_close) * 100
+                color = "green" if price_change >= 0 else "red"
+                price_change_str = f"<span style='color:{color};'>({price_change:+.2f}%)</span>"
+            except:
+                price_change_str = ""
+        else:
+            price_change_str = ""
+
+        # 52주 최고/최저 설정
+        if naver_info and naver_info.get('52주 최고') and naver_info.get('52주 최고') != 'N/A':
+            year_high = naver_info.get('52주 최고')
+        else:
+            year_high_val = yf_info.get('fiftyTwoWeekHigh') or fdr_info.get('year_high')
+            if year_high_val and year_high_val != '정보 없음':
+                year_high = f"{int(year_high_val):,}원"
+            else:
+                year_high = '정보 없음'
+
+        if naver_info and naver_info.get('52주 최저') and naver_info.get('52주 최저') != 'N/A':
+            year_low = naver_info.get('52주 최저')
+        else:
+            year_low_val = yf_info.get('fiftyTwoWeekLow') or fdr_info.get('year_low')
+            if year_low_val and year_low_val != '정보 없음':
+                year_low = f"{int(year_low_val):,}원"
+            else:
+                year_low = '정보 없음'
+
+        # 시가총액 계산
+        if naver_info and naver_info.get('시가총액') and naver_info.get('시가총액') != 'N/A':
+            market_cap_str = naver_info.get('시가총액')
+        else:
+            market_cap = yf_info.get('marketCap') or fdr_info.get('market_cap')
+            if market_cap and market_cap != '정보 없음':
+                market_cap = market_cap / 1000000000000  # 조 단위로 변환
+                market_cap_str = f"{market_cap:.2f}조 원"
+            else:
+                market_cap_str = "정보 없음"
+
+        # PER 및 PBR 설정
+        if naver_info and naver_info.get('PER') and naver_info.get('PER') != 'N/A':
+            per = naver_info.get('PER')
+        else:
+            per_val = yf_info.get('trailingPE') or fdr_info.get('per')
+            if per_val and per_val != '정보 없음':
+                per = f"{per_val:.2f}"
+            else:
+                per = '정보 없음'
+
+        if naver_info and naver_info.get('PBR') and naver_info.get('PBR') != 'N/A':
+            pbr = naver_info.get('PBR')
+        else:
+            pbr_val = yf_info.get('priceToBook') or fdr_info.get('pbr')
+            if pbr_val and pbr_val != '정보 없음':
+                pbr = f"{pbr_val:.2f}"
+            else:
+                pbr = '정보 없음'
+
+        # 배당수익률 추가
+        if naver_info and naver_info.get('배당수익률') and naver_info.get('배당수익률') != 'N/A':
+            dividend_yield = naver_info.get('배당수익률')
+        else:
+            dividend_yield_val = yf_info.get('dividendYield') or fdr_info.get('dividend_yield')
+            if dividend_yield_val and dividend_yield_val != '정보 없음':
+                if isinstance(dividend_yield_val, (int, float)) and dividend_yield_val < 1:  # 소수점으로 표시된 경우
+                    dividend_yield = f"{dividend_yield_val * 100:.2f}%"
+                else:
+                    dividend_yield = f"{dividend_yield_val:.2f}%"
+            else:
+                dividend_yield = '정보 없음'
+
+        # 네이버에서만 가져올 수 있는 추가 정보들
+        if naver_info:
+            bps = naver_info.get('BPS', '정보 없음')
+            debt_ratio = naver_info.get('부채비율', '정보 없음')
+            net_income = naver_info.get('당기순이익', '정보 없음')
+        else:
+            bps = '정보 없음'
+            debt_ratio = '정보 없음'
+            net_income = '정보 없음'
+
+    except Exception as e:
+        # 오류 발생 시 기본값으로 설정
+        current_price = '정보 없음'
+        price_change_str = ""
+        year_high = '정보 없음'
+        year_low = '정보 없음'
+        market_cap_str = '정보 없음'
+        per = '정보 없음'
+        pbr = '정보 없음'
+        dividend_yield = '정보 없음'
+        bps = '정보 없음'
+        debt_ratio = '정보 없음'
+        net_income = '정보 없음'
+
+    # 결과 딕셔너리에 저장
+    stock_info['current_price'] = current_price
+    stock_info['price_change_str'] = price_change_str
+    stock_info['year_high'] = year_high
+    stock_info['year_low'] = year_low
+    stock_info['market_cap_str'] = market_cap_str
+    stock_info['per'] = per
+    stock_info['pbr'] = pbr
+    stock_info['dividend_yield'] = dividend_yield
+    stock_info['bps'] = bps
+    stock_info['debt_ratio'] = debt_ratio
+    stock_info['net_income'] = net_income
+
+    return stock_info
+
+
+def get_stock_info_naver(ticker_krx):
+    """
+    네이버 금융에서 특정 종목의 주요 재무 지표를 크롤링하여 반환
+
+    Args:
+        ticker_krx (str): 한국 주식 코드 (예: '005930')
+
+    Returns:
+        dict: 주식 정보 딕셔너리 또는 None (실패 시)
+    """
+    # 티커 형식 처리 (문자열 확인)
+    if isinstance(ticker_krx, str) and not ticker_krx.isdigit():
+        logger.warning("잘못된 티커 형식: %s", ticker_krx)
+        return None
+
+    ticker_krx = str(ticker_krx).zfill(6)  # 6자리 숫자로 포맷팅
+    url = f"https://finance.naver.com/item/main.naver?code={ticker_krx}"
+
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/110.0.0.0 Safari/537.36"
+    }
+
+    try:
+        response = get_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        if response.status_code != 200:
+            logger.warning("네이버 금융 요청 실패: %s", response.status_code)
+            return None
+
+        # lxml 단일 파싱 + 행 제목 디스패치 (본문 bytes를 그대로 넘겨 문자셋 추정 비용 없음)
+        # 응답 헤더에 charset이 없으면 페이지의 meta charset을 따름 (requests 기본값 ISO-8859-1 사용 안 함)
+        content_type = response.headers.get("Content-Type", "").lower()
+        encoding = response.encoding if "charset" in content_type else None
+        result = parse_naver_item_page(response.content, encoding=encoding)
+
+        logger.debug("네이버 금융 크롤링 결과: 현재가=%s, PER=%s, PBR=%s, 부채비율=%s, 당기순이익=%s",
+                     result['현재가'], result['PER'], result['PBR'], result['부채비율'], result['당기순이익'])
+
+        return result
+
+    except Exception as e:
+        logger.error("네이버 금융 크롤링 중 오류 발생: %s", e)
+        return None
+
+
+def get_fdr_stock_info(ticker_krx):
+    """
+    FinanceDataReader를 사용하여 주식 정보를 가져오는 함수
+
+    Args:
+        ticker_krx (str): 한국 주식 코드 (예: '005930')
+
+    Returns:
+        dict: 주식 정보 딕셔너리
+    """
+    try:
+        # 기본 정보 딕셔너리 초기화
+        stock_info = {
+            'current_price': '정보 없음',
+            'previous_close': '정보 없음',
+            'year_high': '정보 없음',
+            'year_low': '정보 없음',
+            'market_cap': '정보 없음',
+            'per': '정보 없음',
+            'pbr': '정보 없음',
+            'dividend_yield': '정보 없음'
+        }
+
+        # 오늘 날짜와 1년 전 날짜 계산
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365)
+
+        # 일별 주가 데이터 가져오기 (로컬 시세 저장소 - 차트와 같은 데이터 공유)
+        df = get_daily_ohlcv(ticker_krx, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+
+        if not df.empty:
+            # 현재가 (가장 최근 종가)
+            stock_info['current_price'] = df['Close'].iloc[-1]
+
+            # 전일 종가
+            if len(df) > 1:
+                stock_info['previous_close'] = df['Close'].iloc[-2]
+
+            # 52주 최고가/최저가
+            stock_info['year_high'] = df['High'].max()
+            stock_info['year_low'] = df['Low'].min()
+
+            # 시가총액은 FDR에서 직접 제공하지 않음 (별도 API 필요)
+
+            # 기업정보 가져오기 (KRX에서 제공하는 경우)
+            try:
+                company_info = get_listing_index().get_row(ticker_krx)
+
+                if company_info is not None:
+                    # 시가총액 (MarketCap 열이 있는 경우)
+                    if 'MarketCap' in company_info.index:
+                        stock_info['market_cap'] = company_info['MarketCap']
+
+                    # PER (PER 열이 있는 경우)
+                    if 'PER' in company_info.index:
+                        stock_info['per'] = company_info['PER']
+
+                    # PBR (PBR 열이 있는 경우)
+                    if 'PBR' in company_info.index:
+                        stock_info['pbr'] = company_info['PBR']
+
+                    # 배당수익률 (DividendYield 열이 있는 경우)
+                    if 'DividendYield' in company_info.index:
+                        stock_info['dividend_yield'] = company_info['DividendYield']
+            except:
+                pass  # KRX 정보 가져오기 실패 시 기본값 유지
+
+        return stock_info
+
+    except Exception as e:
+        logger.error("FDR 데이터 가져오기 오류: %s", e)
+        return stock_info  # 기본값 반환
@@ -0,0 +1,222 @@
+import os
+import re
+import hashlib
+import logging
+import threading
+from urllib.parse import urlparse
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import lxml.html
+from lxml import etree
+
+from http_client import get_session
+from config import (ARTICLE_BODY_ENABLED, ARTICLE_BODY_CACHE_DIR, ARTICLE_BODY_MAX_ARTICLES, ARTICLE_BODY_WORKERS,
+                    ARTICLE_BODY_PER_HOST, ARTICLE_BODY_TIMEOUT, ARTICLE_BODY_DEADLINE, ARTICLE_BODY_MAX_CHARS)
+from instrumentation import timed, record_cache
+
+logger = logging.getLogger(__name__)
+
+# 📌 언론사/포털별 본문 영역 (있으면 그대로 사용, 없으면 텍스트 밀도로 추정)
+_BODY_XPATHS = (
+    "//*[@id='dic_area']",              # 네이버 뉴스
+    "//*[@id='newsct_article']",
+    "//*[@id='articleBodyContents']",
+    "//*[@id='articeBody']",
+    "//*[@id='article-view-content-div']",
+    "//*[@itemprop='articleBody']",
+    "//article",
+)
+
+# 본문과 관계없는 영역 (추출 전에 제거)
+_BOILERPLATE_TAGS = ("script", "style", "noscript", "iframe", "header", "footer", "nav", "aside", "form",
+                     "button", "select", "figure", "figcaption", "svg")
+_BOILERPLATE_CLASS = re.compile(r"(comment|reply|share|sns|related|recommend|banner|advert|\bad\b|footer|copyright|byline|subscribe)", re.I)
+_BLOCK_TAGS = ("div", "section", "article", "td", "main")
+
+_MIN_BODY_CHARS = 200
+_WHITESPACE = re.compile(r"[ \t ]+")
+_BLANK_LINES = re.compile(r"\n\s*\n+")
+
+_host_lock = threading.Lock()
+_host_slots = {}
+
+
+def _host_slot(url):
+    """호스트별 동시 요청 제한 세마포어"""
+    host = urlparse(url).hostname or ""
+    with _host_lock:
+        slot = _host_slots.get(host)
+        if slot is None:
+            slot = _host_slots[host] = threading.BoundedSemaphore(max(1, ARTICLE_BODY_PER_HOST))
+    return slot
+
+
+def _cache_path(url):
+    digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    return os.path.join(ARTICLE_BODY_CACHE_DIR, digest[:2], f"{digest}.txt")
+
+
+def _read_cache(url):
+    """캐시된 본문 (빈 문자열은 본문을 찾지 못했던 기사, None은 캐시 없음)"""
+    try:
+        with open(_cache_path(url), encoding="utf-8") as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_cache(url, body):
+    """본문을 URL 해시 파일로 저장하는 함수 (원자적 교체)"""
+    try:
+        path = _cache_path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(body)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("기사 본문 캐시 저장 실패: %s", e)
+
+
+def _clean_text(element):
+    """요소의 텍스트를 문단 단위로 정리 (<br>, <p>는 줄바꿈)"""
+    for br in element.iter("br"):
+        br.tail = "\n" + (br.tail or "")
+    for p in element.iter("p"):
+        p.tail = "\n\n" + (p.tail or "")
+    text = _WHITESPACE.sub(" ", element.text_content())
+    lines = (line.strip() for line in text.split("\n"))
+    return _BLANK_LINES.sub("\n\n", "\n".join(lines)).strip()
+
+
+def _text_density_block(doc):
+    """링크를 뺀 직속 텍스트가 가장 많은 블록 요소 (본문 영역 추정)"""
+    best, best_score = None, 0
+    for element in doc.iter(*_BLOCK_TAGS):
+        text_chars = len((element.text or "").strip())
+        link_chars = 0
+        for child in element:
+            text_chars += len((child.tail or "").strip())
+            if child.tag == "p":
+                text_chars += len(child.text_content().strip())
+            elif child.tag == "a":
+                link_chars += len(child.text_content().strip())
+        score = text_chars - 2 * link_chars
+        if score > best_score:
+            best, best_score = element, score
+    return best
+
+
+def extract_main_text(html, encoding=None):
+    """
+    기사 페이지에서 본문만 추출하는 함수
+    스크립트/메뉴/댓글/광고 영역을 지운 뒤, 알려진 본문 영역이 있으면 그 영역을, 없으면 텍스트 밀도가 가장 높은 블록을 사용한다.
+
+    Args:
+        html (str 또는 bytes): 기사 페이지
+        encoding (str): bytes 페이지의 인코딩 (선택)
+
+    Returns:
+        str: 본문 텍스트 (본문으로 보기 어려울 만큼 짧으면 빈 문자열)
+    """
+    if not html:
+        return ""
+    try:
+        if isinstance(html, bytes):
+            parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True)
+            doc = lxml.html.document_fromstring(html, parser=parser)
+        else:
+            doc = lxml.html.document_fromstring(html)
+    except (ValueError, etree.ParserError):
+        return ""
+
+    for element in list(doc.iter(*_BOILERPLATE_TAGS)):
+        element.drop_tree()
+    for element in doc.xpath("//*[@class or @id]"):
+        marker = f"{element.get('class', '')} {element.get('id', '')}"
+        if _BOILERPLATE_CLASS.search(marker) and element.getparent() is not None and element.tag != "body":
+            element.drop_tree()
+
+    body = None
+    for xpath in _BODY_XPATHS:
+        found = doc.xpath(xpath)
+        if found:
+            body = found[0]
+            break
+    if body is None:
+        body = _text_density_block(doc)
+    if body is None:
+        return ""
+
+    text = _clean_text(body)
+    return text[:ARTICLE_BODY_MAX_CHARS] if len(text) >= _MIN_BODY_CHARS else ""
+
+
+def fetch_article_body(url, headers=None):
+    """
+    기사 본문 하나를 가져오는 함수 (디스크 캐시 → 요청, 호스트별 동시 요청 제한)
+
+    Returns:
+        str: 본문 (찾지 못하면 빈 문자열) 또는 None (요청 실패, 다음에 다시 시도)
+    """
+    cached = _read_cache(url)
+    record_cache("article_body", cached is not None)
+    if cached is not None:
+        return cached
+
+    try:
+        with _host_slot(url), timed("article_body.page"):
+            response = get_session().get(url, headers=headers, timeout=ARTICLE_BODY_TIMEOUT)
+        response.raise_for_status()
+    except Exception as e:
+        logger.debug("기사 본문 요청 실패 (%s): %s", url, e)
+        return None
+
+    # 헤더에 charset이 있을 때만 인코딩을 지정하고, 없으면 페이지 meta charset을 따름
+    encoding = response.encoding if "charset" in response.headers.get("Content-Type", "").lower() else None
+    with timed("article_body.extract"):
+        body = extract_main_text(response.content, encoding=encoding)
+    _write_cache(url, body)
+    return body
+
+
+def fetch_article_bodies(news_data, enabled=None, max_articles=None):
+    """
+    뉴스 목록의 기사 본문을 동시에 가져와 "body" 키로 붙이는 함수
+    전체 제한 시간(ARTICLE_BODY_DEADLINE)이 지나면 끝나지 않은 기사는 요약문만 사용한다.
+
+    Args:
+        news_data (list): crawl_news 결과
+        enabled (bool): 본문 수집 여부 (기본값: ARTICLE_BODY_ENABLED)
+        max_articles (int): 본문을 가져올 최대 기사 수 (기본값: ARTICLE_BODY_MAX_ARTICLES, 앞쪽 기사부터)
+
+    Returns:
+        list: 본문을 찾은 기사에는 "body"가 추가된 뉴스 목록 (원본 목록은 바꾸지 않음)
+    """
+    enabled = ARTICLE_BODY_ENABLED if enabled is None else enabled
+    if not enabled or not news_data:
+        return news_data
+
+    targets = news_data[:max_articles or ARTICLE_BODY_MAX_ARTICLES]
+    headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+                             "(KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36"}
+
+    with timed("article_body.fetch", articles=len(targets)):
+        executor = ThreadPoolExecutor(max_workers=max(1, min(ARTICLE_BODY_WORKERS, len(targets))),
+                                      thread_name_prefix="article-body")
+        futures = [executor.submit(fetch_article_body, item["link"], headers) for item in targets]
+        done, pending = wait(futures, timeout=ARTICLE_BODY_DEADLINE)
+        # 늦은 요청은 기다리지 않음 (끝나면 캐시에만 저장되어 다음 분석에서 사용)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    result = []
+    found = 0
+    for i, item in enumerate(news_data):
+        body = futures[i].result() if i < len(futures) and futures[i] in done else None
+        if body:
+            found += 1
+            item = {**item, "body": body}
+        result.append(item)
+
+    logger.info("기사 본문 수집: %d/%d개 (시간 초과 %d개)", found, len(targets), len(pending))
+    return result
@@ -0,0 +1,275 @@
+import os
+import re
+import time
+import sqlite3
+import logging
+import threading
+import urllib.parse
+from datetime import datetime, timedelta
+
+from config import ARTICLE_STORE_PATH, SQLITE_BUSY_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+# 추적용 쿼리 파라미터 (정규화 시 제거)
+_TRACKING_PARAMS = {"utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content", "fbclid", "gclid", "ref"}
+
+_RELATIVE_DATE = re.compile(r"(\d+)\s*(분|시간|일|주)\s*전")
+_ABSOLUTE_DATE = re.compile(r"(\d{4})\.(\d{1,2})\.(\d{1,2})\.?")
+
+
+def canonical_link(url):
+    """
+    기사 링크 정규화 (호스트 소문자, 프래그먼트/추적 파라미터 제거, 쿼리 정렬)
+
+    Args:
+        url (str): 기사 링크
+
+    Returns:
+        str: 정규화된 링크
+    """
+    parts = urllib.parse.urlsplit(url.strip())
+    query = sorted(
+        (key, value) for key, value in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS
+    )
+    path = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, urllib.parse.urlencode(query), ""))
+
+
+def parse_naver_date(text, now=None):
+    """
+    네이버 뉴스 검색 결과의 날짜 표기를 ISO 형식 게시 시각으로 변환하는 함수
+
+    "5분 전", "3시간 전", "2일 전", "1주 전", "2024.10.08." 형식을 지원한다.
+
+    Args:
+        text (str): 날짜 표기
+        now (datetime): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        str: ISO 형식 시각 또는 None (날짜 표기가 아니면)
+    """
+    now = now or datetime.now()
+
+    match = _RELATIVE_DATE.search(text)
+    if match:
+        amount, unit = int(match.group(1)), match.group(2)
+        delta = {
+            "분": timedelta(minutes=amount),
+            "시간": timedelta(hours=amount),
+            "일": timedelta(days=amount),
+            "주": timedelta(weeks=amount),
+        }[unit]
+        return (now - delta).replace(microsecond=0).isoformat()
+
+    match = _ABSOLUTE_DATE.search(text)
+    if match:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3))).isoformat()
+        except ValueError:
+            return None
+
+    return None
+
+
+def _normalize_query(query):
+    return " ".join(str(query).split()).lower()
+
+
+class ArticleStore:
+    """
+    SQLite 기반 기사 저장소 (검색어 + 정규화된 링크 기준, FTS5 전문 검색)
+
+    - 검색어별로 수집된 기사(중복 제거 후 제목/본문), 게시 시각, 수집 시각을 보관
+    - 검색어별 수집 범위(시작 ~ 마지막 수집 시각)를 기록해, 다음 수집 때 이미 저장된 구간은 다시 가져오지 않게 한다.
+    - FTS5를 지원하지 않는 SQLite에서는 전문 검색만 LIKE 검색으로 대체된다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS articles (
+                link TEXT NOT NULL,
+                query TEXT NOT NULL,
+                ticker TEXT,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                published_at TEXT,
+                crawled_at REAL NOT NULL,
+                PRIMARY KEY (query, link)
+            );
+            CREATE INDEX IF NOT EXISTS idx_articles_query_published ON articles(query, published_at);
+            CREATE TABLE IF NOT EXISTS coverage (
+                query TEXT PRIMARY KEY,
+                covered_from TEXT NOT NULL,
+                covered_until TEXT NOT NULL,
+                crawled_at REAL NOT NULL
+            );
+            """
+        )
+        self.fts = self._create_fts()
+        self._conn.commit()
+
+    def _create_fts(self):
+        """FTS5 색인과 동기화 트리거 생성 (지원하지 않으면 False)"""
+        try:
+            self._conn.executescript(
+                """
+                CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts
+                    USING fts5(title, content, content='articles', content_rowid='rowid');
+                CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+                    INSERT INTO articles_fts(rowid, title, content) VALUES (new.rowid, new.title, new.content);
+                END;
+                CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+                    INSERT INTO articles_fts(articles_fts, rowid, title, content)
+                        VALUES ('delete', old.rowid, old.title, old.content);
+                END;
+                """
+            )
+            return True
+        except sqlite3.OperationalError as e:
+            logger.info("SQLite FTS5를 사용할 수 없어 LIKE 검색으로 대체합니다: %s", e)
+            return False
+
+    def add_articles(self, query, articles, ticker=None):
+        """
+        기사 저장 (이미 있는 링크는 건너뜀)
+
+        Args:
+            query (str): 검색어 (기업명)
+            articles (list): {"title", "link", "content", "published_at"(선택)} 목록
+            ticker (str): 종목코드 (선택)
+        """
+        if not articles:
+            return
+        now = time.time()
+        rows = [
+            (canonical_link(article["link"]), _normalize_query(query), ticker, article["title"],
+             article["content"], article.get("published_at"), now)
+            for article in articles
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO articles (link, query, ticker, title, content, published_at, crawled_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+    def recent_articles(self, query, since):
+        """
+        검색어의 저장된 기사 중 since 이후 기사를 최신순으로 반환하는 함수
+        게시 시각이 없는 기사는 수집 시각으로 판단한다.
+
+        Args:
+            query (str): 검색어 (기업명)
+            since (datetime): 기간 시작 시각
+
+        Returns:
+            list: {"title", "link", "content", "published_at"} 목록
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT link, title, content, published_at FROM articles
+                WHERE query = ?
+                  AND (published_at >= ? OR (published_at IS NULL AND crawled_at >= ?))
+                ORDER BY COALESCE(published_at, strftime('%Y-%m-%dT%H:%M:%S', crawled_at, 'unixepoch', 'localtime')) DESC
+                """,
+                (_normalize_query(query), since.isoformat(), since.timestamp())
+            ).fetchall()
+        return [
+            {"title": title, "link": link, "content": content, "published_at": published_at}
+            for link, title, content, published_at in rows
+        ]
+
+    def coverage(self, query):
+        """
+        검색어의 수집 범위 (covered_from ~ covered_until 기간은 이미 수집했다고 본다)
+
+        Returns:
+            tuple: (시작 시각, 마지막 수집 시각) 또는 None (수집 기록 없음)
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT covered_from, covered_until FROM coverage WHERE query = ?", (_normalize_query(query),)
+            ).fetchone()
+        if not row:
+            return None
+        return datetime.fromisoformat(row[0]), datetime.fromisoformat(row[1])
+
+    def set_coverage(self, query, covered_from, covered_until):
+        """
+        검색어의 수집 범위 기록
+        기존 범위와 겹치거나 이어지면 합치고, 떨어져 있으면 (사이에 수집 안 된 기간이 있으면) 새 범위로 바꾼다.
+        """
+        key = _normalize_query(query)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO coverage (query, covered_from, covered_until, crawled_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT(query) DO UPDATE SET
+                    covered_from = CASE WHEN coverage.covered_until >= excluded.covered_from
+                        THEN MIN(coverage.covered_from, excluded.covered_from) ELSE excluded.covered_from END,
+                    covered_until = CASE WHEN coverage.covered_until >= excluded.covered_from
+                        THEN MAX(coverage.covered_until, excluded.covered_until) ELSE excluded.covered_until END,
+                    crawled_at = excluded.crawled_at
+                """,
+                (key, covered_from.isoformat(), covered_until.isoformat(), time.time())
+            )
+            self._conn.commit()
+
+    def search(self, text, query=None, limit=20):
+        """
+        저장된 기사 전문 검색
+
+        Args:
+            text (str): 검색할 단어
+            query (str): 특정 검색어(기업명) 기사로 제한 (선택)
+            limit (int): 최대 결과 수
+
+        Returns:
+            list: {"title", "link", "content", "published_at"} 목록
+        """
+        params = []
+        if self.fts:
+            sql = ("SELECT a.link, a.title, a.content, a.published_at FROM articles_fts "
+                   "JOIN articles a ON a.rowid = articles_fts.rowid WHERE articles_fts MATCH ?")
+            params.append('"' + text.replace('"', '""') + '"')
+        else:
+            sql = "SELECT link, title, content, published_at FROM articles a WHERE (title LIKE ? OR content LIKE ?)"
+            params += [f"%{text}%", f"%{text}%"]
+        if query is not None:
+            sql += " AND a.query = ?"
+            params.append(_normalize_query(query))
+        sql += " LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {"title": title, "link": link, "content": content, "published_at": published_at}
+            for link, title, content, published_at in rows
+        ]
+
+
+_store_lock = threading.Lock()
+_store = None
+
+
+def get_article_store():
+    """프로세스 전역 기사 저장소 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArticleStore(ARTICLE_STORE_PATH)
+    return _store
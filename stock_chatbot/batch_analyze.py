@@ -0,0 +1,184 @@
+"""
+관심 종목 일괄 분석 CLI (Streamlit 없이 실행)
+
+사용 예:
+    python batch_analyze.py 삼성전자 SK하이닉스 --days 7
+    python batch_analyze.py --watchlist watchlist.txt --workers 4 --output-dir batch_output
+
+종목마다 뉴스 수집 → 재무 정보 → 청크 → 벡터 저장소 → (선택) 요약을 수행하고
+결과를 output-dir/<종목코드>/ 아래에 저장한다.
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+def _init_worker():
+    """작업 프로세스 초기화 - 상장 목록 인덱스와 임베딩 모델을 프로세스당 한 번만 로드"""
+    from instrumentation import configure_logging
+    from krx_listing import get_listing_index
+    from rag_process import warmup_embeddings
+
+    configure_logging()
+    get_listing_index()
+    warmup_embeddings(background=False)
+
+
+def analyze_company(company_name, days, output_dir, openai_api_key=None):
+    """
+    한 기업을 분석하고 결과를 디스크에 저장하는 함수
+
+    Args:
+        company_name (str): 기업명
+        days (int): 뉴스 검색 기간 (일)
+        output_dir (str): 결과 저장 디렉터리
+        openai_api_key (str): OpenAI API 키 (없으면 요약 생략)
+
+    Returns:
+        dict: 분석 결과 요약 (기업명, 종목코드, 뉴스/청크 수, 소요 시간, 오류)
+    """
+    from news_crawler import crawl_news
+    from article_body import fetch_article_bodies
+    from rag_process import get_text_chunks, get_vectorstore
+    from stock_data import get_ticker, standardize_company_name
+    from analysis_pipeline import get_cached_stock_info, generate_company_summary
+    from instrumentation import metrics
+
+    # 작업 프로세스의 계측값은 기업 단위로 초기화해 결과에 함께 기록
+    metrics.reset()
+    started = time.perf_counter()
+    result = {"company": company_name, "ticker": None, "news": 0, "chunks": 0, "summary": False, "error": None}
+
+    try:
+        company_name = standardize_company_name(company_name)
+        ticker_krx = get_ticker(company_name, source="fdr")
+        if not ticker_krx:
+            raise ValueError("해당 기업의 티커 코드를 찾을 수 없습니다.")
+        result["ticker"] = ticker_krx
+
+        news_data = crawl_news(company_name, days, ticker=ticker_krx)
+        if not news_data:
+            raise ValueError("해당 기업의 최근 뉴스를 찾을 수 없습니다.")
+        result["news"] = len(news_data)
+
+        stock_info = get_cached_stock_info(ticker_krx)
+        text_chunks = get_text_chunks(fetch_article_bodies(news_data), [stock_info])
+        result["chunks"] = len(text_chunks)
+
+        vectorstore = get_vectorstore(text_chunks, ticker_krx=ticker_krx, days=days)
+
+        ticker_dir = os.path.join(output_dir, ticker_krx)
+        os.makedirs(ticker_dir, exist_ok=True)
+        vectorstore.save_local(os.path.join(ticker_dir, "vectorstore"))
+
+        with open(os.path.join(ticker_dir, "news.json"), "w", encoding="utf-8") as f:
+            json.dump(news_data, f, ensure_ascii=False, indent=2)
+        with open(os.path.join(ticker_dir, "stock_info.json"), "w", encoding="utf-8") as f:
+            json.dump(stock_info, f, ensure_ascii=False, indent=2, default=str)
+
+        if openai_api_key:
+            summary_html = generate_company_summary(
+                company_name, news_data, openai_api_key,
+                ticker_krx=ticker_krx, stock_info=stock_info
+            )
+            with open(os.path.join(ticker_dir, "summary.html"), "w", encoding="utf-8") as f:
+                f.write(summary_html)
+            result["summary"] = True
+
+    except Exception as e:
+        result["error"] = str(e)
+
+    result["seconds"] = round(time.perf_counter() - started, 2)
+    result["metrics"] = metrics.snapshot()
+    return result
+
+
+def read_watchlist(path):
+    """관심 종목 파일 읽기 (한 줄에 기업명 하나, # 이후는 주석)"""
+    companies = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            name = line.split("#", 1)[0].strip()
+            if name:
+                companies.append(name)
+    return companies
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="관심 종목 일괄 분석 (뉴스 수집, 벡터 저장소, 요약)")
+    parser.add_argument("companies", nargs="*", help="분석할 기업명 목록")
+    parser.add_argument("--watchlist", help="기업명 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--days", type=int, default=7, help="뉴스 검색 기간 (일, 기본 7)")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                        help="작업 프로세스 수")
+    parser.add_argument("--output-dir", default="batch_output", help="결과 저장 디렉터리")
+    parser.add_argument("--openai-api-key", default=os.environ.get("OPENAI_API_KEY"),
+                        help="요약 생성용 OpenAI API 키 (기본값: OPENAI_API_KEY 환경 변수)")
+    parser.add_argument("--no-summary", action="store_true", help="GPT-4 요약 생략")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    from instrumentation import configure_logging
+
+    args = parse_args(argv)
+    configure_logging()
+
+    companies = list(args.companies)
+    if args.watchlist:
+        companies += read_watchlist(args.watchlist)
+    companies = list(dict.fromkeys(companies))  # 순서 유지 중복 제거
+    if not companies:
+        print("분석할 기업명이 없습니다. 기업명 또는 --watchlist를 지정해주세요.")
+        return 1
+
+    openai_api_key = None if args.no_summary else args.openai_api_key
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    started = time.perf_counter()
+    results = []
+
+    # 스레드 풀이 있는 상태에서 fork하지 않도록 spawn 사용
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=context, initializer=_init_worker) as executor:
+        futures = {
+            executor.submit(analyze_company, company, args.days, args.output_dir, openai_api_key): company
+            for company in companies
+        }
+        for future in as_completed(futures):
+            try:
+                result = future.result()
+            except Exception as e:
+                # 작업 프로세스 비정상 종료(BrokenProcessPool 등) → 해당 종목만 실패로 기록하고 계속 진행
+                result = {"company": futures[future], "ticker": None, "news": 0, "chunks": 0, "summary": False,
+                          "error": f"{type(e).__name__}: {e}", "seconds": None, "metrics": {}}
+            results.append(result)
+            status = "✅" if not result["error"] else f"❌ {result['error']}"
+            print(f"[{len(results)}/{len(companies)}] {result['company']} ({result['ticker']}) "
+                  f"뉴스 {result['news']}개, 청크 {result['chunks']}개, {result['seconds']}초 {status}")
+
+    elapsed = time.perf_counter() - started
+    succeeded = sum(1 for result in results if not result["error"])
+    throughput = succeeded / (elapsed / 60) if elapsed > 0 else 0.0
+
+    report = {
+        "companies": len(companies),
+        "succeeded": succeeded,
+        "failed": len(companies) - succeeded,
+        "elapsed_seconds": round(elapsed, 2),
+        "tickers_per_minute": round(throughput, 2),
+        "results": sorted(results, key=lambda result: companies.index(result["company"])),
+    }
+    with open(os.path.join(args.output_dir, "batch_report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print(f"\n완료: {succeeded}/{len(companies)}개 성공, {elapsed:.1f}초, 처리량 {throughput:.2f} 종목/분")
+    return 0 if succeeded == len(companies) else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+import os
+import time
+import pickle
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+
+from config import CACHE_DIR
+from instrumentation import record_cache
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """
+    프로세스 전역 TTL 캐시 (스레드 안전, LRU 용량 제한, 선택적 디스크 보관)
+
+    Streamlit 세션들이 같은 프로세스를 공유하므로 모듈 전역 인스턴스로 두면 세션 간에 공유된다.
+    persist=True면 항목을 CACHE_DIR/<name>/ 아래 pickle 파일로도 저장해 재시작 후에도 재사용한다.
+    """
+
+    def __init__(self, name, maxsize=256, persist=False):
+        self.name = name
+        self.maxsize = maxsize
+        self.persist = persist
+        self.directory = os.path.join(CACHE_DIR, name)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}  # key -> [잠금, 사용 중인 스레드 수]
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + ".pkl")
+
+    def _read_disk(self, key):
+        try:
+            with open(self._path(key), "rb") as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+
+    def _write_disk(self, key, expires_at, value):
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self._path(key)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((expires_at, value), f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning("캐시 디스크 저장 실패 (%s): %s", self.name, e)
+
+    def get(self, key, default=None):
+        """
+        캐시된 값을 조회하는 함수 (만료되었으면 default 반환)
+
+        Args:
+            key: 캐시 키 (repr 가능한 값)
+            default: 캐시에 없을 때 반환할 값
+
+        Returns:
+            캐시된 값 또는 default
+        """
+        value = self._lookup(key, _MISSING)
+        record_cache(self.name, value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def _lookup(self, key, default):
+        now = time.time()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._data.move_to_end(key)
+                    return entry[1]
+                del self._data[key]
+
+        if self.persist:
+            entry = self._read_disk(key)
+            if entry is not None and entry[0] > now:
+                with self._lock:
+                    self._store(key, entry)
+                return entry[1]
+
+        return default
+
+    def _store(self, key, entry):
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def set(self, key, value, ttl):
+        """
+        값을 캐시에 저장하는 함수
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl (float): 유효 시간 (초)
+        """
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        with self._lock:
+            self._store(key, (expires_at, value))
+        if self.persist:
+            self._write_disk(key, expires_at, value)
+
+    def get_or_set(self, key, loader, ttl, should_cache=None):
+        """
+        캐시에 없으면 loader로 값을 만들어 저장하는 함수
+        같은 키를 동시에 요청하면 한 번만 계산하고 나머지는 그 결과를 기다린다.
+
+        Args:
+            key: 캐시 키
+            loader (callable): 값을 만드는 함수 (인자 없음)
+            ttl (float 또는 callable): 유효 시간 (초) 또는 값을 받아 유효 시간을 반환하는 함수
+            should_cache (callable): 값을 받아 캐시 여부를 반환하는 함수 (선택)
+
+        Returns:
+            캐시된 값 또는 새로 계산한 값
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        with self._lock:
+            entry = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            entry[1] += 1
+
+        try:
+            with entry[0]:
+                # 기다리는 동안 다른 스레드가 계산을 끝냈을 수 있음
+                value = self._lookup(key, _MISSING)
+                if value is not _MISSING:
+                    return value
+
+                value = loader()
+                if should_cache is None or should_cache(value):
+                    self.set(key, value, ttl(value) if callable(ttl) else ttl)
+        finally:
+            # 기다리는 스레드가 없을 때만 키별 잠금 제거 (loader가 예외를 던져도 정리)
+            # 대기 중인 잠금을 먼저 지우면 새로 들어온 스레드가 다른 잠금으로 loader를 중복 실행함
+            with self._lock:
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del self._key_locks[key]
+
+        return value
+
+    def clear(self):
+        """메모리 캐시 비우기 (디스크 항목은 만료 시각에 따라 무시됨)"""
+        with self._lock:
+            self._data.clear()
@@ -0,0 +1,143 @@
+import logging
+
+from langchain.memory import ConversationSummaryBufferMemory
+from langchain.prompts import PromptTemplate
+
+from config import CHAT_MEMORY_MAX_TOKENS, CHAT_MEMORY_SUMMARY_MAX_TOKENS, CHAT_MEMORY_LOW_WATERMARK
+from token_counter import count_tokens, get_encoder
+from instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+# 메시지 하나당 역할/구분자 토큰 (OpenAI 채팅 형식 기준 근사값)
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+# 요약하지 않고 항상 남기는 최근 메시지 수 (마지막 사용자 질문 + AI 답변)
+_KEEP_LAST_MESSAGES = 2
+
+_SUMMARY_PROMPT = PromptTemplate(
+    input_variables=["summary", "new_lines"],
+    template="""기업 분석 대화의 요약을 이어서 갱신하세요.
+기존 요약에 새 대화 내용을 반영해, 사용자가 관심을 보인 기업/지표/질문과 답변의 핵심 수치와 결론만 간결하게 한국어로 정리하세요.
+
+기존 요약:
+{summary}
+
+새 대화 내용:
+{new_lines}
+
+새 요약:"""
+)
+
+_ROLE_PREFIX = {"human": "사용자: ", "ai": "AI: ", "system": "이전 대화 요약: "}
+
+
+def format_chat_history(messages):
+    """
+    대화 메모리 메시지를 프롬프트용 텍스트로 변환하는 함수 (get_chat_history용)
+
+    Args:
+        messages (list): 요약 메시지 + 최근 대화 메시지
+
+    Returns:
+        str: "사용자: ... / AI: ..." 형식의 대화 이력
+    """
+    return "\n".join(
+        f"{_ROLE_PREFIX.get(message.type, message.type + ': ')}{message.content}"
+        for message in messages
+        if message.content
+    )
+
+
+class TokenBudgetMemory(ConversationSummaryBufferMemory):
+    """
+    토큰 예산이 고정된 대화 메모리
+
+    - 최근 대화는 그대로 두고, 예산(max_token_limit)을 넘으면 오래된 대화부터 요약에 합친다.
+    - 한 번 넘을 때 low_watermark 비율까지 줄여, 요약 LLM 호출이 매 질문마다 일어나지 않게 한다.
+    - 요약도 summary_token_limit 토큰을 넘지 않게 잘라, 요약 + 최근 대화가 항상 예산 안에 들어간다.
+    - 마지막 질문/답변 한 쌍은 요약하지 않고, 그 한 쌍만으로 예산을 넘으면 내용을 잘라 남긴다.
+    - 토큰 수는 텍스트 분할과 같은 tiktoken 인코더(token_counter)로 계산한다.
+    """
+
+    summary_token_limit: int = CHAT_MEMORY_SUMMARY_MAX_TOKENS
+    low_watermark: float = CHAT_MEMORY_LOW_WATERMARK
+
+    def _count_tokens(self, messages):
+        return sum(count_tokens(message.content) + _MESSAGE_OVERHEAD_TOKENS for message in messages)
+
+    def _trim_summary(self, summary):
+        """요약이 summary_token_limit을 넘으면 뒤쪽(최근 내용)만 남김"""
+        tokens = get_encoder().encode(summary)
+        if len(tokens) <= self.summary_token_limit:
+            return summary
+        return get_encoder().decode(tokens[-self.summary_token_limit:]).lstrip()
+
+    def _truncate_messages(self, messages, limit):
+        """메시지들이 limit 토큰 안에 들어가도록 각 메시지의 앞부분만 남김 (메시지별로 같은 몫)"""
+        share = max(1, limit // len(messages) - _MESSAGE_OVERHEAD_TOKENS)
+        for message in messages:
+            tokens = get_encoder().encode(message.content)
+            keep = share
+            # 한글 등 멀티바이트 문자 중간에서 자르면 다시 인코딩할 때 토큰이 늘 수 있어 들어갈 때까지 줄임
+            while len(tokens) > share and keep > 0:
+                message.content = get_encoder().decode(tokens[:keep]).rstrip()
+                if count_tokens(message.content) <= share:
+                    break
+                keep -= 1
+
+    def prune(self):
+        buffer = self.chat_memory.messages
+        recent_limit = self.max_token_limit - self.summary_token_limit
+        length = self._count_tokens(buffer)
+        if length <= recent_limit:
+            return
+
+        target = int(recent_limit * self.low_watermark)
+        pruned = []
+        while len(buffer) > _KEEP_LAST_MESSAGES and length > target:
+            message = buffer.pop(0)
+            pruned.append(message)
+            length -= count_tokens(message.content) + _MESSAGE_OVERHEAD_TOKENS
+
+        if length > recent_limit:
+            # 마지막 질문/답변만으로 예산 초과 → 요약으로 넘기지 않고 잘라서 유지
+            logger.info("마지막 대화가 토큰 예산(%d)을 넘어 잘라서 유지합니다: %d 토큰", recent_limit, length)
+            self._truncate_messages(buffer, recent_limit)
+        if not pruned:
+            return
+
+        try:
+            with timed("memory.summarize", messages=len(pruned)):
+                summary = self.predict_new_summary(pruned, self.moving_summary_buffer)
+        except Exception as e:
+            # 요약 실패 시 오래된 대화는 버리고 기존 요약 유지 (대화는 계속 진행)
+            logger.warning("대화 요약 실패, 오래된 대화 %d개를 버립니다: %s", len(pruned), e)
+            return
+        self.moving_summary_buffer = self._trim_summary(summary.strip())
+
+    async def aprune(self):
+        self.prune()
+
+
+def create_chat_memory(llm, max_tokens=None):
+    """
+    대화 체인용 토큰 예산 메모리 생성
+
+    Args:
+        llm: 요약에 사용할 LLM
+        max_tokens (int): 대화 이력 토큰 예산 (기본값: CHAT_MEMORY_MAX_TOKENS)
+
+    Returns:
+        TokenBudgetMemory: 메모리
+    """
+    max_tokens = max_tokens or CHAT_MEMORY_MAX_TOKENS
+    return TokenBudgetMemory(
+        llm=llm,
+        prompt=_SUMMARY_PROMPT,
+        max_token_limit=max_tokens,
+        summary_token_limit=min(CHAT_MEMORY_SUMMARY_MAX_TOKENS, max_tokens // 2),
+        memory_key="chat_history",
+        return_messages=True,
+        output_key="answer",
+    )
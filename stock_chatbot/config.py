@@ -0,0 +1,132 @@
+import os
+
+
+def _env_int(name, default):
+    """환경 변수에서 정수 설정값을 읽는 함수 (없거나 잘못된 값이면 기본값)"""
+    try:
+        return int(os.environ.get(name, default))
+    except (TypeError, ValueError):
+        return default
+
+
+def _env_bool(name, default):
+    """환경 변수에서 on/off 설정값을 읽는 함수 ("1", "true", "yes", "on"이면 True)"""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+# 📌 로컬 캐시 디렉터리 (KRX 상장 목록 스냅샷 등)
+CACHE_DIR = os.environ.get(
+    "STOCK_CHATBOT_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+)
+
+# 📌 SQLite 저장소(임베딩/LLM 응답/기사) 잠금 대기 시간 (초, 일괄 분석 작업 프로세스가 같은 파일을 동시에 씀)
+SQLITE_BUSY_TIMEOUT = float(os.environ.get("SQLITE_BUSY_TIMEOUT", 30))
+
+# 📌 KRX 상장 목록 스냅샷 유효 시간 (초, 기본 24시간)
+KRX_LISTING_TTL = _env_int("KRX_LISTING_TTL", 24 * 60 * 60)
+
+# 📌 임베딩 모델 설정
+EMBEDDING_MODEL_NAME = os.environ.get("EMBEDDING_MODEL_NAME", "jhgan/ko-sroberta-multitask")
+EMBEDDING_DEVICE = os.environ.get("EMBEDDING_DEVICE", "cpu")
+EMBEDDING_BATCH_SIZE = _env_int("EMBEDDING_BATCH_SIZE", 32)
+EMBEDDING_NUM_THREADS = _env_int("EMBEDDING_NUM_THREADS", 0)  # 0이면 torch 기본값 사용
+EMBEDDING_WARMUP = _env_bool("EMBEDDING_WARMUP", True)  # 로드 직후 더미 배치로 예열
+
+# 📌 임베딩 캐시 설정 (청크 텍스트 + 모델명 해시 → 벡터, SQLite)
+EMBEDDING_CACHE_ENABLED = _env_bool("EMBEDDING_CACHE_ENABLED", True)
+EMBEDDING_CACHE_PATH = os.environ.get("EMBEDDING_CACHE_PATH", os.path.join(CACHE_DIR, "embeddings.sqlite3"))
+EMBEDDING_CACHE_MAX_ENTRIES = _env_int("EMBEDDING_CACHE_MAX_ENTRIES", 200_000)
+
+# 📌 종목별 FAISS 벡터 저장소 디렉터리 (KRX 종목코드별 하위 디렉터리)
+VECTORSTORE_DIR = os.environ.get("VECTORSTORE_DIR", os.path.join(CACHE_DIR, "vectorstores"))
+
+# 📌 HTTP 요청 설정 (공유 세션, 재시도/백오프)
+HTTP_TIMEOUT = float(os.environ.get("HTTP_TIMEOUT", 10))
+HTTP_MAX_RETRIES = _env_int("HTTP_MAX_RETRIES", 3)
+HTTP_BACKOFF_FACTOR = float(os.environ.get("HTTP_BACKOFF_FACTOR", 0.5))
+HTTP_POOL_SIZE = _env_int("HTTP_POOL_SIZE", 20)
+
+# 📌 뉴스 크롤링 설정
+NEWS_MAX_PAGES = _env_int("NEWS_MAX_PAGES", 5)
+NEWS_FETCH_WORKERS = _env_int("NEWS_FETCH_WORKERS", 5)
+NEWS_MAX_CONCURRENT_REQUESTS = _env_int("NEWS_MAX_CONCURRENT_REQUESTS", 10)  # 프로세스 전체 동시 검색 요청 상한
+
+# 📌 긴 기간 뉴스 분할 수집 설정 (기간을 날짜 구간으로 나눠 동시에 검색)
+NEWS_SHARD_MIN_DAYS = _env_int("NEWS_SHARD_MIN_DAYS", 8)  # 이 기간(일) 이상이면 분할 수집
+NEWS_SHARD_DAYS = _env_int("NEWS_SHARD_DAYS", 1)  # 구간 길이 (1: 일별, 7: 주별)
+NEWS_SHARD_PAGES = _env_int("NEWS_SHARD_PAGES", 1)  # 구간별 페이지 수
+
+# 📌 뉴스 중복 제거 설정 (MinHash LSH 후보 검색 + 버킷 내 정확 유사도)
+# 기본값에서는 128개 MinHash를 2행 × 64밴드로 나눠 후보만 비교한다 (dedup._choose_bands 참고).
+# 제목 0.4 / 본문 0.25 미만으로 낮추면 LSH가 후보를 줄이지 못하므로 서명 없이 전체 비교한다.
+NEWS_TITLE_SIMILARITY_THRESHOLD = float(os.environ.get("NEWS_TITLE_SIMILARITY_THRESHOLD", 0.5))  # 제목 TF-IDF 코사인
+NEWS_CONTENT_SIMILARITY_THRESHOLD = float(os.environ.get("NEWS_CONTENT_SIMILARITY_THRESHOLD", 0.3))  # 본문 단어 Jaccard
+DEDUP_NUM_PERM = _env_int("DEDUP_NUM_PERM", 128)
+
+# 📌 재무 정보 수집 설정 (yfinance / FDR / 네이버 동시 조회)
+FUNDAMENTALS_SOURCE_TIMEOUT = float(os.environ.get("FUNDAMENTALS_SOURCE_TIMEOUT", 8))
+FUNDAMENTALS_MAX_WORKERS = _env_int("FUNDAMENTALS_MAX_WORKERS", 6)
+
+# 📌 재무 정보 캐시 설정 (장중에는 짧게, 장 마감 후에는 다음 개장까지)
+FUNDAMENTALS_TTL_MARKET_OPEN = _env_int("FUNDAMENTALS_TTL_MARKET_OPEN", 60)
+FUNDAMENTALS_TTL_MARKET_CLOSED_MAX = _env_int("FUNDAMENTALS_TTL_MARKET_CLOSED_MAX", 6 * 60 * 60)
+FUNDAMENTALS_CACHE_PERSIST = _env_bool("FUNDAMENTALS_CACHE_PERSIST", True)
+
+# 📌 차트 데이터 캐시 유효 시간 (초, 장중 기준 / 분봉은 장 마감 후 다음 개장까지 유지)
+CHART_TTL_1DAY = _env_int("CHART_TTL_1DAY", 60)
+CHART_TTL_WEEK = _env_int("CHART_TTL_WEEK", 5 * 60)
+CHART_TTL_1MONTH = _env_int("CHART_TTL_1MONTH", 60 * 60)
+CHART_TTL_1YEAR = _env_int("CHART_TTL_1YEAR", 6 * 60 * 60)
+
+# 📌 토큰 계산 설정 (텍스트 분할, 대화 메모리 토큰 예산에 공통 사용)
+TOKENIZER_ENCODING = os.environ.get("TOKENIZER_ENCODING", "cl100k_base")
+TOKEN_LEN_CACHE_SIZE = _env_int("TOKEN_LEN_CACHE_SIZE", 8192)
+TOKENIZER_NUM_THREADS = _env_int("TOKENIZER_NUM_THREADS", 4)
+
+# 📌 대화 메모리 설정 (최근 대화는 그대로, 오래된 대화는 요약 / 요약 + 최근 대화 토큰 예산)
+CHAT_MEMORY_MAX_TOKENS = _env_int("CHAT_MEMORY_MAX_TOKENS", 2000)
+CHAT_MEMORY_SUMMARY_MAX_TOKENS = _env_int("CHAT_MEMORY_SUMMARY_MAX_TOKENS", 500)
+CHAT_MEMORY_LOW_WATERMARK = float(os.environ.get("CHAT_MEMORY_LOW_WATERMARK", 0.6))  # 예산 초과 시 이 비율까지 요약
+
+# 📌 LLM 응답 캐시 설정 (모델명 + temperature + 프롬프트 해시 → 응답, SQLite)
+LLM_CACHE_ENABLED = _env_bool("LLM_CACHE_ENABLED", True)
+LLM_CACHE_PATH = os.environ.get("LLM_CACHE_PATH", os.path.join(CACHE_DIR, "llm_responses.sqlite3"))
+LLM_CACHE_MAX_BYTES = _env_int("LLM_CACHE_MAX_BYTES", 50 * 1024 * 1024)
+LLM_CACHE_MAX_TEMPERATURE = float(os.environ.get("LLM_CACHE_MAX_TEMPERATURE", 0))  # 이 값 이하 호출만 캐시
+
+# 📌 KRX 휴장일 추가 파일 (선택, 한 줄에 YYYY-MM-DD 하나씩 - 내장 휴장일 표에 더해짐)
+KRX_HOLIDAYS_FILE = os.environ.get("KRX_HOLIDAYS_FILE", os.path.join(CACHE_DIR, "krx_holidays.txt"))
+
+# 📌 로컬 시세 저장소 설정 (종목/주기별 파일, 새 봉만 추가로 가져옴)
+PRICE_STORE_DIR = os.environ.get("PRICE_STORE_DIR", os.path.join(CACHE_DIR, "prices"))
+PRICE_STORE_INTRADAY_REFRESH = _env_int("PRICE_STORE_INTRADAY_REFRESH", 60)  # 장중 마지막 봉 재조회 간격 (초)
+PRICE_STORE_MINUTE_MAX_DAYS = _env_int("PRICE_STORE_MINUTE_MAX_DAYS", 30)  # 분봉 보관 기간 (일)
+
+# 📌 세션 간 공유 분석 캐시 설정 (종목코드 + 기간 + 시간 구간 단위로 뉴스/벡터 저장소/요약 공유)
+ANALYSIS_CACHE_BUCKET_SECONDS = _env_int("ANALYSIS_CACHE_BUCKET_SECONDS", 30 * 60)
+ANALYSIS_CACHE_MAX_ENTRIES = _env_int("ANALYSIS_CACHE_MAX_ENTRIES", 64)
+ANALYSIS_CACHE_PERSIST = _env_bool("ANALYSIS_CACHE_PERSIST", False)  # 디스크 보관 (벡터 저장소는 종목별 저장소에서 다시 로드)
+
+# 📌 로그/계측 설정
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")  # "text" 또는 "json" (구조화 로그)
+DEBUG_PANEL = _env_bool("STOCK_CHATBOT_DEBUG_PANEL", False)  # Streamlit 사이드바에 계측 패널 표시
+METRICS_FILE = os.environ.get("METRICS_FILE", "")  # 지정하면 Prometheus 텍스트 형식으로 저장
+
+# 📌 기사 저장소 설정 (SQLite + FTS5, 검색어별 증분 수집)
+NEWS_STORE_ENABLED = _env_bool("NEWS_STORE_ENABLED", True)
+ARTICLE_STORE_PATH = os.environ.get("ARTICLE_STORE_PATH", os.path.join(CACHE_DIR, "articles.sqlite3"))
+
+# 📌 기사 본문 수집 설정 (선택, 링크된 기사 본문을 동시에 가져와 RAG 문맥에 사용 / URL 해시별 디스크 캐시)
+ARTICLE_BODY_ENABLED = _env_bool("ARTICLE_BODY_ENABLED", False)
+ARTICLE_BODY_CACHE_DIR = os.environ.get("ARTICLE_BODY_CACHE_DIR", os.path.join(CACHE_DIR, "article_bodies"))
+ARTICLE_BODY_MAX_ARTICLES = _env_int("ARTICLE_BODY_MAX_ARTICLES", 50)
+ARTICLE_BODY_WORKERS = _env_int("ARTICLE_BODY_WORKERS", 16)
+ARTICLE_BODY_PER_HOST = _env_int("ARTICLE_BODY_PER_HOST", 4)  # 언론사 호스트별 동시 요청 수
+ARTICLE_BODY_TIMEOUT = float(os.environ.get("ARTICLE_BODY_TIMEOUT", 5))  # 기사 하나당 (초)
+ARTICLE_BODY_DEADLINE = float(os.environ.get("ARTICLE_BODY_DEADLINE", 10))  # 전체 제한 시간 (초)
+ARTICLE_BODY_MAX_CHARS = _env_int("ARTICLE_BODY_MAX_CHARS", 6000)
@@ -0,0 +1,226 @@
+import re
+import math
+import zlib
+from collections import Counter
+
+import numpy as np
+
+from config import NEWS_TITLE_SIMILARITY_THRESHOLD, NEWS_CONTENT_SIMILARITY_THRESHOLD, DEDUP_NUM_PERM
+
+# TfidfVectorizer 기본 토큰 규칙과 동일 (2글자 이상 단어)
+_TITLE_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+_MERSENNE_PRIME = (1 << 31) - 1
+
+
+def title_tokens(title):
+    """제목을 소문자 단어 집합으로 변환"""
+    return frozenset(_TITLE_TOKEN_PATTERN.findall(title.lower()))
+
+
+def content_tokens(content):
+    """본문을 공백 기준 단어 집합으로 변환"""
+    return frozenset(content.split())
+
+
+def jaccard_similarity(set1, set2):
+    """Jaccard 유사도 계산 함수 (빈 집합이면 0)"""
+    if not set1 or not set2:
+        return 0.0
+    return len(set1 & set2) / len(set1 | set2)
+
+
+class TitleIdf:
+    """
+    제목 TF-IDF 코사인 유사도 계산기 (기존 TfidfVectorizer 방식과 같은 값)
+
+    지금까지 색인한 제목들의 문서 빈도를 누적해 두고, 비교할 때마다
+    "새 제목 + 기존 제목"으로 학습한 것과 같은 smooth idf (ln((1 + n) / (1 + df)) + 1)와 L2 정규화를 적용한다.
+    따라서 모든 기사에 나오는 기업명처럼 흔한 단어는 가중치가 낮아, 기업명만 같은 서로 다른 기사는 중복으로 보지 않는다.
+    (제목 안에서 같은 단어가 반복되면 한 번으로 센다)
+    """
+
+    def __init__(self):
+        self.documents = 0
+        self.document_frequency = Counter()
+
+    def add(self, tokens):
+        """색인에 추가된 제목의 문서 빈도 반영"""
+        self.documents += 1
+        self.document_frequency.update(tokens)
+
+    def _weight(self, token, query):
+        documents = self.documents + 1
+        frequency = self.document_frequency[token] + (token in query)
+        return math.log((1 + documents) / (1 + frequency)) + 1
+
+    def cosine(self, query, other):
+        """새 제목(query)과 기존 제목(other)의 TF-IDF 코사인 유사도 (빈 집합이면 0)"""
+        if not query or not other:
+            return 0.0
+        common = sum(self._weight(token, query) ** 2 for token in query & other)
+        if not common:
+            return 0.0
+        query_norm = math.sqrt(sum(self._weight(token, query) ** 2 for token in query))
+        other_norm = math.sqrt(sum(self._weight(token, query) ** 2 for token in other))
+        return common / (query_norm * other_norm)
+
+
+def _choose_bands(threshold, num_perm):
+    """
+    LSH 밴드 수/행 수 결정
+    후보 판정 임계값 (1/b)^(1/r)이 목표 Jaccard 임계값의 절반 이하가 되는 가장 큰 r을 선택 (재현율 우선)
+
+    기본 설정(num_perm=128, 제목 코사인 0.5 → Jaccard 약 0.33, 본문 Jaccard 0.3)에서는 r=2, b=64가 선택된다.
+    임계값을 0.25 미만으로 낮추면 r=1이 되어 MinHash 값 하나만 겹쳐도 후보가 되므로 LSH가 비교 횟수를 줄이지 못한다.
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if (1.0 / bands) ** (1.0 / rows) <= threshold * 0.5:
+            best = (bands, rows)
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    MinHash 서명 + LSH 버킷 기반 유사 문서 색인
+
+    문서마다 MinHash 서명을 한 번만 계산하고, 같은 버킷에 들어간 후보에 대해서만 정확한 유사도를 계산한다.
+    버킷은 토큰 집합의 Jaccard 유사도 기준이므로, 다른 유사도를 쓰면 대응하는 Jaccard 값을 candidate_threshold로 넘긴다.
+    임계값이 낮아 밴드당 행이 1개로 정해지면 (_choose_bands 참고) 버킷이 후보를 거의 줄이지 못하므로,
+    서명 계산 없이 기존 문서 전체와 바로 비교한다 (exhaustive, O(n²)).
+    """
+
+    def __init__(self, threshold, similarity=jaccard_similarity, num_perm=DEDUP_NUM_PERM, seed=42,
+                 candidate_threshold=None):
+        self.threshold = threshold
+        self.similarity = similarity
+        self.bands, self.rows = _choose_bands(threshold if candidate_threshold is None else candidate_threshold,
+                                              num_perm)
+        self.exhaustive = self.rows == 1
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+        self._b = rng.integers(0, _MERSENNE_PRIME, size=num_perm, dtype=np.int64)
+
+        self._token_sets = []
+        self._buckets = [dict() for _ in range(self.bands)]
+
+    def __len__(self):
+        return len(self._token_sets)
+
+    def signature(self, tokens):
+        """
+        토큰 집합의 MinHash 서명 계산 (permutation 연산은 NumPy로 벡터화)
+        토큰 해시는 CRC32를 사용해 프로세스마다 같은 서명이 나온다 (내장 hash()는 PYTHONHASHSEED에 따라 달라짐).
+        """
+        hashes = np.fromiter((zlib.crc32(token.encode("utf-8")) % _MERSENNE_PRIME for token in tokens),
+                             dtype=np.int64, count=len(tokens))
+        permuted = (self._a[:, None] * hashes[None, :] + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1)
+
+    def _band_keys(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def is_duplicate(self, tokens, signature=None):
+        """
+        기존 문서 중 임계값을 넘는 유사 문서가 있는지 확인
+
+        Args:
+            tokens (frozenset): 문서 토큰 집합
+            signature (np.ndarray): 미리 계산한 MinHash 서명 (선택)
+
+        Returns:
+            bool: 유사 문서 존재 여부
+        """
+        if not tokens or not self._token_sets:
+            return False
+
+        if self.exhaustive:
+            return any(self.similarity(tokens, existing) > self.threshold
+                       for existing in self._token_sets if existing)
+
+        signature = self.signature(tokens) if signature is None else signature
+        checked = set()
+        for band, key in self._band_keys(signature):
+            for position in self._buckets[band].get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                if self.similarity(tokens, self._token_sets[position]) > self.threshold:
+                    return True
+        return False
+
+    def add(self, tokens, signature=None):
+        """문서를 색인에 추가"""
+        position = len(self._token_sets)
+        self._token_sets.append(tokens)
+        if not tokens or self.exhaustive:
+            return
+
+        signature = self.signature(tokens) if signature is None else signature
+        for band, key in self._band_keys(signature):
+            self._buckets[band].setdefault(key, []).append(position)
+
+
+class NewsDeduplicator:
+    """
+    뉴스 기사 중복 판정기 (URL → 제목 → 본문 순서로 검사)
+
+    - URL: 이미 본 링크면 중복
+    - 제목: TF-IDF 코사인 유사도가 title_threshold 초과면 중복 (TitleIdf 참고)
+    - 본문: Jaccard 유사도가 content_threshold 초과면 중복
+    """
+
+    def __init__(self, title_threshold=NEWS_TITLE_SIMILARITY_THRESHOLD,
+                 content_threshold=NEWS_CONTENT_SIMILARITY_THRESHOLD, num_perm=DEDUP_NUM_PERM):
+        self.seen_urls = set()
+        self.title_idf = TitleIdf()
+        # 같은 크기의 두 집합에서 이진 코사인 c는 Jaccard c / (2 - c)에 해당 (흔한 단어 가중치가 낮아지는 만큼은 _choose_bands의 여유로 흡수)
+        self.titles = NearDuplicateIndex(title_threshold, similarity=self.title_idf.cosine, num_perm=num_perm,
+                                         candidate_threshold=title_threshold / (2 - title_threshold))
+        self.contents = NearDuplicateIndex(content_threshold, similarity=jaccard_similarity, num_perm=num_perm)
+
+    @staticmethod
+    def _signature(index, tokens):
+        """검사와 추가에 함께 쓸 서명 (전체 비교 모드이거나 토큰이 없으면 계산하지 않음)"""
+        if index.exhaustive or not tokens:
+            return None
+        return index.signature(tokens)
+
+    def is_duplicate(self, title, link, content):
+        """
+        기사 중복 여부를 판정하고, 통과한 단계까지는 기록에 추가하는 함수
+
+        Args:
+            title (str): 기사 제목
+            link (str): 기사 링크
+            content (str): 기사 본문 요약
+
+        Returns:
+            bool: 중복 여부
+        """
+        # ✅ 1. URL 중복 검사
+        if link in self.seen_urls:
+            return True
+        self.seen_urls.add(link)
+
+        # ✅ 2. 제목 중복 검사
+        tokens = title_tokens(title)
+        signature = self._signature(self.titles, tokens)
+        if self.titles.is_duplicate(tokens, signature):
+            return True
+        self.titles.add(tokens, signature)
+        self.title_idf.add(tokens)
+
+        # ✅ 3. 본문 유사도 검사
+        tokens = content_tokens(content)
+        signature = self._signature(self.contents, tokens)
+        if self.contents.is_duplicate(tokens, signature):
+            return True
+        self.contents.add(tokens, signature)
+
+        return False
@@ -0,0 +1,165 @@
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from config import SQLITE_BUSY_TIMEOUT
+from instrumentation import timed, record_cache
+
+logger = logging.getLogger(__name__)
+
+
+def _cache_key(model_name, text):
+    """청크 텍스트와 모델명으로 캐시 키(SHA-256) 생성"""
+    return hashlib.sha256(f"{model_name}\0{text}".encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite 기반 임베딩 벡터 캐시 (내용 주소 방식 + LRU 용량 제한)
+
+    키는 (모델명, 청크 텍스트)의 해시이므로 같은 기사가 다시 들어오면 재임베딩 없이 재사용된다.
+    저장 개수가 max_entries를 넘으면 가장 오래 사용되지 않은 항목부터 삭제한다.
+    """
+
+    def __init__(self, path, max_entries):
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS embeddings (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                dim INTEGER NOT NULL,
+                vector BLOB NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_access ON embeddings(last_access)")
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def get_many(self, keys):
+        """
+        여러 키의 벡터를 한 번에 조회하는 함수
+
+        Args:
+            keys (list): 캐시 키 목록
+
+        Returns:
+            dict: 키 → 벡터(list[float]) (캐시에 있는 항목만)
+        """
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+        with self._lock:
+            # SQLite 변수 개수 제한을 피하기 위해 나누어 조회
+            for i in range(0, len(unique_keys), 500):
+                batch = unique_keys[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_access = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+        return found
+
+    def put_many(self, model_name, items):
+        """
+        여러 벡터를 한 번에 저장하는 함수
+
+        Args:
+            model_name (str): 임베딩 모델명
+            items (list): (키, 벡터) 튜플 목록
+        """
+        if not items:
+            return
+
+        now = time.time()
+        rows = []
+        for key, vector in items:
+            array = np.asarray(vector, dtype=np.float32)
+            rows.append((key, model_name, int(array.shape[0]), array.tobytes(), now))
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, model, dim, vector, last_access) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+            self._count += self._conn.total_changes - before
+            if self._count > self.max_entries:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """용량 초과 시 오래 사용되지 않은 항목을 삭제 (여유분 10% 확보)"""
+        target = int(self.max_entries * 0.9)
+        excess = self._count - target
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE key IN "
+            "(SELECT key FROM embeddings ORDER BY last_access ASC LIMIT ?)",
+            (excess,)
+        )
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    임베딩 캐시를 거치는 Embeddings 래퍼
+    캐시에 없는 청크만 실제 모델로 임베딩하고, 결과를 캐시에 저장한다.
+    """
+
+    def __init__(self, embeddings, cache, model_name):
+        self.embeddings = embeddings
+        self.cache = cache
+        self.model_name = model_name
+        self.last_hits = 0
+        self.last_misses = 0
+
+    def embed_documents(self, texts):
+        keys = [_cache_key(self.model_name, text) for text in texts]
+        cached = self.cache.get_many(keys)
+
+        # 캐시 미스 청크만 모아서 한 번에 임베딩 (같은 텍스트 중복 제거)
+        missing = {}
+        for key, text in zip(keys, texts):
+            if key not in cached and key not in missing:
+                missing[key] = text
+
+        if missing:
+            with timed("embedding.model", texts=len(missing)):
+                vectors = self.embeddings.embed_documents(list(missing.values()))
+            new_items = list(zip(missing.keys(), vectors))
+            self.cache.put_many(self.model_name, new_items)
+            cached.update(new_items)
+
+        self.last_hits = len(texts) - len(missing)
+        self.last_misses = len(missing)
+        record_cache("embedding", True, self.last_hits)
+        record_cache("embedding", False, self.last_misses)
+        logger.debug("임베딩 캐시: 적중 %d개, 신규 임베딩 %d개", self.last_hits, self.last_misses)
+
+        return [list(cached[key]) for key in keys]
+
+    def embed_query(self, text):
+        return self.embeddings.embed_query(text)
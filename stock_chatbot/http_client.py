@@ -0,0 +1,61 @@
+import threading
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import HTTP_MAX_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_POOL_SIZE
+from instrumentation import record_bytes
+
+_session_lock = threading.Lock()
+_session = None
+
+
+def _record_response_size(response, *args, **kwargs):
+    """
+    응답 본문 크기를 호스트별로 기록하는 응답 훅
+    stream=True 요청은 호출자가 본문을 나눠 읽으므로 기록하지 않는다 (여기서 읽으면 본문 전체가 메모리에 올라감).
+    Content-Length가 있으면 그 값을 쓰고, 없으면 본문 길이를 쓴다 (stream이 아니면 requests가 훅 직후 어차피 읽음).
+    """
+    if kwargs.get("stream"):
+        return
+    length = response.headers.get("Content-Length", "")
+    size = int(length) if length.isdigit() else len(response.content)
+    record_bytes(urlparse(response.url).hostname or "unknown", size)
+
+
+def get_session():
+    """
+    프로세스 전역 HTTP 세션을 반환하는 함수
+    keep-alive 연결 풀을 공유하므로 페이지마다 TCP/TLS 연결을 새로 맺지 않는다.
+    일시적 오류(연결 실패, 429, 5xx)는 지수 백오프로 재시도한다.
+
+    Returns:
+        requests.Session: 공유 세션
+    """
+    global _session
+
+    if _session is not None:
+        return _session
+
+    with _session_lock:
+        if _session is None:
+            retry = Retry(
+                total=HTTP_MAX_RETRIES,
+                connect=HTTP_MAX_RETRIES,
+                read=HTTP_MAX_RETRIES,
+                backoff_factor=HTTP_BACKOFF_FACTOR,
+                status_forcelist=(429, 500, 502, 503, 504),
+                allowed_methods=frozenset(["GET", "HEAD"]),
+                raise_on_status=False,
+            )
+            adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            session.hooks["response"].append(_record_response_size)
+            _session = session
+
+    return _session
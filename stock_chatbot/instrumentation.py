@@ -0,0 +1,210 @@
+import os
+import sys
+import json
+import time
+import logging
+import threading
+from contextlib import contextmanager
+from functools import wraps
+
+from config import LOG_LEVEL, LOG_FORMAT
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_METRIC_PREFIX = "stock_chatbot"
+
+
+class _JsonFormatter(logging.Formatter):
+    """로그 레코드를 한 줄 JSON으로 출력하는 포매터 (extra={"fields": {...}} 값 포함)"""
+
+    def format(self, record):
+        payload = {
+            "ts": round(record.created, 3),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        payload.update(getattr(record, "fields", None) or {})
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, ensure_ascii=False, default=str)
+
+
+_logging_configured = False
+
+
+def configure_logging(level=None, fmt=None):
+    """
+    프로세스 로그 설정 (한 번만 적용, LOG_LEVEL / LOG_FORMAT 설정값 사용)
+
+    Args:
+        level (str): 로그 레벨 (기본값: LOG_LEVEL)
+        fmt (str): "text" 또는 "json" (기본값: LOG_FORMAT)
+    """
+    global _logging_configured
+    if _logging_configured:
+        return
+    _logging_configured = True
+
+    handler = logging.StreamHandler(sys.stderr)
+    if (fmt or LOG_FORMAT) == "json":
+        handler.setFormatter(_JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s [%(name)s] %(message)s"))
+
+    root = logging.getLogger()
+    root.addHandler(handler)
+    root.setLevel(level or LOG_LEVEL)
+
+
+def peak_rss_bytes():
+    """현재 프로세스의 최대 RSS (바이트, 측정 불가 시 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 바이트 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class Metrics:
+    """
+    프로세스 전역 계측 저장소 (스레드 안전)
+
+    - timings: 이름별 호출 횟수, 총/최대/마지막 소요 시간 (초)
+    - counters: (이름, 레이블) 별 누적 값 (가져온 바이트 수, 캐시 적중/미스 등)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timings = {}
+        self._counters = {}
+
+    def observe(self, name, seconds, **fields):
+        """소요 시간 기록 (구조화 로그로도 남김)"""
+        with self._lock:
+            stat = self._timings.setdefault(name, {"count": 0, "total": 0.0, "max": 0.0, "last": 0.0})
+            stat["count"] += 1
+            stat["total"] += seconds
+            stat["max"] = max(stat["max"], seconds)
+            stat["last"] = seconds
+        logger.debug("%s %.3fs", name, seconds,
+                     extra={"fields": {"metric": name, "seconds": round(seconds, 4), **fields}})
+
+    def incr(self, name, value=1, **labels):
+        """카운터 증가 (labels는 Prometheus 레이블로 출력)"""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self):
+        """
+        현재 계측값을 딕셔너리로 반환하는 함수
+
+        Returns:
+            dict: {"timings": {...}, "counters": {...}, "peak_rss_bytes": int 또는 None}
+        """
+        with self._lock:
+            timings = {name: dict(stat) for name, stat in self._timings.items()}
+            counters = {
+                name + ("{" + ",".join(f"{k}={v}" for k, v in labels) + "}" if labels else ""): value
+                for (name, labels), value in self._counters.items()
+            }
+        return {"timings": timings, "counters": counters, "peak_rss_bytes": peak_rss_bytes()}
+
+    def to_prometheus(self):
+        """
+        계측값을 Prometheus 텍스트 노출 형식으로 변환하는 함수
+
+        Returns:
+            str: Prometheus 텍스트
+        """
+        lines = []
+        with self._lock:
+            timings = sorted(self._timings.items())
+            counters = sorted(self._counters.items())
+
+        if timings:
+            lines.append(f"# TYPE {_METRIC_PREFIX}_duration_seconds summary")
+            for name, stat in timings:
+                label = f'{{name="{name}"}}'
+                lines.append(f"{_METRIC_PREFIX}_duration_seconds_count{label} {stat['count']}")
+                lines.append(f"{_METRIC_PREFIX}_duration_seconds_sum{label} {stat['total']:.6f}")
+            lines.append(f"# TYPE {_METRIC_PREFIX}_duration_seconds_max gauge")
+            for name, stat in timings:
+                lines.append(f'{_METRIC_PREFIX}_duration_seconds_max{{name="{name}"}} {stat["max"]:.6f}')
+
+        seen = set()
+        for (name, labels), value in counters:
+            metric = f"{_METRIC_PREFIX}_{name}_total"
+            if metric not in seen:
+                lines.append(f"# TYPE {metric} counter")
+                seen.add(metric)
+            label = "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}" if labels else ""
+            lines.append(f"{metric}{label} {value}")
+
+        rss = peak_rss_bytes()
+        if rss is not None:
+            lines.append(f"# TYPE {_METRIC_PREFIX}_peak_rss_bytes gauge")
+            lines.append(f"{_METRIC_PREFIX}_peak_rss_bytes {rss}")
+
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path):
+        """Prometheus 텍스트를 파일로 저장 (node_exporter textfile collector 등에서 수집)"""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(tmp_path, path)
+
+    def reset(self):
+        with self._lock:
+            self._timings.clear()
+            self._counters.clear()
+
+
+metrics = Metrics()
+
+
+@contextmanager
+def timed(name, **fields):
+    """
+    블록 실행 시간을 기록하는 컨텍스트 매니저
+
+    사용 예:
+        with timed("chunking"):
+            ...
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.observe(name, time.perf_counter() - started, **fields)
+
+
+def timed_function(name):
+    """함수 실행 시간을 기록하는 데코레이터"""
+
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with timed(name):
+                return func(*args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+def record_cache(cache_name, hit, count=1):
+    """캐시 적중/미스 기록"""
+    metrics.incr("cache_hits" if hit else "cache_misses", count, cache=cache_name)
+
+
+def record_bytes(source, size):
+    """가져온 바이트 수 기록 (source는 호스트명 등)"""
+    if size:
+        metrics.incr("fetched_bytes", size, source=source)
@@ -0,0 +1,241 @@
+import os
+import time
+import pickle
+import logging
+import threading
+
+import pandas as pd
+import FinanceDataReader as fdr
+
+from config import CACHE_DIR, KRX_LISTING_TTL
+
+logger = logging.getLogger(__name__)
+
+_LISTING_SNAPSHOT_PATH = os.path.join(CACHE_DIR, "krx_listing.pkl")
+_PARTIAL_MEMO_SIZE = 4096
+# 다운로드 실패로 만료된 스냅샷을 쓰는 경우 다시 시도하기까지의 최소 간격 (초)
+_REFRESH_RETRY_SECONDS = 10 * 60
+
+_index_lock = threading.Lock()
+_index = None
+
+
+def _normalize_name(name):
+    """기업명 정규화 (앞뒤 공백 제거, 소문자 변환, 공백 제거)"""
+    return str(name).strip().lower().replace(" ", "")
+
+
+def _read_snapshot():
+    """
+    디스크에 저장된 KRX 상장 목록 스냅샷을 읽는 함수
+
+    Returns:
+        tuple: (저장 시각, DataFrame) 또는 (None, None)
+    """
+    try:
+        with open(_LISTING_SNAPSHOT_PATH, "rb") as f:
+            snapshot = pickle.load(f)
+        return snapshot["saved_at"], snapshot["listing"]
+    except Exception:
+        return None, None
+
+
+def _write_snapshot(listing, saved_at):
+    """KRX 상장 목록을 디스크 스냅샷으로 저장하는 함수 (원자적 교체)"""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{_LISTING_SNAPSHOT_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"saved_at": saved_at, "listing": listing}, f)
+        os.replace(tmp_path, _LISTING_SNAPSHOT_PATH)
+    except Exception as e:
+        logger.warning("KRX 상장 목록 스냅샷 저장 실패: %s", e)
+
+
+def _load_listing(force_refresh=False):
+    """
+    KRX 상장 목록과 그 목록을 다운로드한 시각을 불러오는 함수 (load_krx_listing 참고)
+
+    Returns:
+        tuple: (다운로드 시각 또는 None, DataFrame)
+    """
+    saved_at, listing = _read_snapshot()
+    if not force_refresh and listing is not None and time.time() - saved_at < KRX_LISTING_TTL:
+        return saved_at, listing
+
+    try:
+        fresh = fdr.StockListing('KRX')
+        if fresh is not None and not fresh.empty:
+            fetched_at = time.time()
+            _write_snapshot(fresh, fetched_at)
+            return fetched_at, fresh
+    except Exception as e:
+        logger.error("KRX 상장 목록 다운로드 오류: %s", e)
+
+    return (saved_at, listing) if listing is not None else (None, pd.DataFrame())
+
+
+def load_krx_listing(force_refresh=False):
+    """
+    KRX 상장 목록을 불러오는 함수
+    디스크 스냅샷이 TTL 이내면 그대로 사용하고, 만료되었으면 새로 다운로드한다.
+    다운로드에 실패하면 만료된 스냅샷이라도 사용한다.
+
+    Args:
+        force_refresh (bool): True면 스냅샷을 무시하고 새로 다운로드
+
+    Returns:
+        pd.DataFrame: KRX 상장 목록 (실패 시 빈 DataFrame)
+    """
+    return _load_listing(force_refresh)[1]
+
+
+class KRXListingIndex:
+    """
+    KRX 상장 목록 기반 기업명 → 종목코드 조회 인덱스
+
+    - 정확 일치: 원본 기업명 / 정규화된 기업명 해시맵으로 O(1) 조회
+    - 부분 일치: 정규화된 기업명의 문자 bigram 역색인으로 후보를 좁힌 뒤 확인
+    """
+
+    def __init__(self, listing, fetched_at=None):
+        self.listing = listing
+        # TTL은 인덱스를 만든 시각이 아니라 상장 목록을 다운로드한 시각부터 계산 (스냅샷에서 만들어도 시계가 다시 시작되지 않음)
+        self.fetched_at = time.time() if fetched_at is None else fetched_at
+        self.expires_at = self.fetched_at + KRX_LISTING_TTL
+        self._names = []
+        self._codes = []
+        self._exact = {}
+        self._normalized = {}
+        self._bigrams = {}
+        self._rows = {}
+        self._partial_memo = {}
+
+        if listing is None or listing.empty or "Name" not in listing.columns:
+            return
+
+        code_column = "Code" if "Code" in listing.columns else "Symbol"
+        names = listing["Name"].astype(str).str.strip().tolist()
+        codes = listing[code_column].astype(str).str.zfill(6).tolist()
+
+        for position, (name, code) in enumerate(zip(names, codes)):
+            normalized = _normalize_name(name)
+            self._names.append(normalized)
+            self._codes.append(code)
+
+            # 상장 목록 순서상 먼저 나온 종목을 우선 (기존 iloc[0] 동작과 동일)
+            self._exact.setdefault(name, position)
+            self._normalized.setdefault(normalized, position)
+            self._rows.setdefault(code, position)
+
+            for bigram in {normalized[i:i + 2] for i in range(len(normalized) - 1)}:
+                self._bigrams.setdefault(bigram, []).append(position)
+
+    def __len__(self):
+        return len(self._codes)
+
+    def _find_partial(self, normalized_query):
+        """부분 일치 검색 - 상장 목록에서 가장 먼저 나오는 종목 위치 반환"""
+        if len(normalized_query) < 2:
+            candidates = range(len(self._names))
+        else:
+            postings = [
+                self._bigrams.get(normalized_query[i:i + 2], [])
+                for i in range(len(normalized_query) - 1)
+            ]
+            if not all(postings):
+                return None
+            # 가장 짧은 역색인 목록만 확인하면 충분 (모든 bigram을 포함해야 하므로)
+            candidates = min(postings, key=len)
+
+        for position in candidates:
+            if normalized_query in self._names[position]:
+                return position
+        return None
+
+    def lookup(self, company):
+        """
+        기업명으로 종목코드를 찾는 함수
+
+        Args:
+            company (str): 기업명
+
+        Returns:
+            str: 6자리 종목코드 또는 None
+        """
+        if not company:
+            return None
+
+        position = self._exact.get(company.strip())
+        if position is None:
+            normalized_query = _normalize_name(company)
+            position = self._normalized.get(normalized_query)
+            if position is None:
+                if normalized_query in self._partial_memo:
+                    position = self._partial_memo[normalized_query]
+                else:
+                    position = self._find_partial(normalized_query)
+                    if len(self._partial_memo) >= _PARTIAL_MEMO_SIZE:
+                        self._partial_memo.clear()
+                    self._partial_memo[normalized_query] = position
+
+        return self._codes[position] if position is not None else None
+
+    def get_row(self, code):
+        """
+        종목코드로 상장 목록의 행을 찾는 함수
+
+        Args:
+            code (str): 종목코드
+
+        Returns:
+            pd.Series: 상장 목록 행 또는 None
+        """
+        position = self._rows.get(str(code).zfill(6))
+        if position is None:
+            return None
+        return self.listing.iloc[position]
+
+
+def get_listing_index(force_refresh=False):
+    """
+    프로세스 전역 KRX 상장 목록 인덱스를 반환하는 함수
+    상장 목록을 다운로드한 지 TTL이 지나면 스냅샷을 다시 불러와 인덱스를 재구성한다.
+    다운로드에 실패해 만료된 스냅샷을 쓰는 동안은 _REFRESH_RETRY_SECONDS마다 다시 시도한다.
+
+    Args:
+        force_refresh (bool): True면 상장 목록을 새로 다운로드
+
+    Returns:
+        KRXListingIndex: 상장 목록 인덱스
+    """
+    global _index
+
+    index = _index
+    if index is not None and len(index) and not force_refresh and time.time() < index.expires_at:
+        return index
+
+    with _index_lock:
+        index = _index
+        if index is None or not len(index) or force_refresh or time.time() >= index.expires_at:
+            now = time.time()
+            fetched_at, listing = _load_listing(force_refresh=force_refresh)
+            index = KRXListingIndex(listing, fetched_at)
+            if index.expires_at <= now:
+                # 다운로드 실패로 만료된 스냅샷 사용 중 → 호출마다 다시 다운로드하지 않도록 잠시 뒤 재시도
+                index.expires_at = now + _REFRESH_RETRY_SECONDS
+            _index = index
+    return index
+
+
+def lookup_ticker(company):
+    """
+    기업명으로 6자리 종목코드를 조회하는 함수
+
+    Args:
+        company (str): 기업명
+
+    Returns:
+        str: 6자리 종목코드 또는 None
+    """
+    return get_listing_index().lookup(company)
@@ -0,0 +1,181 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_community.chat_models import ChatOpenAI
+
+from config import (LLM_CACHE_ENABLED, LLM_CACHE_PATH, LLM_CACHE_MAX_BYTES, LLM_CACHE_MAX_TEMPERATURE,
+                    SQLITE_BUSY_TIMEOUT)
+from instrumentation import record_cache
+
+logger = logging.getLogger(__name__)
+
+
+class LLMResponseStore:
+    """
+    SQLite 기반 LLM 응답 저장소 (정확히 같은 프롬프트만 재사용 + LRU 용량 제한)
+
+    키는 (모델명, temperature, 렌더링된 프롬프트 해시)이며, 저장된 응답 크기 합이 max_bytes를 넘으면
+    가장 오래 사용되지 않은 응답부터 삭제한다.
+    """
+
+    def __init__(self, path, max_bytes):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=SQLITE_BUSY_TIMEOUT, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_responses (
+                model TEXT NOT NULL,
+                temperature REAL NOT NULL,
+                prompt_hash TEXT NOT NULL,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL,
+                PRIMARY KEY (model, temperature, prompt_hash)
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_responses_last_access ON llm_responses(last_access)")
+        self._conn.commit()
+        self._size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM llm_responses").fetchone()[0]
+
+    def get(self, model, temperature, prompt_hash):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response FROM llm_responses WHERE model = ? AND temperature = ? AND prompt_hash = ?",
+                (model, temperature, prompt_hash)
+            ).fetchone()
+            if row:
+                self._conn.execute(
+                    "UPDATE llm_responses SET last_access = ? WHERE model = ? AND temperature = ? AND prompt_hash = ?",
+                    (time.time(), model, temperature, prompt_hash)
+                )
+                self._conn.commit()
+        return row[0] if row else None
+
+    def put(self, model, temperature, prompt_hash, response):
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute(
+                "SELECT size FROM llm_responses WHERE model = ? AND temperature = ? AND prompt_hash = ?",
+                (model, temperature, prompt_hash)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_responses (model, temperature, prompt_hash, response, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (model, temperature, prompt_hash, response, size, time.time())
+            )
+            self._size += size - (old[0] if old else 0)
+            if self._size > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """용량 초과 시 오래 사용되지 않은 응답을 삭제 (여유분 10% 확보)"""
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute(
+            "SELECT rowid, size FROM llm_responses ORDER BY last_access ASC"
+        ).fetchall()
+        doomed = []
+        for rowid, size in rows:
+            if self._size <= target:
+                break
+            doomed.append((rowid,))
+            self._size -= size
+        self._conn.executemany("DELETE FROM llm_responses WHERE rowid = ?", doomed)
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_responses")
+            self._conn.commit()
+            self._size = 0
+
+
+class ModelResponseCache(BaseCache):
+    """
+    모델명/temperature가 고정된 LangChain LLM 캐시 (ChatOpenAI(cache=...)에 연결)
+    LangChain이 넘겨주는 prompt는 메시지까지 모두 렌더링된 문자열이므로 그 해시를 키로 사용한다.
+    """
+
+    def __init__(self, store, model, temperature):
+        self.store = store
+        self.model = model
+        self.temperature = float(temperature)
+
+    @staticmethod
+    def _hash(prompt):
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt, llm_string):
+        response = self.store.get(self.model, self.temperature, self._hash(prompt))
+        record_cache("llm", response is not None)
+        if response is None:
+            return None
+        try:
+            return [loads(generation) for generation in json.loads(response)]
+        except Exception as e:
+            logger.warning("LLM 캐시 응답 복원 실패: %s", e)
+            return None
+
+    def update(self, prompt, llm_string, return_val):
+        try:
+            response = json.dumps([dumps(generation) for generation in return_val])
+        except Exception as e:
+            logger.warning("LLM 캐시 저장 실패: %s", e)
+            return
+        self.store.put(self.model, self.temperature, self._hash(prompt), response)
+
+    def clear(self, **kwargs):
+        self.store.clear()
+
+
+_store_lock = threading.Lock()
+_store = None
+
+
+def get_llm_response_store():
+    """프로세스 전역 LLM 응답 저장소 반환"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = LLMResponseStore(LLM_CACHE_PATH, LLM_CACHE_MAX_BYTES)
+    return _store
+
+
+def create_chat_llm(openai_api_key, model_name="gpt-4", temperature=0, streaming=False, cache=None):
+    """
+    ChatOpenAI 생성 함수 (응답 캐시 연결)
+    temperature가 LLM_CACHE_MAX_TEMPERATURE 이하인 호출은 기본으로 디스크 캐시를 거치므로,
+    같은 프롬프트(같은 뉴스로 다시 요약, 같은 질문 재구성 등)는 API를 다시 호출하지 않는다.
+
+    Args:
+        openai_api_key (str): OpenAI API 키
+        model_name (str): 모델명
+        temperature (float): temperature
+        streaming (bool): 토큰 스트리밍 여부 (캐시 적중 시에는 스트리밍 없이 바로 반환)
+        cache (bool): 캐시 사용 여부 (기본값: LLM_CACHE_ENABLED이고 temperature가 기준 이하일 때)
+
+    Returns:
+        ChatOpenAI: 채팅 모델
+    """
+    if cache is None:
+        cache = LLM_CACHE_ENABLED and temperature <= LLM_CACHE_MAX_TEMPERATURE
+
+    kwargs = {}
+    if cache:
+        kwargs["cache"] = ModelResponseCache(get_llm_response_store(), model_name, temperature)
+    return ChatOpenAI(openai_api_key=openai_api_key, model_name=model_name, temperature=temperature,
+                      streaming=streaming, **kwargs)
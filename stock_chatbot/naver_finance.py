@@ -0,0 +1,151 @@
+import re
+import threading
+
+import lxml.html
+
+# 결과 필드 (get_stock_info_naver 반환 형식과 동일)
+NAVER_FIELDS = ("현재가", "PER", "PBR", "52주 최고", "52주 최저", "시가총액", "BPS", "배당수익률", "부채비율", "당기순이익")
+
+# 📌 투자지표 표의 행 제목 접두어 → 결과 필드
+# "PER(배)", "PER l EPS(2024.06)" 등은 "PER"로 처리하고, "추정PER"처럼 접두어가 다른 행은 무시한다.
+_ROW_FIELDS = {
+    "PER": "PER",
+    "PBR": "PBR",
+    "BPS": "BPS",
+    "배당수익률": "배당수익률",
+    "부채비율": "부채비율",
+    "당기순이익": "당기순이익",
+}
+_LABEL_PATTERN = re.compile("|".join(map(re.escape, _ROW_FIELDS)))
+
+# 📌 투자정보(per_table) 값을 우선하는 필드
+# 기업실적분석(cop_analysis) 표에도 같은 행이 있지만 첫 열은 가장 오래된 연간 실적이므로,
+# 이 필드들은 투자정보 표에 값이 없을 때만 다른 표의 값을 사용한다.
+_PER_TABLE_FIELDS = frozenset({"PER", "PBR", "BPS", "배당수익률"})
+
+_TB_TYPE1_ROWS = "//table[contains(concat(' ', normalize-space(@class), ' '), ' tb_type1 ')]//tr"
+_CURRENT_PRICE = (
+    "//*[contains(concat(' ', @class, ' '), ' today ')]"
+    "//span[contains(concat(' ', @class, ' '), ' blind ')]"
+)
+_MARKET_CAP = (
+    "//*[contains(concat(' ', @class, ' '), ' first ')]"
+    "//*[contains(concat(' ', @class, ' '), ' line_dot ')]"
+)
+_NO_INFO_CELLS = "//*[contains(concat(' ', @class, ' '), ' no_info ')]//tr/td"
+_BLIND = ".//span[contains(concat(' ', @class, ' '), ' blind ')]"
+
+_parsers = threading.local()
+
+
+def _parser(encoding):
+    """스레드별 lxml HTML 파서 (인코딩별로 재사용)"""
+    cache = getattr(_parsers, "cache", None)
+    if cache is None:
+        cache = _parsers.cache = {}
+    parser = cache.get(encoding)
+    if parser is None:
+        parser = cache[encoding] = lxml.html.HTMLParser(encoding=encoding, remove_comments=True)
+    return parser
+
+
+def _text(element):
+    return element.text_content().strip()
+
+
+def _in_per_table(row):
+    """행이 투자정보(per_table) 표에 속하는지 여부"""
+    table = next(row.iterancestors("table"), None)
+    return table is not None and "per_table" in (table.get("class") or "").split()
+
+
+def _won(text):
+    """'60,300' → '60,300원' (숫자가 아니면 None)"""
+    try:
+        return f"{int(text.replace(',', '')):,}원"
+    except ValueError:
+        return None
+
+
+def parse_naver_item_page(html, encoding=None):
+    """
+    네이버 금융 종목 메인 페이지에서 주요 재무 지표를 추출하는 함수
+    lxml로 한 번 파싱한 뒤, 투자지표 표의 행을 한 번만 훑으며 행 제목으로 필드를 찾는다.
+    PER/PBR/BPS/배당수익률은 투자정보(per_table) 표 값을 우선하고, 나머지는 페이지 앞쪽 표의 값을 사용한다.
+    모든 필드가 확정되면 나머지 행은 보지 않는다.
+
+    Args:
+        html (str 또는 bytes): 페이지 본문 (bytes면 encoding 또는 페이지 meta charset으로 해석)
+        encoding (str): bytes 본문의 인코딩 (선택)
+
+    Returns:
+        dict: NAVER_FIELDS 키의 딕셔너리 (찾지 못한 값은 "N/A")
+    """
+    result = dict.fromkeys(NAVER_FIELDS, "N/A")
+    if not html:
+        return result
+
+    if isinstance(html, bytes):
+        doc = lxml.html.document_fromstring(html, parser=_parser(encoding))
+    else:
+        doc = lxml.html.document_fromstring(html)
+
+    # 1. 현재가 (오늘 시세 영역의 첫 번째 blind 값)
+    prices = doc.xpath(_CURRENT_PRICE)
+    if prices:
+        result["현재가"] = _won(_text(prices[0])) or "N/A"
+
+    # 2. 시가총액 ("시가총액\n3,599,748억원" 형식의 마지막 줄)
+    caps = doc.xpath(_MARKET_CAP)
+    if caps:
+        cap_text = _text(caps[0])
+        if "시가총액" in cap_text:
+            result["시가총액"] = cap_text.split("\n")[-1].strip()
+
+    # 3. 52주 최고/최저 (주요 시세 표)
+    for td in doc.xpath(_NO_INFO_CELLS):
+        td_text = td.text_content()
+        field = "52주 최고" if "52주 최고" in td_text else "52주 최저" if "52주 최저" in td_text else None
+        if field:
+            blind = td.xpath(_BLIND)
+            if blind:
+                result[field] = _won(_text(blind[0])) or result[field]
+
+    # 4. 투자정보 / 기업실적분석 표 (행 제목 → 필드 디스패치, 모두 확정되면 중단)
+    remaining = set(_ROW_FIELDS.values())
+    fallback = set()  # 투자정보 표가 아닌 곳에서 임시로 채운 필드
+    for row in doc.xpath(_TB_TYPE1_ROWS):
+        cells = [cell for cell in row if cell.tag in ("th", "td")]
+        if len(cells) < 2:
+            continue
+        label = _LABEL_PATTERN.match(_text(cells[0]))
+        field = _ROW_FIELDS.get(label.group(0)) if label else None
+        if field not in remaining:
+            continue
+
+        if field in _PER_TABLE_FIELDS and not _in_per_table(row):
+            if field not in fallback:
+                result[field] = _text(cells[1])
+                fallback.add(field)
+            continue
+
+        result[field] = _text(cells[1])
+        remaining.discard(field)
+        if not remaining:
+            break
+
+    return result
+
+
+def parse_naver_item_pages(pages, encoding=None):
+    """
+    여러 종목 페이지를 한 번에 추출하는 함수 (관심 종목 일괄 수집용)
+
+    Args:
+        pages (iterable): 페이지 본문 목록 (str 또는 bytes, 실패한 페이지는 None)
+        encoding (str): bytes 본문의 인코딩 (선택)
+
+    Returns:
+        list: 페이지 순서와 같은 순서의 결과 딕셔너리 목록 (None 페이지는 None)
+    """
+    return [parse_naver_item_page(page, encoding) if page is not None else None for page in pages]
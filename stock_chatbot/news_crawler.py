@@ -1,89 +1,320 @@
-import requests
+import time
+import logging
+import threading
 import urllib.parse
 import random
+from concurrent.futures import ThreadPoolExecutor
 from bs4 import BeautifulSoup
 from datetime import datetime, timedelta
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from http_client import get_session
+from config import (
+    HTTP_TIMEOUT, NEWS_MAX_PAGES, NEWS_FETCH_WORKERS, NEWS_STORE_ENABLED, NEWS_MAX_CONCURRENT_REQUESTS,
+    NEWS_SHARD_MIN_DAYS, NEWS_SHARD_DAYS, NEWS_SHARD_PAGES
+)
+from dedup import NewsDeduplicator
+from article_store import get_article_store, canonical_link, parse_naver_date
+from instrumentation import timed, metrics
 
+logger = logging.getLogger(__name__)
 
-def jaccard_similarity(str1, str2):
-    """Jaccard 유사도 계산 함수"""
-    set1, set2 = set(str1.split()), set(str2.split())
-    return len(set1 & set2) / len(set1 | set2)
+# 📌 프로세스 전체 동시 검색 요청 상한 (여러 세션/분할 구간이 동시에 수집해도 네이버에 보내는 요청 수 제한)
+_request_slots = threading.BoundedSemaphore(max(1, NEWS_MAX_CONCURRENT_REQUESTS))
 
 
-def crawl_news(company, days):
-    today = datetime.today()
-    start_date = (today - timedelta(days=days)).strftime('%Y%m%d')
-    end_date = today.strftime('%Y%m%d')
+def _fetch_page(url, headers):
+    """
+    검색 결과 페이지 하나를 가져오는 함수 (공유 세션, 타임아웃/재시도 적용)
+
+    Returns:
+        str: 페이지 HTML 또는 None (실패 시)
+    """
+    try:
+        with _request_slots, timed("crawl.page"):
+            response = get_session().get(url, headers=headers, timeout=HTTP_TIMEOUT)
+        response.raise_for_status()
+        return response.text
+    except Exception as e:
+        logger.warning("뉴스 페이지 요청 실패 (%s): %s", url, e)
+        return None
+
+
+def fetch_pages(urls, headers, max_workers=None):
+    """
+    여러 페이지를 동시에 가져오는 함수 (동시 요청 수 제한)
+
+    Args:
+        urls (list): 요청할 URL 목록
+        headers (dict): 요청 헤더
+        max_workers (int): 최대 동시 요청 수
+
+    Returns:
+        list: URL 순서와 같은 순서의 HTML 목록 (실패한 페이지는 None)
+    """
+    if not urls:
+        return []
+    workers = max(1, min(max_workers or NEWS_FETCH_WORKERS, len(urls)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="news-fetch") as executor:
+        return list(executor.map(lambda url: _fetch_page(url, headers), urls))
+
+
+_USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36"
+]
+
+
+def _search_url_template(company, start_date, end_date, latest_first=False):
+    """
+    네이버 뉴스 검색 URL 템플릿 ({}에 시작 순번)
+
+    Args:
+        latest_first (bool): True면 최신순 정렬 (증분 수집용), False면 관련도순
+    """
     encoded_query = urllib.parse.quote(company)
+    if latest_first:
+        return (f"https://search.naver.com/search.naver?where=news&query={encoded_query}&sort=1"
+                f"&nso=so:dd,p:from{start_date}to{end_date}&start={{}}")
+    return f"https://search.naver.com/search.naver?where=news&query={encoded_query}&nso=so:r,p:from{start_date}to{end_date}&start={{}}"
+
+
+def date_shards(window_start, end, shard_days):
+    """
+    검색 기간을 shard_days일 단위 구간으로 나누는 함수 (최신 구간부터)
+
+    Args:
+        window_start (datetime): 기간 시작
+        end (datetime): 기간 끝
+        shard_days (int): 구간 길이 (일)
+
+    Returns:
+        list: (시작일 "YYYYMMDD", 종료일 "YYYYMMDD") 목록
+    """
+    shard_days = max(1, shard_days)
+    first, last = window_start.date(), end.date()
+    shards = []
+    while last >= first:
+        shard_start = max(first, last - timedelta(days=shard_days - 1))
+        shards.append((shard_start.strftime('%Y%m%d'), last.strftime('%Y%m%d')))
+        last = shard_start - timedelta(days=1)
+    return shards
+
+
+def parse_search_page(html, now=None):
+    """
+    네이버 뉴스 검색 결과 페이지에서 기사 목록을 추출하는 함수
+
+    Args:
+        html (str): 검색 결과 페이지 HTML
+        now (datetime): "3시간 전" 같은 상대 날짜의 기준 시각
+
+    Returns:
+        list: {"title", "link", "content", "published_at"} 목록 (페이지 순서, 링크는 정규화, 게시 시각을 모르면 None)
+    """
+    soup = BeautifulSoup(html, 'html.parser')
+    parsed = []
+
+    for article in soup.select("ul.list_news > li"):
+        title_elem = article.select_one("a.news_tit")
+        content_elem = article.select_one("div.news_dsc")
+
+        if not title_elem:
+            continue
+
+        published_at = None
+        for info in article.select("span.info"):
+            published_at = parse_naver_date(info.text, now)
+            if published_at:
+                break
+
+        parsed.append({
+            "title": title_elem.text.strip(),
+            "link": canonical_link(title_elem['href']),
+            "content": content_elem.text.strip() if content_elem else "",
+            "published_at": published_at,
+        })
 
-    url_template = f"https://search.naver.com/search.naver?where=news&query={encoded_query}&nso=so:r,p:from{start_date}to{end_date}&start={{}}"
+    return parsed
 
-    headers = {
-        "User-Agent": random.choice([
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/92.0.4515.159 Safari/537.36",
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/93.0.4577.82 Safari/537.36"
-        ])
-    }
+
+def _accept_articles(articles, deduplicator, news):
+    """
+    중복/짧은 기사를 걸러 news에 추가하는 함수
+
+    Returns:
+        float: 중복 검사에 걸린 시간 (초)
+    """
+    dedup_seconds = 0.0
+    for article in articles:
+        # ✅ 1~3. URL / 제목 / 본문 유사도 중복 검사 (MinHash LSH)
+        dedup_started = time.perf_counter()
+        is_duplicate = deduplicator.is_duplicate(article["title"], article["link"], article["content"])
+        dedup_seconds += time.perf_counter() - dedup_started
+        if is_duplicate:
+            continue
+
+        # ✅ 4. 본문이 너무 짧거나 없는 경우 제외
+        if len(article["content"]) < 20:  # 20자 이하는 광고성, 불완전 기사일 가능성 높음
+            continue
+
+        news.append(article)
+    return dedup_seconds
+
+
+def _published_before(article, boundary):
+    """
+    기사 게시 시각이 확실히 boundary 이전인지 확인하는 함수
+    "2024.10.08." 처럼 날짜만 있는 표기는 그날 자정으로 파싱되므로 그날 끝까지 게시되었을 수 있다고 본다.
+    ("3시간 전", "2일 전" 같은 상대 표기는 실제 게시 시각보다 늦거나 같음)
+    """
+    published_at = article.get("published_at")
+    if not published_at:
+        return False
+    published = datetime.fromisoformat(published_at)
+    if published.time() == datetime.min.time():
+        published += timedelta(days=1)
+    return published < boundary
+
+
+def _crawl_until(url_template, headers, boundary, max_pages, now):
+    """
+    최신순 검색 결과를 한 페이지씩 가져오다가 boundary(이전 수집 시각) 이전에 게시된 기사가 나오면 멈추는 함수
+    저장된 기사가 보이는 것만으로는 멈추지 않는다 - 이전 수집(관련도순/구간별)이 그 사이 기사를 모두 가져왔다는 보장이 없음.
+
+    Returns:
+        tuple: (파싱된 기사 목록, 가져온 페이지 수, boundary까지 도달했는지 여부)
+            검색 결과가 끝난 경우도 도달한 것으로 본다 (더 가져올 기사가 없음).
+    """
+    parsed = []
+    fetched = 0
+    for page in range(1, max_pages + 1):
+        html = _fetch_page(url_template.format((page - 1) * 10 + 1), headers)
+        if html is None:
+            return parsed, fetched, False
+        fetched = page
+        articles = parse_search_page(html, now)
+        if not articles:
+            return parsed, fetched, True
+        parsed.extend(articles)
+        if any(_published_before(article, boundary) for article in articles):
+            return parsed, fetched, True
+    return parsed, fetched, False
+
+
+def _crawl_range(company, range_start, now, headers, max_pages, shard_days):
+    """
+    기간 전체를 동시에 가져오는 함수 (길면 날짜 구간별로 나눠 검색)
+
+    Returns:
+        tuple: (페이지 HTML 목록 (실패한 페이지는 None), 요청한 페이지 수, 구간 수)
+    """
+    if shard_days is None:
+        span_days = (now.date() - range_start.date()).days
+        shard_days = NEWS_SHARD_DAYS if span_days >= NEWS_SHARD_MIN_DAYS else 0
+    if shard_days:
+        shards = date_shards(range_start, now, shard_days)
+        urls = [
+            _search_url_template(company, shard_start, shard_end).format((page - 1) * 10 + 1)
+            for shard_start, shard_end in shards
+            for page in range(1, NEWS_SHARD_PAGES + 1)
+        ]
+        workers = NEWS_MAX_CONCURRENT_REQUESTS
+    else:
+        shards = []
+        url_template = _search_url_template(company, range_start.strftime('%Y%m%d'), now.strftime('%Y%m%d'))
+        urls = [url_template.format((page - 1) * 10 + 1) for page in range(1, max_pages + 1)]
+        workers = None
+    with timed("crawl.pages", pages=len(urls), shards=len(shards)):
+        pages = fetch_pages(urls, headers, max_workers=workers)
+    return pages, len(urls), len(shards)
+
+
+def crawl_news(company, days, max_pages=None, ticker=None, use_store=None, shard_days=None):
+    """
+    네이버 뉴스 검색에서 최근 기사를 수집하는 함수
+
+    기사 저장소를 사용하면 (기본값) 이미 수집한 기간은 다시 가져오지 않는다.
+    - 저장소의 수집 범위(시작~마지막 수집 시각)가 이번 기간 시작을 포함하면 최신순으로 한 페이지씩 가져오다가
+      마지막 수집 시각 이전에 게시된 기사가 나오면 멈추고, 나머지 기간은 저장소에서 채운다.
+      max_pages까지 가져와도 마지막 수집 시각에 닿지 못하면 (수집 공백) 마지막 수집일 이후 구간을 전체 수집한다.
+    - 처음 수집하거나 더 긴 기간을 요청하면 전체 페이지를 동시에 가져와 저장한다.
+      기간이 NEWS_SHARD_MIN_DAYS일 이상이면 날짜 구간별(일별/주별)로 나눠 동시에 검색해
+      최근 기사에만 치우치지 않게 한다 (구간별 NEWS_SHARD_PAGES페이지, 최신 구간부터 중복 제거).
+
+    Args:
+        company (str): 검색할 기업명
+        days (int): 검색 기간 (일)
+        max_pages (int): 최대 페이지 수 (기본값: NEWS_MAX_PAGES)
+        ticker (str): 종목코드 (저장소 기록용, 선택)
+        use_store (bool): 기사 저장소 사용 여부 (기본값: NEWS_STORE_ENABLED)
+        shard_days (int): 분할 구간 길이 (기본값: 기간이 NEWS_SHARD_MIN_DAYS일 이상이면 NEWS_SHARD_DAYS, 0이면 분할 안 함)
+
+    Returns:
+        list: {"title", "link", "content", "published_at"} 목록 (중복 제거 후)
+    """
+    now = datetime.now().replace(microsecond=0)
+    window_start = (now - timedelta(days=days)).replace(hour=0, minute=0, second=0, microsecond=0)
+    start_date = window_start.strftime('%Y%m%d')
+    end_date = now.strftime('%Y%m%d')
+    headers = {"User-Agent": random.choice(_USER_AGENTS)}
+    max_pages = max_pages or NEWS_MAX_PAGES
+
+    use_store = NEWS_STORE_ENABLED if use_store is None else use_store
+    store = get_article_store() if use_store else None
+    coverage = store.coverage(company) if store else None
 
     news = []
-    seen_urls = set()
-    seen_titles = []
-    seen_contents = []
+    deduplicator = NewsDeduplicator()
 
-    for page in range(1, 6):  # 1~5 페이지 크롤링
-        url = url_template.format((page - 1) * 10 + 1)
-        response = requests.get(url, headers=headers)
-        response.raise_for_status()
-        soup = BeautifulSoup(response.text, 'html.parser')
-        articles = soup.select("ul.list_news > li")
-
-        for article in articles:
-            title_elem = article.select_one("a.news_tit")
-            content_elem = article.select_one("div.news_dsc")
-
-            if not title_elem:
-                continue
-
-            title = title_elem.text.strip()
-            link = title_elem['href']
-            content = content_elem.text.strip() if content_elem else ""
-
-            # ✅ 1. URL 중복 검사
-            if link in seen_urls:
-                continue
-            seen_urls.add(link)
-
-            # ✅ 2. 제목 중복 검사 (TF-IDF 기반 유사도 체크)
-            is_duplicate_title = False
-            if seen_titles:
-                vectorizer = TfidfVectorizer().fit_transform([title] + seen_titles)
-                similarity_scores = cosine_similarity(vectorizer[0], vectorizer[1:]).flatten()
-                if any(score > 0.1 for score in similarity_scores):  # 10% 이상 유사하면 중복으로 판단
-                    is_duplicate_title = True
-
-            if is_duplicate_title:
-                continue
-            seen_titles.append(title)
-
-            # ✅ 3. 본문 유사도 검사 (Jaccard Similarity)
-            is_duplicate_content = False
-            for existing_content in seen_contents:
-                if jaccard_similarity(content, existing_content) > 0.05:  # 5% 이상 유사하면 중복 처리
-                    is_duplicate_content = True
-                    break
-
-            if is_duplicate_content:
-                continue
-            seen_contents.append(content)
-
-            # ✅ 4. 본문이 너무 짧거나 없는 경우 제외
-            if len(content) < 20:  # 20자 이하는 광고성, 불완전 기사일 가능성 높음
-                continue
-
-            news.append({"title": title, "link": link, "content": content})
-
-    return news
\ No newline at end of file
+    if coverage and coverage[0] <= window_start <= coverage[1]:
+        # 증분 수집: 새 기사만 가져오고 나머지는 저장소에서
+        covered_until = coverage[1]
+        with timed("crawl.pages", mode="incremental"):
+            parsed, fetched_pages, reached_boundary = _crawl_until(
+                _search_url_template(company, start_date, end_date, latest_first=True),
+                headers, covered_until, max_pages, now
+            )
+        pages_ok = reached_boundary
+        gap_pages = []
+        if fetched_pages and not reached_boundary:
+            # 수집 공백: 최신순 max_pages 안에 마지막 수집 시각까지 닿지 못하면 마지막 수집일부터 다시 전체 수집
+            gap_start = max(window_start, covered_until.replace(hour=0, minute=0, second=0))
+            gap_pages, _, _ = _crawl_range(company, gap_start, now, headers, max_pages, shard_days)
+            pages_ok = any(html is not None for html in gap_pages)
+            logger.info("뉴스 수집 공백 (%s): %s 이후 구간을 다시 수집합니다", company, gap_start.date())
+
+        with timed("crawl.parse_dedup", mode="incremental"):
+            dedup_seconds = _accept_articles(parsed, deduplicator, news)
+            for html in gap_pages:
+                if html is not None:
+                    dedup_seconds += _accept_articles(parse_search_page(html, now), deduplicator, news)
+            fresh = list(news)
+            fresh_links = {article["link"] for article in fresh}
+            stored = [article for article in store.recent_articles(company, window_start)
+                      if article["link"] not in fresh_links]
+            dedup_seconds += _accept_articles(stored, deduplicator, news)
+        metrics.observe("crawl.dedup", dedup_seconds)
+        logger.info("뉴스 증분 수집 (%s, %d일): 새 기사 %d개 (%d페이지, 공백 재수집 %d페이지), 저장소 %d개",
+                    company, days, len(fresh), fetched_pages, len(gap_pages), len(news) - len(fresh))
+    else:
+        # 모든 페이지를 동시에 요청하고, 중복 검사는 페이지 순서대로 진행 (결과 순서 고정)
+        pages, url_count, shard_count = _crawl_range(company, window_start, now, headers, max_pages, shard_days)
+        pages_ok = any(html is not None for html in pages)
+
+        parse_started = time.perf_counter()
+        dedup_seconds = 0.0
+        for html in pages:
+            if html is not None:
+                dedup_seconds += _accept_articles(parse_search_page(html, now), deduplicator, news)
+        metrics.observe("crawl.dedup", dedup_seconds)
+        metrics.observe("crawl.parse", time.perf_counter() - parse_started - dedup_seconds)
+        fresh = news
+        logger.info("뉴스 수집 (%s, %d일, %d페이지, 구간 %d개): %d개", company, days, url_count, shard_count, len(news))
+
+    if store:
+        store.add_articles(company, fresh, ticker=ticker)
+        # 이번 기간을 끝까지 가져온 경우에만 수집 범위 갱신 (공백이 남으면 다음에 다시 수집)
+        if pages_ok:
+            store.set_coverage(company, window_start, now)
+
+    return news
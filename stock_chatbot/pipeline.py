@@ -0,0 +1,129 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from instrumentation import metrics
+
+
+class PipelineAbort(Exception):
+    """단계 함수가 분석을 중단해야 할 때 발생시키는 예외 (사용자에게 보여줄 메시지 포함)"""
+
+
+class Stage:
+    """
+    분석 파이프라인의 한 단계
+
+    Args:
+        name (str): 단계 이름 (결과 딕셔너리 키)
+        func (callable): 실행 함수 - 의존 단계 결과를 같은 이름의 키워드 인자로 받는다
+        deps (tuple): 먼저 끝나야 하는 단계 이름 목록
+        label (str): 진행 상황 표시용 이름
+    """
+
+    def __init__(self, name, func, deps=(), label=None):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.label = label or name
+
+
+def _validate(stages):
+    """단계 이름 중복, 존재하지 않는 의존성, 순환 의존성 검사"""
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"중복된 단계 이름: {stage.name}")
+        by_name[stage.name] = stage
+
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"'{stage.name}' 단계의 의존 단계 '{dep}'가 없습니다.")
+
+    visiting, visited = set(), set()
+
+    def visit(name):
+        if name in visited:
+            return
+        if name in visiting:
+            raise ValueError(f"순환 의존성이 있습니다: {name}")
+        visiting.add(name)
+        for dep in by_name[name].deps:
+            visit(dep)
+        visiting.discard(name)
+        visited.add(name)
+
+    for stage in stages:
+        visit(stage.name)
+
+
+def run_stages(stages, max_workers=4, on_event=None, thread_initializer=None):
+    """
+    의존 관계가 없는 단계를 동시에 실행하는 DAG 스케줄러
+    진행 상황 콜백(on_event)은 항상 호출한 스레드에서 실행되므로 UI 갱신에 사용해도 안전하다.
+
+    Args:
+        stages (list): Stage 목록
+        max_workers (int): 동시에 실행할 최대 단계 수
+        on_event (callable): on_event(event, stage, elapsed) - event는 "start", "done", "error"
+        thread_initializer (callable): 작업 스레드 시작 시 호출할 함수 (선택)
+
+    Returns:
+        tuple: (단계별 결과 딕셔너리, 단계별 소요 시간(초) 딕셔너리)
+
+    Raises:
+        PipelineAbort 또는 단계 함수에서 발생한 예외 (남은 단계는 실행하지 않음)
+    """
+    _validate(stages)
+    emit = on_event or (lambda event, stage, elapsed: None)
+
+    results = {}
+    timings = {}
+    pending = list(stages)
+    running = {}
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pipeline",
+                                  initializer=thread_initializer)
+
+    def submit_ready():
+        for stage in list(pending):
+            if all(dep in results for dep in stage.deps):
+                pending.remove(stage)
+                kwargs = {dep: results[dep] for dep in stage.deps}
+                emit("start", stage, 0.0)
+                running[executor.submit(_timed_call, stage.func, kwargs)] = stage
+
+    try:
+        submit_ready()
+        while running:
+            done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    result, elapsed = future.result()
+                except BaseException as e:
+                    elapsed = getattr(e, "elapsed", 0.0)
+                    timings[stage.name] = elapsed
+                    metrics.observe(f"stage.{stage.name}", elapsed, status="error")
+                    emit("error", stage, elapsed)
+                    raise
+                results[stage.name] = result
+                timings[stage.name] = elapsed
+                metrics.observe(f"stage.{stage.name}", elapsed, status="done")
+                emit("done", stage, elapsed)
+            submit_ready()
+    finally:
+        # 실패 시 아직 시작하지 않은 단계는 취소하고, 실행 중인 단계는 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return results, timings
+
+
+def _timed_call(func, kwargs):
+    """단계 함수를 실행하고 소요 시간을 함께 반환"""
+    start = time.perf_counter()
+    try:
+        result = func(**kwargs)
+    except BaseException as e:
+        e.elapsed = time.perf_counter() - start
+        raise
+    return result, time.perf_counter() - start
@@ -0,0 +1,183 @@
+import os
+import time
+import pickle
+import logging
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from config import PRICE_STORE_DIR, PRICE_STORE_INTRADAY_REFRESH, PRICE_STORE_MINUTE_MAX_DAYS
+from trading_calendar import latest_session_date, is_market_open, MARKET_CLOSE
+
+logger = logging.getLogger(__name__)
+
+_locks_guard = threading.Lock()
+_locks = {}
+
+
+def _lock(ticker, interval):
+    """종목/주기별 저장소 갱신을 직렬화하기 위한 잠금 객체 반환"""
+    with _locks_guard:
+        return _locks.setdefault((ticker, interval), threading.Lock())
+
+
+def _path(ticker, interval):
+    return os.path.join(PRICE_STORE_DIR, f"{ticker}_{interval}.pkl")
+
+
+def _load(ticker, interval):
+    """
+    저장된 시세 데이터를 읽는 함수
+
+    Returns:
+        dict: {"bars": DataFrame, "covered_start": date, "fetched_at": float} 또는 None
+    """
+    try:
+        with open(_path(ticker, interval), "rb") as f:
+            return pickle.load(f)
+    except Exception:
+        return None
+
+
+def _save(ticker, interval, record):
+    """시세 데이터를 원자적으로 저장하는 함수"""
+    try:
+        os.makedirs(PRICE_STORE_DIR, exist_ok=True)
+        path = _path(ticker, interval)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(record, f)
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning("시세 저장 실패 (%s, %s): %s", ticker, interval, e)
+
+
+def _merge(stored, fetched):
+    """기존 봉과 새로 가져온 봉을 병합 (같은 시각은 새 값 우선)"""
+    if stored is None or stored.empty:
+        merged = fetched
+    elif fetched is None or fetched.empty:
+        merged = stored
+    else:
+        merged = pd.concat([stored, fetched])
+        merged = merged[~merged.index.duplicated(keep="last")]
+    return merged.sort_index()
+
+
+def get_daily_bars(ticker, start, end, fetch):
+    """
+    일봉 데이터를 로컬 저장소에서 가져오고, 없는 구간만 원격에서 가져오는 함수
+
+    - 저장된 마지막 봉 이후 구간만 요청 (마지막 봉은 장중 미완성일 수 있어 다시 요청)
+    - 요청 시작일이 저장 범위보다 이르면 앞쪽 구간만 추가 요청
+    - 장중에는 PRICE_STORE_INTRADAY_REFRESH 간격으로만 당일 봉을 갱신
+
+    Args:
+        ticker (str): 종목 코드
+        start (date): 시작일
+        end (date): 종료일
+        fetch (callable): fetch(ticker, start, end) → Date 인덱스 DataFrame (원격 조회 함수)
+
+    Returns:
+        pd.DataFrame: Date 인덱스 일봉 데이터 (start ~ end)
+    """
+    start = pd.Timestamp(start).date()
+    end = min(pd.Timestamp(end).date(), latest_session_date())
+
+    with _lock(ticker, "daily"):
+        record = _load(ticker, "daily") or {"bars": None, "covered_start": None, "fetched_at": 0.0}
+        bars = record["bars"]
+        ranges = []
+
+        if bars is None or bars.empty:
+            ranges.append((start, end))
+        else:
+            last = bars.index.max().date()
+            if start < record["covered_start"]:
+                ranges.append((start, record["covered_start"] - timedelta(days=1)))
+            if last < end:
+                ranges.append((last, end))
+            elif last == end and is_market_open() \
+                    and time.time() - record["fetched_at"] >= PRICE_STORE_INTRADAY_REFRESH:
+                ranges.append((end, end))
+
+        for range_start, range_end in ranges:
+            if range_start > range_end:
+                continue
+            fetched = fetch(ticker, range_start.strftime('%Y-%m-%d'), range_end.strftime('%Y-%m-%d'))
+            if fetched is not None and not fetched.empty:
+                fetched.index = pd.to_datetime(fetched.index)
+                fetched.index.name = "Date"
+                bars = _merge(bars, fetched)
+
+        if ranges:
+            covered_start = record["covered_start"]
+            record = {
+                "bars": bars,
+                "covered_start": min(start, covered_start) if covered_start else start,
+                "fetched_at": time.time(),
+            }
+            _save(ticker, "daily", record)
+
+    if bars is None or bars.empty:
+        return pd.DataFrame()
+    return bars.loc[pd.Timestamp(start):pd.Timestamp(end)].copy()
+
+
+def _expected_last_minute(now):
+    """현재 시각 기준으로 존재해야 하는 마지막 분봉 시각"""
+    if is_market_open(now):
+        return now.replace(second=0, microsecond=0) - timedelta(minutes=1)
+    return datetime.combine(latest_session_date(now), MARKET_CLOSE)
+
+
+def get_minute_bars(ticker, count, fetch):
+    """
+    분봉 데이터를 로컬 저장소에서 가져오고, 마지막 저장 봉 이후 분량만 원격에서 가져오는 함수
+    저장된 봉이 오래되어 새로 가져온 봉과 이어지지 않으면 (사이 구간을 가져올 수 없으므로) 저장된 봉을 버리고 교체한다.
+
+    Args:
+        ticker (str): 종목 코드
+        count (int): 필요한 최근 분봉 개수
+        fetch (callable): fetch(ticker, count) → "시간" 열이 있는 분봉 DataFrame (최근 count개)
+
+    Returns:
+        pd.DataFrame: 최근 count개 분봉 ("시간" 열 포함)
+    """
+    now = datetime.now()
+
+    with _lock(ticker, "minute"):
+        record = _load(ticker, "minute") or {"bars": None}
+        bars = record["bars"]
+        expected_last = _expected_last_minute(now)
+
+        if bars is None or bars.empty or len(bars) < count:
+            fetch_count = count
+        else:
+            last = bars.index.max().to_pydatetime()
+            if last >= expected_last:
+                fetch_count = 0
+            elif last.date() == expected_last.date():
+                # 같은 거래일이면 빠진 분량만 (여유분 포함)
+                fetch_count = min(count, int((expected_last - last).total_seconds() // 60) + 5)
+            else:
+                fetch_count = count
+
+        if fetch_count:
+            fetched = fetch(ticker, fetch_count)
+            if fetched is not None and not fetched.empty:
+                fetched = fetched.set_index("시간")
+                if bars is not None and not bars.empty and fetched.index.min() > bars.index.max():
+                    # 빠진 구간이 count보다 길어 이어 붙일 수 없음 → 중간이 빈 채로 남지 않도록 교체
+                    bars = fetched.sort_index()
+                else:
+                    bars = _merge(bars, fetched)
+                # 오래된 분봉 정리
+                cutoff = pd.Timestamp(now - timedelta(days=PRICE_STORE_MINUTE_MAX_DAYS))
+                bars = bars[bars.index >= cutoff]
+                _save(ticker, "minute", {"bars": bars})
+
+    if bars is None or bars.empty:
+        return pd.DataFrame()
+    return bars.tail(count).reset_index()
@@ -1,11 +1,27 @@
-import tiktoken
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+import time
+import logging
+import threading
 from langchain.embeddings import HuggingFaceEmbeddings
 from langchain.vectorstores import FAISS
-from langchain.chat_models import ChatOpenAI
 from langchain.chains import ConversationalRetrievalChain
-from langchain.memory import ConversationBufferMemory
 from langchain.prompts import PromptTemplate
+from langchain.callbacks.base import BaseCallbackHandler
+from config import (EMBEDDING_MODEL_NAME, EMBEDDING_DEVICE, EMBEDDING_BATCH_SIZE,
+                    EMBEDDING_NUM_THREADS, EMBEDDING_WARMUP, EMBEDDING_CACHE_ENABLED,
+                    EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ENTRIES)
+from embedding_cache import EmbeddingCache, CachedEmbeddings
+from ticker_vectorstore import update_ticker_vectorstore
+from token_counter import count_tokens, TokenOffsetTextSplitter
+from chat_memory import create_chat_memory, format_chat_history
+from llm_cache import create_chat_llm
+from instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+_embeddings_lock = threading.Lock()
+_embeddings = None
+_warmup_started = False
+_embedding_cache = None
 
 def tiktoken_len(text):
     """
@@ -17,9 +33,82 @@ def tiktoken_len(text):
     Returns:
         int: 토큰 길이
     """
-    tokenizer = tiktoken.get_encoding("cl100k_base")
-    tokens = tokenizer.encode(text)
-    return len(tokens)
+    # 전역 인코더 + 길이 LRU 캐시 사용 (호출마다 인코더를 새로 가져오지 않음)
+    return count_tokens(text)
+
+
+def get_embeddings():
+    """
+    프로세스 전역 임베딩 모델을 반환하는 함수
+    최초 호출 시 한 번만 모델을 로드하고, 이후에는 모든 세션이 같은 인스턴스를 공유한다.
+
+    Returns:
+        HuggingFaceEmbeddings: 임베딩 모델
+    """
+    global _embeddings
+
+    if _embeddings is not None:
+        return _embeddings
+
+    with _embeddings_lock:
+        if _embeddings is None:
+            if EMBEDDING_NUM_THREADS > 0:
+                import torch
+                torch.set_num_threads(EMBEDDING_NUM_THREADS)
+
+            embeddings = HuggingFaceEmbeddings(
+                model_name=EMBEDDING_MODEL_NAME,
+                model_kwargs={'device': EMBEDDING_DEVICE},
+                encode_kwargs={'normalize_embeddings': True, 'batch_size': EMBEDDING_BATCH_SIZE}
+            )
+
+            # 첫 요청 지연을 줄이기 위해 더미 배치로 예열
+            if EMBEDDING_WARMUP:
+                embeddings.embed_documents(["임베딩 모델 예열"] * min(EMBEDDING_BATCH_SIZE, 8))
+
+            _embeddings = embeddings
+
+    return _embeddings
+
+
+def get_cached_embeddings():
+    """
+    임베딩 캐시를 거치는 프로세스 전역 임베딩 모델을 반환하는 함수
+    캐시가 비활성화되어 있으면 원본 모델을 그대로 반환한다.
+
+    Returns:
+        Embeddings: 캐시 래퍼 또는 원본 임베딩 모델
+    """
+    global _embedding_cache
+
+    embeddings = get_embeddings()
+    if not EMBEDDING_CACHE_ENABLED:
+        return embeddings
+
+    with _embeddings_lock:
+        if _embedding_cache is None:
+            _embedding_cache = EmbeddingCache(EMBEDDING_CACHE_PATH, EMBEDDING_CACHE_MAX_ENTRIES)
+
+    return CachedEmbeddings(embeddings, _embedding_cache, EMBEDDING_MODEL_NAME)
+
+
+def warmup_embeddings(background=True):
+    """
+    앱 시작 시 임베딩 모델을 미리 로드하는 함수
+
+    Args:
+        background (bool): True면 백그라운드 스레드에서 로드 (UI를 막지 않음)
+    """
+    global _warmup_started
+
+    if _embeddings is not None or _warmup_started:
+        return
+    _warmup_started = True
+
+    if background:
+        threading.Thread(target=get_embeddings, name="embedding-warmup", daemon=True).start()
+    else:
+        get_embeddings()
 
 
 def get_text_chunks(news_data, financial_data):
@@ -58,14 +147,20 @@ def get_text_chunks(news_data, financial_data):
             if value is not None and value != 'N/A':
                 text += f"{label}: {value}\n"
 
-        # 디버깅을 위한 추가 정보
-        print(f"변환된 재무 텍스트:\n{text}")
+        logger.debug("변환된 재무 텍스트:\n%s", text)
 
         return text
 
-    # 뉴스 데이터 처리
-    news_texts = [f"{item['title']}\n{item['content']}" for item in news_data]
-    news_metadatas = [{"source": "news", "link": item["link"]} for item in news_data]
+    # 뉴스 데이터 처리 (본문을 가져온 기사는 요약문 대신 본문 사용)
+    news_texts = [f"{item['title']}\n{item.get('body') or item['content']}" for item in news_data]
+    news_metadatas = []
+    for item in news_data:
+        metadata = {"source": "news", "link": item["link"]}
+        if item.get("published_at"):
+            metadata["published_at"] = item["published_at"]
+        if item.get("body"):
+            metadata["full_text"] = True
+        news_metadatas.append(metadata)
 
     # 재무 데이터 처리 (강화된 안전성)
     financial_texts = [
@@ -75,47 +170,69 @@ def get_text_chunks(news_data, financial_data):
     ]
     financial_metadatas = [{"source": "financial"} for _ in financial_texts]
 
-    # 디버깅: 생성된 텍스트 수 확인
-    print(f"생성된 뉴스 텍스트 수: {len(news_texts)}")
-    print(f"생성된 재무 텍스트 수: {len(financial_texts)}")
+    logger.debug("생성된 텍스트 수: 뉴스 %d개, 재무 %d개", len(news_texts), len(financial_texts))
 
     # 전체 텍스트와 메타데이터 통합
     all_texts = news_texts + financial_texts
     all_metadatas = news_metadatas + financial_metadatas
 
-    text_splitter = RecursiveCharacterTextSplitter(
+    # 문서당 한 번만 인코딩하고 토큰 오프셋으로 분할
+    text_splitter = TokenOffsetTextSplitter(
         chunk_size=900,
-        chunk_overlap=100,
-        length_function=tiktoken_len
+        chunk_overlap=100
     )
 
-    # 디버깅: 최종 청크 생성 확인
-    chunks = text_splitter.create_documents(all_texts, metadatas=all_metadatas)
-    print(f"최종 생성된 청크 수: {len(chunks)}")
+    with timed("chunking", documents=len(all_texts)):
+        chunks = text_splitter.create_documents(all_texts, metadatas=all_metadatas)
+    logger.info("생성된 청크 수: %d개", len(chunks))
 
     return chunks
 
 
-def get_vectorstore(text_chunks):
+def get_vectorstore(text_chunks, ticker_krx=None, days=None):
     """
     텍스트 청크에서 벡터 저장소를 생성하는 함수
+    종목코드가 주어지면 종목별 저장소를 새로 만들지 않고 증분 갱신한다.
 
     Args:
         text_chunks (list): 텍스트 청크 목록
+        ticker_krx (str): 한국 주식 코드 (선택)
+        days (int): 기사 보관 기간 (일, 선택)
 
     Returns:
         FAISS: 생성된 벡터 저장소
     """
-    # 디버깅: 청크 내용 출력
-    for i, chunk in enumerate(text_chunks, 1):
-        print(f"청크 {i}:\n{chunk.page_content}\n---")
+    if logger.isEnabledFor(logging.DEBUG):
+        for i, chunk in enumerate(text_chunks, 1):
+            logger.debug("청크 %d (%d자): %.80s", i, len(chunk.page_content), chunk.page_content)
 
-    embeddings = HuggingFaceEmbeddings(
-        model_name="jhgan/ko-sroberta-multitask",
-        model_kwargs={'device': 'cpu'},
-        encode_kwargs={'normalize_embeddings': True}
-    )
-    return FAISS.from_documents(text_chunks, embeddings)
+    if ticker_krx:
+        return update_ticker_vectorstore(ticker_krx, text_chunks, get_cached_embeddings(), days=days)
+
+    # 캐시에 없는 청크만 임베딩하고 나머지는 캐시된 벡터로 인덱스 구성
+    with timed("faiss.build", documents=len(text_chunks)):
+        return FAISS.from_documents(text_chunks, get_cached_embeddings())
+
+
+class StreamingTokenHandler(BaseCallbackHandler):
+    """
+    LLM 토큰 스트리밍 콜백
+    새 토큰이 도착하면 지금까지 누적된 텍스트를 on_token으로 전달한다.
+    화면 갱신이 너무 잦지 않도록 min_interval(초) 간격으로만 호출한다.
+    """
+
+    def __init__(self, on_token, min_interval=0.05):
+        self.on_token = on_token
+        self.min_interval = min_interval
+        self.text = ""
+        self._last_emit = 0.0
+
+    def on_llm_new_token(self, token, **kwargs):
+        self.text += token
+        now = time.monotonic()
+        if now - self._last_emit >= self.min_interval:
+            self._last_emit = now
+            self.on_token(self.text)
 
 
 def create_financial_aware_prompt_template():
@@ -162,17 +279,23 @@ def create_chat_chain(vectorstore, openai_api_key):
     Returns:
         ConversationalRetrievalChain: 생성된 대화 체인
     """
-    llm = ChatOpenAI(openai_api_key=openai_api_key, model_name='gpt-4', temperature=0.3)
+    # 답변 생성 LLM은 토큰 스트리밍, 질문 재구성 LLM은 스트리밍 없이 사용 (재구성 문장이 화면에 섞이지 않도록)
+    llm = create_chat_llm(openai_api_key, model_name='gpt-4', temperature=0.3, streaming=True)
+    # 질문 재구성은 결정적으로 (temperature 0) 만들어 같은 이력 + 질문이면 응답 캐시 사용
+    condense_question_llm = create_chat_llm(openai_api_key, model_name='gpt-4', temperature=0)
+    # 대화 이력은 토큰 예산 안에서 최근 대화 + 이전 대화 요약으로 유지 (질문이 늘어도 프롬프트 크기 일정)
+    memory_llm = create_chat_llm(openai_api_key, model_name='gpt-4', temperature=0)
 
     # 맞춤형 프롬프트 템플릿 적용
     custom_prompt = create_financial_aware_prompt_template()
 
     return ConversationalRetrievalChain.from_llm(
         llm=llm,
+        condense_question_llm=condense_question_llm,
         chain_type="stuff",
         retriever=vectorstore.as_retriever(),
-        memory=ConversationBufferMemory(memory_key='chat_history', return_messages=True, output_key='answer'),
-        get_chat_history=lambda h: h,
+        memory=create_chat_memory(memory_llm),
+        get_chat_history=format_chat_history,
         return_source_documents=True,
         combine_docs_chain_kwargs={'prompt': custom_prompt}
     )
\ No newline at end of file
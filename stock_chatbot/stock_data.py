@@ -2,11 +2,35 @@ import pandas as pd
 import yfinance as yf
 import FinanceDataReader as fdr
 from datetime import datetime, timedelta
-import streamlit as st
-import requests
-from bs4 import BeautifulSoup
-from datetime import time
+import re
+import logging
 import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from krx_listing import lookup_ticker
+from cache import TTLCache
+from http_client import get_session
+from trading_calendar import latest_session_date, is_market_open, seconds_until_market_open
+from price_store import get_daily_bars, get_minute_bars
+from config import HTTP_TIMEOUT, CHART_TTL_1DAY, CHART_TTL_WEEK, CHART_TTL_1MONTH, CHART_TTL_1YEAR
+
+logger = logging.getLogger(__name__)
+
+CHART_PERIODS = ["1day", "week", "1month", "1year"]
+
+# Fchart API 응답의 <item data="시간|시가|고가|저가|종가|거래량"> 추출용
+_FCHART_ITEM_PATTERN = re.compile(r'<item\s+data="([^"]*)"')
+FCHART_COLUMNS = ["시간", "시가", "고가", "저가", "종가", "거래량"]
+
+_CHART_TTLS = {
+    "1day": CHART_TTL_1DAY,
+    "week": CHART_TTL_WEEK,
+    "1month": CHART_TTL_1MONTH,
+    "1year": CHART_TTL_1YEAR,
+}
+
+# (티커, 기간)별 차트 데이터 캐시 (세션 간 공유)
+_chart_cache = TTLCache("chart_data", maxsize=256)
+_chart_prefetch_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chart-prefetch")
 
 def get_recent_trading_day():
     """
@@ -15,12 +39,8 @@ def get_recent_trading_day():
     Returns:
         str: 최근 거래일(YYYY-MM-DD 형식)
     """
-    today = datetime.now()
-    if today.hour < 9:  # 9시 이전이면 전날을 기준으로
-        today -= timedelta(days=1)
-    while today.weekday() in [5, 6]:  # 토요일(5), 일요일(6)이면 하루씩 감소
-        today -= timedelta(days=1)
-    return today.strftime('%Y-%m-%d')
+    # KRX 휴장일 표 기반 (주말뿐 아니라 공휴일도 제외)
+    return latest_session_date().strftime('%Y-%m-%d')
 
 
 def get_ticker(company, source="yahoo"):
@@ -35,102 +55,137 @@ def get_ticker(company, source="yahoo"):
         str: 티커 코드
     """
     try:
-        # 데이터 로드
-        listing = fdr.StockListing('KRX')
-
-        # 입력된 회사명 정규화
-        normalized_company = company.strip().lower().replace(" ", "")
-
-        # 부분 일치 및 전체 일치 검색
-        exact_match = listing[listing['Name'].str.strip() == company.strip()]
-        partial_match = listing[
-            listing['Name']
-            .str.strip()
-            .str.lower()
-            .str.replace(" ", "")
-            .str.contains(normalized_company)
-        ]
-
-        # 매칭 로직
-        if not exact_match.empty:
-            ticker_row = exact_match.iloc[0]
-        elif not partial_match.empty:
-            ticker_row = partial_match.iloc[0]
-        else:
-            print("일치하는 기업을 찾을 수 없습니다.")
+        # 프로세스 전역 상장 목록 인덱스에서 조회 (정확 일치 → 부분 일치)
+        krx_ticker = lookup_ticker(company)
+        if krx_ticker is None:
+            logger.info("일치하는 기업을 찾을 수 없습니다: %s", company)
             return None
 
-        # 티커 코드 생성
-        krx_ticker = str(ticker_row["Code"]).zfill(6)
-
         if source == "yahoo":
             return krx_ticker + ".KS"  # 야후 파이낸스용 티커 변환
         return krx_ticker  # FinanceDataReader용 티커
 
     except Exception as e:
-        print(f"티커 조회 중 오류 발생: {e}")
+        logger.error("티커 조회 중 오류 발생: %s", e)
         return None
+def _empty_fchart_frame():
+    """열 타입이 지정된 빈 분봉 DataFrame (빈 결과에도 .dt 접근이 가능하도록)"""
+    df = pd.DataFrame({"시간": pd.Series(dtype="datetime64[ns]")})
+    for column in FCHART_COLUMNS[1:]:
+        df[column] = pd.Series(dtype="float64")
+    return df
+
+
+def parse_fchart_xml(text):
+    """
+    네이버 Fchart API 응답(XML)을 분봉 DataFrame으로 변환하는 함수
+    모든 <item data="..."> 값을 정규식으로 한 번에 추출하고, 열 단위로 벡터화하여 변환한다.
+
+    Args:
+        text (str): Fchart API 응답 본문
+
+    Returns:
+        pd.DataFrame: 시간, 시가, 고가, 저가, 종가, 거래량 (정규장 09:00 ~ 15:30만)
+    """
+    rows = _FCHART_ITEM_PATTERN.findall(text)
+    if not rows:
+        return _empty_fchart_frame()
+
+    parts = pd.Series(rows).str.split("|", expand=True)
+    if parts.shape[1] < len(FCHART_COLUMNS):
+        return _empty_fchart_frame()
+    parts = parts.iloc[:, :len(FCHART_COLUMNS)]
+    parts.columns = FCHART_COLUMNS
+
+    df = pd.DataFrame({"시간": pd.to_datetime(parts["시간"], format="%Y%m%d%H%M", errors="coerce")})
+    for column in FCHART_COLUMNS[1:]:
+        df[column] = pd.to_numeric(parts[column], errors="coerce")  # "null" → NaN
+
+    # 필드가 모자라거나 종가가 없는 행 제외
+    valid = df["시간"].notna() & df["종가"].notna() & parts["거래량"].notna()
+
+    # 📌 ✅ 9시 ~ 15시 30분 데이터만 필터링 (분 단위 정수 비교)
+    minutes = df["시간"].dt.hour * 60 + df["시간"].dt.minute
+    valid &= (minutes >= 9 * 60) & (minutes <= 15 * 60 + 30)
+
+    return df[valid].reset_index(drop=True)
+
+
 # 📌 네이버 Fchart API에서 분봉 데이터 가져오기 (최신 거래일 탐색 포함)
-def get_naver_fchart_minute_data(stock_code, minute="1", days=1):
+def fetch_fchart_minute_bars(stock_code, count):
     """
-    네이버 금융 Fchart API에서 분봉 데이터를 더 효율적으로 가져오기
+    네이버 Fchart API에서 최근 분봉 count개를 요청하는 함수
 
     Args:
         stock_code (str): 종목 코드
-        minute (str): 분 단위 (기본 1분)
-        days (int): 조회 일수
+        count (int): 요청할 분봉 개수
 
     Returns:
-        pd.DataFrame: 분봉 데이터
+        pd.DataFrame: 분봉 데이터 (실패 시 빈 DataFrame)
     """
-    now = datetime.now()
+    url = f"https://fchart.stock.naver.com/sise.nhn?symbol={stock_code}&timeframe=minute&count={count}&requestType=0"
 
-    if now.hour < 9:
-        now -= timedelta(days=1)
+    try:
+        response = get_session().get(url, timeout=HTTP_TIMEOUT)
+    except Exception as e:
+        logger.error("분봉 데이터 요청 오류: %s", e)
+        return pd.DataFrame()
 
-    # 📌 최신 거래일 찾기 (공휴일 대응)
-    while True:
-        target_date = now.strftime("%Y-%m-%d") if days == 1 else None
-        url = f"https://fchart.stock.naver.com/sise.nhn?symbol={stock_code}&timeframe=minute&count={days * 78}&requestType=0"
-        response = requests.get(url)
+    if response.status_code != 200:
+        return pd.DataFrame()  # 요청 실패 시 빈 데이터 반환
 
-        if response.status_code != 200:
-            return pd.DataFrame()  # 요청 실패 시 빈 데이터 반환
+    # 📌 전체 응답을 한 번에 파싱 (9시 ~ 15시 30분 필터 포함)
+    return parse_fchart_xml(response.text)
 
-        soup = BeautifulSoup(response.text, "lxml")
 
-        data_list = []
-        for item in soup.find_all("item"):
-            values = item["data"].split("|")
-            if len(values) < 6:
-                continue
+def _fetch_daily_fdr(ticker, start_date, end_date):
+    """FinanceDataReader에서 일봉 구간을 요청하는 함수 (로컬 시세 저장소의 원격 조회용)"""
+    return fdr.DataReader(ticker, start_date, end_date)
 
-            time_str, _, _, _, close, _ = values
-            if close == "null":
-                continue
 
-            time_val = datetime.strptime(time_str, "%Y%m%d%H%M")
-            close = float(close)
+def get_daily_ohlcv(ticker, start_date, end_date):
+    """
+    일봉 데이터를 로컬 시세 저장소를 거쳐 가져오는 함수
+    저장된 구간은 다시 요청하지 않고, 새 봉만 FinanceDataReader에서 가져온다.
 
-            if target_date:
-                if time_val.strftime("%Y-%m-%d") == target_date:
-                    data_list.append([time_val, close])
-            else:
-                data_list.append([time_val, close])
+    Args:
+        ticker (str): 종목 코드
+        start_date (str 또는 date): 시작일
+        end_date (str 또는 date): 종료일
 
-        df = pd.DataFrame(data_list, columns=["시간", "종가"])
+    Returns:
+        pd.DataFrame: Date 인덱스 일봉 데이터 (Open, High, Low, Close, Volume 등)
+    """
+    return get_daily_bars(ticker, start_date, end_date, _fetch_daily_fdr)
 
-        # 📌 ✅ 9시 ~ 15시 30분 데이터만 필터링
-        df["시간"] = pd.to_datetime(df["시간"])
-        df = df[(df["시간"].dt.time >= time(9, 0)) & (df["시간"].dt.time <= time(15, 30))]
 
-        # ✅ 데이터가 없는 경우 → 하루 전으로 이동하여 다시 시도
-        if df.empty:
-            now -= timedelta(days=1)
-            while now.weekday() in [5, 6]:  # 토요일(5) 또는 일요일(6)
-                now -= timedelta(days=1)
-        else:
-            break  # 데이터를 찾았으면 반복 종료
+def get_naver_fchart_minute_data(stock_code, minute="1", days=1):
+    """
+    네이버 금융 Fchart API에서 분봉 데이터를 더 효율적으로 가져오기
+
+    Args:
+        stock_code (str): 종목 코드
+        minute (str): 분 단위 (기본 1분)
+        days (int): 조회 일수
+
+    Returns:
+        pd.DataFrame: 분봉 데이터
+    """
+    # 📌 최신 거래일은 거래일 달력으로 계산 (휴장일마다 재요청하지 않음)
+    target_date = latest_session_date() if days == 1 else None
+
+    # 📌 로컬 분봉 저장소 사용 (마지막 저장 봉 이후 분량만 요청)
+    df = get_minute_bars(stock_code, days * 78, fetch_fchart_minute_bars)
+    if df.empty:
+        return df
+
+    if target_date and not df.empty:
+        session_dates = df["시간"].dt.normalize()
+        target = pd.Timestamp(target_date)
+        # 아직 해당 거래일 데이터가 반영되지 않았으면 응답에 있는 가장 최근 거래일 사용
+        if not (session_dates == target).any():
+            target = session_dates[session_dates <= target].max()
+        df = df[session_dates == target].reset_index(drop=True)
 
     return df
 
@@ -142,13 +197,13 @@ def get_daily_stock_data_fdr(ticker, period):
         ticker (str): 티커 코드
         period (str): 기간 ("1month" 또는 "1year")
     Returns:
-        DataFrame: 주식 데이터
+        DataFrame: 주식 데이터 (실패 시 빈 DataFrame, 오류 메시지는 attrs["error"])
     """
     try:
         end_date = get_recent_trading_day()
         start_date = (datetime.strptime(end_date, '%Y-%m-%d') - timedelta(
             days=30 if period == "1month" else 365)).strftime('%Y-%m-%d')
-        df = fdr.DataReader(ticker, start_date, end_date)
+        df = get_daily_ohlcv(ticker, start_date, end_date)
         if df.empty:
             return pd.DataFrame()
         df = df.reset_index()
@@ -156,8 +211,11 @@ def get_daily_stock_data_fdr(ticker, period):
         df = df[df["Date"].dt.weekday < 5].reset_index(drop=True)  # ✅ 주말 데이터 제거
         return df
     except Exception as e:
-        st.error(f"FinanceDataReader 데이터 불러오기 오류: {e}")
-        return pd.DataFrame()
+        # 백그라운드 프리페치 스레드에서도 호출되므로 여기서 st.error를 쓰지 않고 호출자(화면 스레드)에 오류를 넘김
+        logger.error("FinanceDataReader 데이터 불러오기 오류 (%s, %s): %s", ticker, period, e)
+        df = pd.DataFrame()
+        df.attrs["error"] = f"FinanceDataReader 데이터 불러오기 오류: {e}"
+        return df
 
 
 def standardize_company_name(company_name):
@@ -182,3 +240,50 @@ def standardize_company_name(company_name):
     ]
 
     return ' '.join(standardized_words).strip()
+
+
+def _chart_ttl(period):
+    """기간별 차트 데이터 유효 시간 (분봉은 장 마감 후 다음 개장까지 변하지 않음)"""
+    ttl = _CHART_TTLS.get(period, CHART_TTL_1DAY)
+    if period in ["1day", "week"] and not is_market_open():
+        ttl = max(ttl, seconds_until_market_open())
+    return ttl
+
+
+def _load_chart_data(ticker, period):
+    """기간에 맞는 소스에서 차트 데이터를 가져오는 함수"""
+    if period in ["1day", "week"]:
+        return get_naver_fchart_minute_data(ticker, days=1 if period == "1day" else 7)
+    return get_daily_stock_data_fdr(ticker, period=period)
+
+
+def get_chart_data(ticker, period):
+    """
+    차트용 주가 데이터를 캐시를 거쳐 가져오는 함수
+
+    Args:
+        ticker (str): 종목 코드
+        period (str): 기간 ("1day", "week", "1month", "1year")
+
+    Returns:
+        pd.DataFrame: 주가 데이터 (호출자가 수정해도 캐시에 영향 없도록 복사본, 조회 오류는 attrs["error"])
+    """
+    df = _chart_cache.get_or_set(
+        (ticker, period),
+        lambda: _load_chart_data(ticker, period),
+        ttl=lambda _df: _chart_ttl(period),
+        should_cache=lambda df: df is not None and not df.empty
+    )
+    return df.copy() if df is not None else pd.DataFrame()
+
+
+def prefetch_chart_data(ticker, periods=None):
+    """
+    여러 기간의 차트 데이터를 백그라운드에서 미리 캐시에 올리는 함수
+
+    Args:
+        ticker (str): 종목 코드
+        periods (list): 미리 가져올 기간 목록 (기본값: 전체 기간)
+    """
+    for period in periods or CHART_PERIODS:
+        _chart_prefetch_executor.submit(get_chart_data, ticker, period)
@@ -0,0 +1,186 @@
+import os
+import time
+import uuid
+import hashlib
+import logging
+import threading
+from datetime import datetime
+
+from langchain.vectorstores import FAISS
+from langchain_core.documents import Document
+
+from config import VECTORSTORE_DIR
+from instrumentation import timed
+
+logger = logging.getLogger(__name__)
+
+_locks_guard = threading.Lock()
+_ticker_locks = {}
+
+
+def _ticker_lock(ticker_krx):
+    """종목별 저장소 갱신을 직렬화하기 위한 잠금 객체 반환"""
+    with _locks_guard:
+        return _ticker_locks.setdefault(ticker_krx, threading.Lock())
+
+
+def _store_path(ticker_krx):
+    return os.path.join(VECTORSTORE_DIR, str(ticker_krx).zfill(6))
+
+
+def _document_id(link, content_hash, chunk_number):
+    """뉴스 청크의 고정 ID (같은 기사 링크 + 내용 + 청크 순번이면 항상 같은 ID)"""
+    return hashlib.sha1(f"{link}#{content_hash}#{chunk_number}".encode("utf-8")).hexdigest()
+
+
+def _content_hashes(text_chunks):
+    """기사 링크별 내용 해시 (청크 텍스트를 순서대로 이어서 계산)"""
+    digests = {}
+    for chunk in text_chunks:
+        link = chunk.metadata.get("link")
+        if chunk.metadata.get("source") == "news" and link:
+            digests.setdefault(link, hashlib.sha1()).update(chunk.page_content.encode("utf-8") + b"\0")
+    return {link: digest.hexdigest() for link, digest in digests.items()}
+
+
+def _iter_documents(vectorstore):
+    """저장소의 (문서 ID, 문서) 목록 (docstore 내부 구조 대신 공개 조회 사용)"""
+    for doc_id in list(vectorstore.index_to_docstore_id.values()):
+        doc = vectorstore.docstore.search(doc_id)
+        if isinstance(doc, Document):
+            yield doc_id, doc
+
+
+def _document_timestamp(metadata):
+    """문서 시각 (게시 시각이 있으면 게시 시각, 없으면 수집 시각)"""
+    published_at = metadata.get("published_at")
+    if published_at:
+        try:
+            return datetime.fromisoformat(published_at).timestamp()
+        except (TypeError, ValueError):
+            pass
+    return metadata.get("crawled_at", 0)
+
+
+def load_ticker_vectorstore(ticker_krx, embeddings):
+    """
+    디스크에 저장된 종목별 벡터 저장소를 불러오는 함수
+
+    Args:
+        ticker_krx (str): 한국 주식 코드
+        embeddings (Embeddings): 임베딩 모델
+
+    Returns:
+        FAISS: 벡터 저장소 또는 None (저장된 것이 없거나 읽기 실패 시)
+    """
+    path = _store_path(ticker_krx)
+    if not os.path.exists(os.path.join(path, "index.faiss")):
+        return None
+
+    try:
+        try:
+            return FAISS.load_local(path, embeddings, allow_dangerous_deserialization=True)
+        except TypeError:
+            # allow_dangerous_deserialization 인자가 없는 구버전 langchain
+            return FAISS.load_local(path, embeddings)
+    except Exception as e:
+        logger.error("벡터 저장소 불러오기 오류 (%s): %s", ticker_krx, e)
+        return None
+
+
+def update_ticker_vectorstore(ticker_krx, text_chunks, embeddings, days=None):
+    """
+    종목별 벡터 저장소를 새로 만들지 않고 증분 갱신하는 함수
+
+    - 이미 저장된 기사(링크 기준)는 내용이 같으면 건너뛰고, 내용이 바뀌었으면 (예: 요약문 → 기사 본문) 교체
+      단, 본문으로 저장된 기사를 요약문으로 되돌리지는 않는다.
+    - 재무 데이터 청크는 매번 최신 값으로 교체
+    - 조회 기간(days)보다 오래된 기사는 메타데이터 기준으로 삭제
+    - 갱신 결과는 디스크에 저장되어 프로세스 재시작 후에도 유지
+
+    Args:
+        ticker_krx (str): 한국 주식 코드
+        text_chunks (list): 이번 분석에서 생성된 텍스트 청크 목록
+        embeddings (Embeddings): 임베딩 모델
+        days (int): 기사 보관 기간 (일, None이면 삭제하지 않음)
+
+    Returns:
+        FAISS: 갱신된 벡터 저장소 (모든 문서가 만료되고 새 청크가 없으면 빈 저장소)
+    """
+    now = time.time()
+    content_hashes = _content_hashes(text_chunks)
+    full_text_links = {chunk.metadata.get("link") for chunk in text_chunks if chunk.metadata.get("full_text")}
+
+    with _ticker_lock(ticker_krx):
+        vectorstore = load_ticker_vectorstore(ticker_krx, embeddings)
+
+        stored = {}  # 링크 → (내용 해시, 본문 여부, 문서 ID 목록)
+        stale_ids = []
+        total_documents = 0
+        if vectorstore is not None:
+            cutoff = now - days * 86400 if days else None
+
+            for doc_id, doc in _iter_documents(vectorstore):
+                total_documents += 1
+                metadata = doc.metadata
+                link = metadata.get("link")
+                if metadata.get("source") == "financial":
+                    stale_ids.append(doc_id)
+                elif cutoff is not None and link not in content_hashes and _document_timestamp(metadata) < cutoff:
+                    stale_ids.append(doc_id)
+                else:
+                    entry = stored.setdefault(link, (metadata.get("content_hash"), bool(metadata.get("full_text")), []))
+                    entry[2].append(doc_id)
+
+        # 새로 추가할 청크 선별 (같은 링크는 내용이 바뀐 경우에만 기존 청크를 지우고 교체)
+        replaced_links = set()
+        for link, content_hash in content_hashes.items():
+            if link not in stored:
+                continue
+            stored_hash, stored_full_text, doc_ids = stored[link]
+            if stored_hash == content_hash or (stored_full_text and link not in full_text_links):
+                continue
+            stale_ids.extend(doc_ids)
+            replaced_links.add(link)
+
+        new_chunks = []
+        new_ids = []
+        chunk_numbers = {}
+        for chunk in text_chunks:
+            link = chunk.metadata.get("link")
+            metadata = {**chunk.metadata}
+            metadata.setdefault("crawled_at", now)
+            if chunk.metadata.get("source") == "news" and link:
+                if link in stored and link not in replaced_links:
+                    continue
+                chunk_number = chunk_numbers.get(link, 0)
+                chunk_numbers[link] = chunk_number + 1
+                metadata["content_hash"] = content_hashes[link]
+                new_ids.append(_document_id(link, content_hashes[link], chunk_number))
+            else:
+                new_ids.append(uuid.uuid4().hex)
+            # 호출자의 청크 메타데이터는 바꾸지 않도록 복사본 저장
+            new_chunks.append(Document(page_content=chunk.page_content, metadata=metadata))
+
+        if vectorstore is None or (new_chunks and len(stale_ids) == total_documents):
+            # 저장소가 없거나 모든 문서가 만료/교체된 경우 새로 생성
+            if not new_chunks:
+                return vectorstore
+            with timed("faiss.build", ticker=ticker_krx, documents=len(new_chunks)):
+                vectorstore = FAISS.from_documents(new_chunks, embeddings, ids=new_ids)
+        else:
+            with timed("faiss.update", ticker=ticker_krx, documents=len(new_chunks)):
+                if stale_ids:
+                    vectorstore.delete(stale_ids)
+                if new_chunks:
+                    vectorstore.add_documents(new_chunks, ids=new_ids)
+
+        logger.info("벡터 저장소 갱신 (%s): 추가 %d개, 삭제 %d개 (내용 교체 기사 %d개)",
+                    ticker_krx, len(new_chunks), len(stale_ids), len(replaced_links))
+
+        try:
+            vectorstore.save_local(_store_path(ticker_krx))
+        except Exception as e:
+            logger.error("벡터 저장소 저장 오류 (%s): %s", ticker_krx, e)
+
+        return vectorstore
@@ -0,0 +1,128 @@
+import copy
+import threading
+from functools import lru_cache
+
+import tiktoken
+from langchain_core.documents import Document
+from langchain.text_splitter import TextSplitter
+
+from config import TOKENIZER_ENCODING, TOKEN_LEN_CACHE_SIZE, TOKENIZER_NUM_THREADS
+
+_encoder_lock = threading.Lock()
+_encoder = None
+
+
+def get_encoder():
+    """
+    프로세스 전역 tiktoken 인코더를 반환하는 함수 (최초 1회만 로드)
+
+    Returns:
+        tiktoken.Encoding: 인코더
+    """
+    global _encoder
+
+    if _encoder is None:
+        with _encoder_lock:
+            if _encoder is None:
+                _encoder = tiktoken.get_encoding(TOKENIZER_ENCODING)
+    return _encoder
+
+
+@lru_cache(maxsize=TOKEN_LEN_CACHE_SIZE)
+def count_tokens(text):
+    """
+    텍스트의 토큰 수를 계산하는 함수 (같은 텍스트는 LRU 캐시에서 반환)
+
+    Args:
+        text (str): 토큰 수를 셀 텍스트
+
+    Returns:
+        int: 토큰 수
+    """
+    return len(get_encoder().encode(text))
+
+
+def encode_batch(texts, num_threads=TOKENIZER_NUM_THREADS):
+    """
+    여러 텍스트를 한 번에 인코딩하는 함수 (tiktoken 내부 스레드 병렬 처리)
+
+    Args:
+        texts (list): 텍스트 목록
+        num_threads (int): 인코딩 스레드 수
+
+    Returns:
+        list: 텍스트별 토큰 ID 목록
+    """
+    return get_encoder().encode_batch(list(texts), num_threads=num_threads)
+
+
+def count_tokens_batch(texts):
+    """
+    여러 텍스트의 토큰 수를 한 번에 계산하는 함수
+
+    Args:
+        texts (list): 텍스트 목록
+
+    Returns:
+        list: 텍스트별 토큰 수
+    """
+    return [len(tokens) for tokens in encode_batch(texts)]
+
+
+class TokenOffsetTextSplitter(TextSplitter):
+    """
+    토큰 오프셋 기반 텍스트 분할기
+
+    문서를 한 번만 인코딩한 뒤 토큰 위치로 청크 경계를 정하고, 토큰 → 문자 오프셋으로 원문을 자른다.
+    분할 지점을 찾을 때 부분 문자열을 다시 인코딩하지 않으며, 가능하면 문단/줄/공백 경계에서 자른다.
+    """
+
+    def __init__(self, chunk_size=900, chunk_overlap=100, separators=("\n\n", "\n", " "), **kwargs):
+        super().__init__(chunk_size=chunk_size, chunk_overlap=chunk_overlap, length_function=count_tokens, **kwargs)
+        self._separators = separators
+
+    def _find_boundary(self, text, offsets, start, end):
+        """end 이전에서 구분자 바로 뒤에 오는 토큰 위치를 찾는 함수 (청크가 절반 이하로 줄어들지 않는 범위)"""
+        lower = start + max(1, self._chunk_size // 2)
+        for separator in self._separators:
+            for position in range(end, lower, -1):
+                char_offset = offsets[position]
+                if text.startswith(separator, char_offset - len(separator)) or text.startswith(separator, char_offset):
+                    return position
+        return end
+
+    def _split_tokens(self, text, tokens):
+        """인코딩된 토큰으로 텍스트를 청크 목록으로 분할"""
+        if len(tokens) <= self._chunk_size:
+            stripped = text.strip()
+            return [stripped] if stripped else []
+
+        _, offsets = get_encoder().decode_with_offsets(tokens)
+        total = len(tokens)
+        chunks = []
+        start = 0
+        while start < total:
+            end = min(start + self._chunk_size, total)
+            if end < total:
+                end = self._find_boundary(text, offsets, start, end)
+
+            char_end = offsets[end] if end < total else len(text)
+            chunk = text[offsets[start]:char_end].strip()
+            if chunk:
+                chunks.append(chunk)
+            if end >= total:
+                break
+            start = max(end - self._chunk_overlap, start + 1)
+        return chunks
+
+    def split_text(self, text):
+        return self._split_tokens(text, get_encoder().encode(text))
+
+    def create_documents(self, texts, metadatas=None):
+        """모든 텍스트를 한 번에 배치 인코딩한 뒤 청크 문서로 변환"""
+        metadatas = metadatas or [{}] * len(texts)
+        documents = []
+        for text, tokens, metadata in zip(texts, encode_batch(texts), metadatas):
+            for chunk in self._split_tokens(text, tokens):
+                documents.append(Document(page_content=chunk, metadata=copy.deepcopy(metadata)))
+        return documents
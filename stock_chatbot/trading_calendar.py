@@ -0,0 +1,226 @@
+import bisect
+import logging
+import threading
+from datetime import date, datetime, time, timedelta
+
+from config import KRX_HOLIDAYS_FILE
+
+logger = logging.getLogger(__name__)
+
+MARKET_OPEN = time(9, 0)
+MARKET_CLOSE = time(15, 30)
+
+# 📌 KRX 휴장일 (주말 제외, 공휴일/대체공휴일/선거일/연말 휴장일)
+KRX_HOLIDAYS = {
+    # 2024
+    "2024-01-01", "2024-02-09", "2024-02-12", "2024-03-01", "2024-04-10", "2024-05-01",
+    "2024-05-06", "2024-05-15", "2024-06-06", "2024-08-15", "2024-09-16", "2024-09-17",
+    "2024-09-18", "2024-10-01", "2024-10-03", "2024-10-09", "2024-12-25", "2024-12-31",
+    # 2025
+    "2025-01-01", "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30", "2025-03-03",
+    "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03", "2025-06-06", "2025-08-15",
+    "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-12-25",
+    "2025-12-31",
+    # 2026
+    "2026-01-01", "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02", "2026-05-01",
+    "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17", "2026-09-24", "2026-09-25",
+    "2026-10-05", "2026-10-09", "2026-12-25", "2026-12-31",
+    # 2027 (설날·광복절·개천절·한글날·성탄절 대체공휴일 포함)
+    "2027-01-01", "2027-02-08", "2027-02-09", "2027-03-01", "2027-05-05", "2027-05-13",
+    "2027-08-16", "2027-09-14", "2027-09-15", "2027-09-16", "2027-10-04", "2027-10-11",
+    "2027-12-27", "2027-12-31",
+}
+
+# 미리 계산해 둘 거래일 범위
+_SESSION_RANGE_START = date(2015, 1, 1)
+_SESSION_RANGE_END = date(2030, 12, 31)
+
+_sessions_lock = threading.Lock()
+_holidays = None
+_holiday_years = None
+_sessions = None
+_warned_years = set()
+
+
+def _load_holidays():
+    """내장 휴장일 표 + 추가 휴장일 파일을 date 집합으로 반환"""
+    holidays = {date.fromisoformat(value) for value in KRX_HOLIDAYS}
+    try:
+        with open(KRX_HOLIDAYS_FILE, encoding="utf-8") as f:
+            for line in f:
+                line = line.split("#", 1)[0].strip()
+                if line:
+                    holidays.add(date.fromisoformat(line))
+    except FileNotFoundError:
+        pass
+    except ValueError as e:
+        logger.warning("휴장일 파일 형식 오류: %s", e)
+    return holidays
+
+
+def _get_sessions():
+    """거래일 목록(정렬)을 한 번만 계산하여 반환"""
+    global _holidays, _holiday_years, _sessions
+
+    if _sessions is None:
+        with _sessions_lock:
+            if _sessions is None:
+                holidays = _load_holidays()
+                sessions = []
+                day = _SESSION_RANGE_START
+                while day <= _SESSION_RANGE_END:
+                    if day.weekday() < 5 and day not in holidays:
+                        sessions.append(day)
+                    day += timedelta(days=1)
+                _holidays = holidays
+                _holiday_years = {day.year for day in holidays}
+                _sessions = sessions
+    return _sessions
+
+
+def _as_date(value):
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, str):
+        return date.fromisoformat(value[:10])
+    return value
+
+
+def _warn_missing_year(day):
+    """휴장일 데이터가 없는 연도를 조회하면 연도별로 한 번 경고 (주말만 제외하고 판단하게 됨)"""
+    if day.year in _holiday_years or day.year in _warned_years:
+        return
+    with _sessions_lock:
+        if day.year in _warned_years:
+            return
+        _warned_years.add(day.year)
+    logger.warning("%d년 KRX 휴장일 데이터가 없어 주말만 제외합니다 (KRX_HOLIDAYS 또는 %s에 추가 필요)",
+                   day.year, KRX_HOLIDAYS_FILE)
+
+
+def is_trading_day(day):
+    """
+    거래일인지 확인하는 함수 (주말, KRX 휴장일 제외)
+
+    Args:
+        day (date, datetime 또는 str): 확인할 날짜
+
+    Returns:
+        bool: 거래일 여부
+    """
+    day = _as_date(day)
+    _get_sessions()
+    _warn_missing_year(day)
+    return day.weekday() < 5 and day not in _holidays
+
+
+def previous_trading_day(day, count=1):
+    """
+    주어진 날짜 이전(당일 제외)의 count번째 거래일을 구하는 함수
+
+    Args:
+        day (date, datetime 또는 str): 기준 날짜
+        count (int): 몇 번째 이전 거래일인지
+
+    Returns:
+        date: 거래일
+    """
+    day = _as_date(day)
+    sessions = _get_sessions()
+    _warn_missing_year(day)
+    position = bisect.bisect_left(sessions, day) - count
+    if 0 <= position < len(sessions) and sessions[-1] >= day:
+        return sessions[position]
+
+    # 미리 계산한 범위를 벗어난 경우 하루씩 이동
+    while count > 0:
+        day -= timedelta(days=1)
+        if is_trading_day(day):
+            count -= 1
+    return day
+
+
+def latest_session_date(now=None):
+    """
+    가장 최근 거래일(정규장이 열렸거나 열려 있는 날)을 구하는 함수
+    거래일이라도 개장(09:00) 전이면 이전 거래일을 반환한다.
+
+    Args:
+        now (datetime): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        date: 최근 거래일
+    """
+    now = now or datetime.now()
+    today = now.date()
+    if is_trading_day(today) and now.time() >= MARKET_OPEN:
+        return today
+    return previous_trading_day(today)
+
+
+def recent_sessions(count, now=None):
+    """
+    최근 거래일 count개를 오래된 순으로 반환하는 함수
+
+    Args:
+        count (int): 거래일 수
+        now (datetime): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        list: date 목록
+    """
+    latest = latest_session_date(now)
+    sessions = [latest]
+    while len(sessions) < count:
+        sessions.append(previous_trading_day(sessions[-1]))
+    return sessions[::-1]
+
+
+def is_market_open(now=None):
+    """
+    현재 정규장(거래일 09:00 ~ 15:30) 시간인지 확인하는 함수
+
+    Args:
+        now (datetime): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        bool: 정규장 시간 여부
+    """
+    now = now or datetime.now()
+    return is_trading_day(now) and MARKET_OPEN <= now.time() <= MARKET_CLOSE
+
+
+def next_market_open(now=None):
+    """
+    다음 정규장 개장 시각을 구하는 함수 (장중이면 현재 시각)
+
+    Args:
+        now (datetime): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        datetime: 다음 개장 시각
+    """
+    now = now or datetime.now()
+    if is_market_open(now):
+        return now
+
+    day = now.date()
+    if not (is_trading_day(day) and now.time() < MARKET_OPEN):
+        day += timedelta(days=1)
+        while not is_trading_day(day):
+            day += timedelta(days=1)
+    return datetime.combine(day, MARKET_OPEN)
+
+
+def seconds_until_market_open(now=None):
+    """
+    다음 정규장 개장(09:00)까지 남은 시간을 구하는 함수
+
+    Args:
+        now (datetime): 기준 시각 (기본값: 현재 시각)
+
+    Returns:
+        float: 남은 시간 (초, 장중이면 0)
+    """
+    now = now or datetime.now()
+    return (next_market_open(now) - now).total_seconds()
@@ -0,0 +1,8 @@
+import os
+import sys
+import tempfile
+
+# 📌 설정 모듈이 읽기 전에 캐시/저장소를 임시 디렉터리로 돌림 (벤치마크와 같은 방식)
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_DIR, "stock_chatbot"))
+os.environ.setdefault("STOCK_CHATBOT_CACHE_DIR", tempfile.mkdtemp(prefix="stock_chatbot_test_"))
@@ -0,0 +1,77 @@
+import time
+import threading
+
+import pytest
+
+from cache import TTLCache
+
+
+def _run_concurrently(count, target, stagger=0.0):
+    """count개 스레드에서 target을 동시에 실행 (stagger초 간격으로 나눠 도착시킬 수 있음)"""
+    barrier = threading.Barrier(count)
+    results = [None] * count
+
+    def worker(i):
+        barrier.wait()
+        time.sleep(i * stagger)
+        results[i] = target()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+@pytest.mark.parametrize("threads", [2, 16, 64])
+def test_get_or_set_runs_loader_once(threads):
+    cache = TTLCache("test_single_flight")
+    calls = []
+
+    def loader():
+        calls.append(threading.get_ident())
+        time.sleep(0.05)
+        return "value"
+
+    results = _run_concurrently(threads, lambda: cache.get_or_set("key", loader, ttl=60))
+
+    assert len(calls) == 1
+    assert results == ["value"] * threads
+    assert cache._key_locks == {}
+
+
+def test_uncached_loads_never_overlap():
+    """캐시하지 않는 값도 같은 키의 loader가 동시에 실행되지 않음"""
+    cache = TTLCache("test_no_overlap")
+    lock = threading.Lock()
+    running = [0]
+    peak = [0]
+
+    def loader():
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return None
+
+    # 먼저 온 스레드의 loader가 끝나는 동안 새 스레드가 계속 도착하도록 간격을 둠
+    _run_concurrently(32, lambda: cache.get_or_set("key", loader, ttl=60, should_cache=lambda value: value is not None),
+                      stagger=0.002)
+
+    assert peak[0] == 1
+    assert cache._key_locks == {}
+
+
+def test_loader_error_releases_key_lock():
+    cache = TTLCache("test_loader_error")
+
+    def loader():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_set("key", loader, ttl=60)
+    assert cache._key_locks == {}
+    assert cache.get_or_set("key", lambda: 1, ttl=60) == 1
@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+from dedup import NewsDeduplicator, TitleIdf, title_tokens
+
+# 📌 같은 기업의 서로 다른 기사 (기업명과 흔한 단어만 겹침)
+_SAME_COMPANY_TITLES = [
+    "삼성전자 주가 3분기 실적 발표 앞두고 상승",
+    "삼성전자 주가 외국인 매도에 하락",
+    "삼성전자 노조 총파업 돌입 예고",
+    "삼성전자 신형 갤럭시 폴드 공개",
+    "삼성전자 HBM 엔비디아 품질 테스트 통과",
+    "삼성전자 주가 반도체 업황 회복 기대감",
+    "삼성전자 평택 공장 증설 투자 발표",
+    "삼성전자 주가 배당 확대 검토",
+]
+
+
+def _feed(deduplicator, titles):
+    return [title for i, title in enumerate(titles)
+            if not deduplicator.is_duplicate(title, f"https://news.example.com/{i}", f"본문 {i} {title}")]
+
+
+def test_same_company_different_stories_are_kept():
+    deduplicator = NewsDeduplicator()
+    assert _feed(deduplicator, _SAME_COMPANY_TITLES) == _SAME_COMPANY_TITLES
+
+
+def test_rewritten_title_is_merged():
+    deduplicator = NewsDeduplicator()
+    _feed(deduplicator, _SAME_COMPANY_TITLES)
+    assert deduplicator.is_duplicate("[속보] 삼성전자 노조, 총파업 돌입 예고", "https://other.example.com/1", "다른 본문")
+    assert deduplicator.is_duplicate("삼성전자, 신형 갤럭시 폴드 공개", "https://other.example.com/2", "또 다른 본문")
+
+
+def test_common_words_weigh_less_than_story_words():
+    idf = TitleIdf()
+    for title in _SAME_COMPANY_TITLES:
+        idf.add(title_tokens(title))
+    query = title_tokens("삼성전자 주가 급락")
+    assert idf.cosine(query, title_tokens("삼성전자 주가 외국인 매도에 하락")) < 0.5
+    assert idf.cosine(query, query) == pytest.approx(1.0)
+
+
+def test_defaults_use_lsh_banding():
+    deduplicator = NewsDeduplicator()
+    for index in (deduplicator.titles, deduplicator.contents):
+        assert not index.exhaustive
+        assert index.rows > 1
+
+
+def test_banding_skips_most_comparisons():
+    rng = random.Random(0)
+    vocabulary = [f"단어{i}" for i in range(2000)]
+    deduplicator = NewsDeduplicator()
+    comparisons = []
+    similarity = deduplicator.contents.similarity
+    deduplicator.contents.similarity = lambda a, b: comparisons.append(1) or similarity(a, b)
+
+    count = 300
+    for i in range(count):
+        content = " ".join(rng.sample(vocabulary, 40))
+        assert not deduplicator.is_duplicate(f"기사{i} 제목{i}", f"https://news.example.com/{i}", content)
+
+    assert len(comparisons) < count * (count - 1) / 2 * 0.1
+
+
+def test_exhaustive_mode_skips_signatures(monkeypatch):
+    deduplicator = NewsDeduplicator(title_threshold=0.1, content_threshold=0.05)
+    assert deduplicator.titles.exhaustive and deduplicator.contents.exhaustive
+    for index in (deduplicator.titles, deduplicator.contents):
+        monkeypatch.setattr(index, "signature", lambda tokens: pytest.fail("전체 비교 모드에서 서명 계산"))
+
+    _feed(deduplicator, _SAME_COMPANY_TITLES)
+    assert deduplicator.is_duplicate("삼성전자 노조 총파업", "https://other.example.com/1", "다른 본문")
@@ -0,0 +1,71 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+import price_store
+
+
+class _Market:
+    """현재 시각까지의 1분봉을 돌려주는 가짜 Fchart 조회 함수"""
+
+    def __init__(self):
+        self.now = None
+        self.requests = []
+
+    def fetch(self, ticker, count):
+        self.requests.append(count)
+        last = self.now.replace(second=0, microsecond=0) - timedelta(minutes=1)
+        times = [last - timedelta(minutes=count - 1 - i) for i in range(count)]
+        return pd.DataFrame({"시간": times, "종가": [t.hour * 100 + t.minute for t in times]})
+
+
+@pytest.fixture
+def market(monkeypatch, tmp_path):
+    market = _Market()
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return market.now
+
+    monkeypatch.setattr(price_store, "PRICE_STORE_DIR", str(tmp_path))
+    monkeypatch.setattr(price_store, "datetime", _Clock)
+    return market
+
+
+def _assert_contiguous(df):
+    steps = df["시간"].diff().dropna()
+    assert (steps == pd.Timedelta(minutes=1)).all(), df["시간"].tolist()
+
+
+def test_minute_bars_fetch_only_new_bars(market):
+    market.now = datetime(2026, 10, 15, 9, 30)
+    price_store.get_minute_bars("000001", 10, market.fetch)
+
+    market.now = datetime(2026, 10, 15, 9, 33)
+    df = price_store.get_minute_bars("000001", 10, market.fetch)
+
+    assert market.requests == [10, 8]  # 빠진 3개 + 여유분 5개
+    assert len(df) == 10
+    assert df["시간"].iloc[-1] == datetime(2026, 10, 15, 9, 32)
+    _assert_contiguous(df)
+
+
+def test_stale_minute_store_is_replaced(market):
+    market.now = datetime(2026, 10, 15, 9, 30)
+    price_store.get_minute_bars("000002", 10, market.fetch)
+
+    # 저장된 마지막 봉(09:29)이 count보다 오래됨 → 최근 10개만으로는 이어지지 않음
+    market.now = datetime(2026, 10, 15, 10, 30)
+    df = price_store.get_minute_bars("000002", 10, market.fetch)
+    assert df["시간"].iloc[0] == datetime(2026, 10, 15, 10, 20)
+    _assert_contiguous(df)
+
+    # 더 많은 봉을 요청하면 빈 구간 없이 다시 가져와야 함
+    df = price_store.get_minute_bars("000002", 15, market.fetch)
+    assert market.requests[-1] == 15
+    assert len(df) == 15
+    _assert_contiguous(df)
+    stored = price_store._load("000002", "minute")["bars"]
+    assert stored.index.min() == datetime(2026, 10, 15, 10, 15)